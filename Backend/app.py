@@ -1,27 +1,65 @@
 import os
-from flask import Flask, request, jsonify
+import json
+import time
+import threading
+from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from flask import Flask, Response, request, jsonify, stream_with_context, g, has_request_context
 from flask_cors import CORS
-from openai import OpenAI
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+from config.config import Config
+from services.rate_limiter import is_rate_limit_error
+from providers import get_provider
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for Chrome Extension
 
-# Configure Perplexity API (OpenAI-compatible)
-api_key = os.environ.get("PERPLEXITY_API_KEY")
-if not api_key:
-    # Fallback - user should set their Perplexity API key
-    api_key = "#############################"
-    print("WARNING: PERPLEXITY_API_KEY environment variable not set. Using placeholder.")
-
-# Initialize OpenAI client with Perplexity base URL
-client = OpenAI(
-    api_key=api_key,
-    base_url="https://api.perplexity.ai"
-)
+# Configure the summarization provider (see providers/ and Config.LLM_PROVIDER)
+rate_limits = {
+    'requests_per_minute': Config.LLM_REQUESTS_PER_MINUTE,
+    'tokens_per_minute': Config.LLM_TOKENS_PER_MINUTE,
+    'max_concurrency': Config.LLM_MAX_CONCURRENCY,
+    'target_latency': Config.LLM_TARGET_LATENCY_SECONDS,
+    'max_retries': Config.LLM_MAX_RETRIES,
+    'queue_timeout': Config.LLM_QUEUE_TIMEOUT_SECONDS,
+}
+
+if Config.LLM_PROVIDER.lower() == 'fake':
+    print(f"🎭 Using fake LLM provider (latency {Config.FAKE_LLM_LATENCY_SECONDS}s, "
+          f"error rate {Config.FAKE_LLM_ERROR_RATE})")
+    llm = get_provider(
+        'fake',
+        latency=Config.FAKE_LLM_LATENCY_SECONDS,
+        tokens_per_second=Config.FAKE_LLM_TOKENS_PER_SECOND,
+        error_rate=Config.FAKE_LLM_ERROR_RATE,
+        rate_limits=rate_limits
+    )
+elif Config.LLM_PROVIDER.lower() == 'gemini':
+    print(f"🤖 Using Gemini: {Config.GEMINI_MODEL}")
+    llm = get_provider(
+        'gemini',
+        api_key=Config.API_KEY,
+        model=Config.GEMINI_MODEL,
+        rate_limits=rate_limits
+    )
+else:
+    api_key = Config.PERPLEXITY_API_KEY
+    if not api_key:
+        # Fallback - user should set their Perplexity API key
+        api_key = "#############################"
+        print("WARNING: PERPLEXITY_API_KEY environment variable not set. Using placeholder.")
+    print(f"🤖 Using Perplexity: {Config.PERPLEXITY_MODEL}")
+    llm = get_provider(
+        'perplexity',
+        api_key=api_key,
+        model=Config.PERPLEXITY_MODEL,
+        base_url=Config.LLM_BASE_URL or 'https://api.perplexity.ai',
+        rate_limits=rate_limits
+    )
 
 
 # System instruction for the AI
@@ -86,34 +124,36 @@ Use this EXACT format:
 Write like you're WARNING A FRIEND, not writing a legal document.
 """
 
-def get_working_response(text_content):
-    """Generate summary using Perplexity API"""
-    try:
-        print(f"Generating summary with Perplexity...")
-        
-        # Use Perplexity's sonar model via OpenAI-compatible API
-        response = client.chat.completions.create(
-            model='sonar',  # Perplexity's sonar model
-            messages=[
-                {"role": "system", "content": SYSTEM_INSTRUCTION},
-                {"role": "user", "content": text_content}
-            ],
-            temperature=0.3,
-            max_tokens=8192,
-        )
-        
-        return response.choices[0].message.content
-        
-    except Exception as e:
-        error_msg = str(e)
-        print(f"Error generating content: {e}")
-        
-        # Check if it's a quota error
-        if "429" in error_msg or "rate" in error_msg.lower():
-            print("⚠️ API quota exceeded. Please wait or try again later.")
-            return """# API Quota Exceeded
+# Generation settings
+SUMMARY_TEMPERATURE = 0.3
+FULL_SUMMARY_MAX_TOKENS = 8192
+SHORT_SUMMARY_MAX_TOKENS = 200
+SHORT_SUMMARY_INPUT_CHARS = 5000
+CHUNK_NOTES_MAX_TOKENS = 1024
+
+SHORT_SUMMARY_PROMPT = """Summarize this privacy policy in EXACTLY 50 words or less. 
+Focus on the most critical privacy concerns. Use emojis: 🚫 for critical issues, ⚠️ for concerns.
+
+Policy text:
+{policy_text}  
+
+Provide ONLY the summary, nothing else."""
+
+# Map step for long documents (see services/chunked_summarizer.py)
+CHUNK_NOTES_INSTRUCTION = """You are reviewing ONE PART of a longer privacy policy or terms of service.
+
+List every point in this part that affects users' privacy or rights, grouped under these headings:
+CRITICAL, CONCERNING, GOOD, STANDARD
 
-Unfortunately, the Perplexity API quota has been exceeded. 
+Write each point as one short plain-English sentence. Leave out headings with no points.
+If this part contains nothing relevant, reply with NONE."""
+
+CHUNKED_INPUT_HEADER = "Notes extracted from each part of a long policy document:\n\n"
+
+# Placeholders returned when generation fails (never cached)
+QUOTA_EXCEEDED_SUMMARY = """# API Quota Exceeded
+
+Unfortunately, the LLM API quota has been exceeded. 
 
 ## What this means:
 - The API has rate limits
@@ -129,26 +169,10 @@ https://www.perplexity.ai/settings/api
 For now, you can:
 - Wait a minute and try again
 - Use a different API key
-- Upgrade your Perplexity API plan
+- Upgrade your LLM API plan
 """
-        
-        # Try with a simpler request as fallback
-        try:
-            print("Trying fallback with shorter content...")
-            response = client.chat.completions.create(
-                model='sonar',
-                messages=[
-                    {"role": "system", "content": SYSTEM_INSTRUCTION},
-                    {"role": "user", "content": text_content[:10000]}  # Limit text size
-                ],
-                temperature=0.3,
-                max_tokens=2000,
-            )
-            return response.choices[0].message.content
-        except Exception as e2:
-            print(f"Fallback also failed: {e2}")
-            # Return a helpful error message instead of crashing
-            return """# Summary Generation Failed
+
+SUMMARY_FAILED_SUMMARY = """# Summary Generation Failed
 
 Unable to generate AI summary at this time.
 
@@ -166,44 +190,143 @@ Unable to generate AI summary at this time.
 Visit: https://www.perplexity.ai/settings/api to check your API usage
 """
 
+SHORT_QUOTA_EXCEEDED = "⚠️ API quota exceeded. Please wait 1 minute and try again."
+SHORT_SUMMARY_FAILED = "⚠️ Unable to generate summary. Please try again later."
 
-def generate_short_summary(text_content):
-    """Generate 50-word summary for extension"""
+ERROR_SUMMARIES = {
+    QUOTA_EXCEEDED_SUMMARY,
+    SUMMARY_FAILED_SUMMARY,
+    SHORT_QUOTA_EXCEEDED,
+    SHORT_SUMMARY_FAILED,
+}
+
+
+def is_error_summary(text):
+    """True if text is one of the failure placeholders above"""
+    return text in ERROR_SUMMARIES
+
+
+def generate_chunk_notes(chunk):
+    """Map step: extract key points from one chunk of a long policy"""
+    notes = llm.complete(
+        [
+            {"role": "system", "content": CHUNK_NOTES_INSTRUCTION},
+            {"role": "user", "content": chunk}
+        ],
+        temperature=SUMMARY_TEMPERATURE,
+        max_tokens=CHUNK_NOTES_MAX_TOKENS,
+    ).strip()
+    return "" if notes.upper() == "NONE" else notes
+
+
+def prepare_summary_input(text_content, max_chars):
+    """
+    Return text_content as-is if it fits in max_chars, otherwise condense it
+    chunk by chunk so the whole document is covered instead of truncated
+    """
+    if len(text_content) <= max_chars:
+        return text_content
+    print(f"✂️  Long input ({len(text_content)} chars) - summarizing in chunks...")
+    return CHUNKED_INPUT_HEADER + chunked_summarizer.condense(text_content, max_chars)
+
+
+def get_working_response(text_content):
+    """Generate summary using the configured LLM provider"""
     try:
-        print("Generating 50-word summary...")
+        print(f"Generating summary with {llm.name}...")
+        text_content = prepare_summary_input(text_content, Config.CHUNK_THRESHOLD_CHARS)
         
-        short_prompt = f"""Summarize this privacy policy in EXACTLY 50 words or less. 
-Focus on the most critical privacy concerns. Use emojis: 🚫 for critical issues, ⚠️ for concerns.
+        return llm.complete(
+            [
+                {"role": "system", "content": SYSTEM_INSTRUCTION},
+                {"role": "user", "content": text_content}
+            ],
+            temperature=SUMMARY_TEMPERATURE,
+            max_tokens=FULL_SUMMARY_MAX_TOKENS,
+        )
+        
+    except Exception as e:
+        print(f"Error generating content: {e}")
+        
+        # Still rate limited after the client's retries - don't retry again here
+        if is_rate_limit_error(e):
+            print("⚠️ API quota exceeded. Please wait or try again later.")
+            return QUOTA_EXCEEDED_SUMMARY
+        
+        # Try with a simpler request as fallback
+        try:
+            print("Trying fallback with shorter content...")
+            return llm.complete(
+                [
+                    {"role": "system", "content": SYSTEM_INSTRUCTION},
+                    {"role": "user", "content": text_content[:10000]}  # Limit text size
+                ],
+                temperature=SUMMARY_TEMPERATURE,
+                max_tokens=2000,
+            )
+        except Exception as e2:
+            print(f"Fallback also failed: {e2}")
+            # Return a helpful error message instead of crashing
+            return SUMMARY_FAILED_SUMMARY
 
-Policy text:
-{text_content[:5000]}  
 
-Provide ONLY the summary, nothing else."""
+def stream_working_response(text_content):
+    """
+    Stream the full summary from the LLM provider token by token
+    
+    Yields text deltas as they arrive; raises on API errors so the caller
+    can report them instead of persisting a placeholder.
+    """
+    print(f"Streaming summary with {llm.name}...")
+    text_content = prepare_summary_input(text_content, Config.CHUNK_THRESHOLD_CHARS)
+    
+    yield from llm.stream(
+        [
+            {"role": "system", "content": SYSTEM_INSTRUCTION},
+            {"role": "user", "content": text_content}
+        ],
+        temperature=SUMMARY_TEMPERATURE,
+        max_tokens=FULL_SUMMARY_MAX_TOKENS,
+    )
 
-        response = client.chat.completions.create(
-            model='sonar',  # Perplexity's sonar model
-            messages=[
+
+def generate_short_summary(text_content):
+    """Generate 50-word summary for extension"""
+    try:
+        print("Generating 50-word summary...")
+        
+        # Long policies are condensed (sharing chunk notes with the full summary)
+        # rather than cut off after the first few thousand characters
+        policy_text = text_content
+        if len(text_content) > Config.CHUNK_THRESHOLD_CHARS:
+            policy_text = prepare_summary_input(text_content, SHORT_SUMMARY_INPUT_CHARS)
+        short_prompt = SHORT_SUMMARY_PROMPT.format(policy_text=policy_text[:SHORT_SUMMARY_INPUT_CHARS])
+
+        return llm.complete(
+            [
                 {"role": "user", "content": short_prompt}
             ],
-            temperature=0.3,
-            max_tokens=200,
-        )
-        
-        return response.choices[0].message.content.strip()
+            temperature=SUMMARY_TEMPERATURE,
+            max_tokens=SHORT_SUMMARY_MAX_TOKENS,
+        ).strip()
     except Exception as e:
-        error_msg = str(e)
         print(f"Error generating short summary: {e}")
         
         # Return helpful error message
-        if "429" in error_msg or "rate" in error_msg.lower():
-            return "⚠️ API quota exceeded. Please wait 1 minute and try again."
+        if is_rate_limit_error(e):
+            return SHORT_QUOTA_EXCEEDED
         else:
-            return "⚠️ Unable to generate summary. Please try again later."
+            return SHORT_SUMMARY_FAILED
 
 # Import policy fetcher and database system
-from policy_fetcher_safe import fetch_policy_for_url
-from database import get_database
-from config.config import Config
+from policy_fetcher_safe import fetch_policy_for_url, get_fetcher_stats
+from database import get_database, CachedDatabase, ExpirySweeper
+from services.summary_cache import SummaryCache
+from services.single_flight import SingleFlight
+from services.job_queue import JobQueue
+from services.metrics import LatencyStats, EndpointStats, StatsHistory
+from services.chunked_summarizer import ChunkedSummarizer
+from services.text_condenser import TextCondenser
 
 # Initialize database based on configuration
 if Config.DB_TYPE.lower() == 'dynamodb':
@@ -213,14 +336,530 @@ if Config.DB_TYPE.lower() == 'dynamodb':
         table_name=Config.DYNAMODB_TABLE_NAME,
         region_name=Config.DYNAMODB_REGION,
         aws_access_key_id=Config.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=Config.AWS_SECRET_ACCESS_KEY
+        aws_secret_access_key=Config.AWS_SECRET_ACCESS_KEY,
+        legacy_url_lookup=Config.DYNAMODB_LEGACY_URL_LOOKUP,
+        ttl_days=Config.CACHE_EXPIRY_DAYS
+    )
+elif Config.DB_TYPE.lower() == 'sqlite':
+    print(f"🗄️  Using SQLite Database: {Config.SQLITE_DB_FILE}")
+    db = get_database(
+        'sqlite',
+        db_file=Config.SQLITE_DB_FILE,
+        busy_timeout_ms=Config.SQLITE_BUSY_TIMEOUT_MS,
+        synchronous=Config.SQLITE_SYNCHRONOUS,
+        ttl_days=Config.CACHE_EXPIRY_DAYS
     )
 else:
     print(f"🗄️  Using JSON Database: {Config.JSON_DB_FILE}")
-    db = get_database('json', storage_file=Config.JSON_DB_FILE)
+    db = get_database(
+        'json',
+        storage_file=Config.JSON_DB_FILE,
+        journal=Config.JSON_DB_JOURNAL,
+        compact_ratio=Config.JSON_DB_COMPACT_RATIO,
+        compact_min_kb=Config.JSON_DB_COMPACT_MIN_KB,
+        fsync=Config.JSON_DB_FSYNC,
+        ttl_days=Config.CACHE_EXPIRY_DAYS
+    )
+
+if Config.HOT_CACHE_ENABLED:
+    db = CachedDatabase(
+        db,
+        max_entries=Config.HOT_CACHE_MAX_ENTRIES,
+        ttl_seconds=Config.HOT_CACHE_TTL_SECONDS,
+        broadcast_file=Config.HOT_CACHE_BROADCAST_FILE if Config.HOT_CACHE_BROADCAST else None
+    )
 
 print(f"💾 Cache enabled: {Config.CACHE_ENABLED}")
 
+# Deletes expired summaries in the background (DynamoDB: keeps the summary count in step with TTL)
+expiry_sweeper = ExpirySweeper(db, interval_seconds=Config.EXPIRY_SWEEP_INTERVAL_SECONDS)
+if Config.EXPIRY_SWEEP_ENABLED:
+    expiry_sweeper.start()
+
+summary_cache = SummaryCache(Config.SUMMARY_CACHE_FILE, max_entries=Config.SUMMARY_CACHE_MAX_ENTRIES)
+
+# Long inputs are condensed chunk by chunk before summarization
+chunked_summarizer = ChunkedSummarizer(
+    generate_chunk_notes,
+    max_chars=Config.CHUNK_MAX_CHARS,
+    max_workers=Config.CHUNK_WORKERS
+)
+
+# Boilerplate and repeated paragraphs are stripped before summarization
+text_condenser = TextCondenser(
+    shingle_words=Config.CONDENSE_SHINGLE_WORDS,
+    similarity=Config.CONDENSE_SIMILARITY
+)
+
+
+def summary_cache_key(kind, text_content):
+    """Cache key for a 'short' or 'full' summary of text_content"""
+    if kind == 'short':
+        params = {'prompt': SHORT_SUMMARY_PROMPT, 'max_tokens': SHORT_SUMMARY_MAX_TOKENS}
+    else:
+        params = {'prompt': SYSTEM_INSTRUCTION, 'max_tokens': FULL_SUMMARY_MAX_TOKENS}
+    return summary_cache.make_key(text_content, kind=kind, provider=llm.name, model=llm.model,
+                                  temperature=SUMMARY_TEMPERATURE, **params)
+
+
+def cached_summary_call(kind, text_content, generate):
+    """
+    Return the LLM output for text_content, reusing a previous result when
+    the normalized text and generation settings are unchanged
+    """
+    if not Config.SUMMARY_CACHE_ENABLED:
+        return generate(text_content)
+
+    key = summary_cache_key(kind, text_content)
+    cached = summary_cache.get(key)
+    if cached is not None:
+        print(f"♻️  Reusing {kind} summary for identical policy text")
+        return cached
+
+    result = generate(text_content)
+    if not is_error_summary(result):
+        summary_cache.put(key, result)
+    return result
+
+
+# Background LLM work: the short summary is returned as soon as it is ready
+# while the full summary finishes here and is persisted for /summary/<id>
+summary_executor = ThreadPoolExecutor(max_workers=Config.SUMMARY_WORKERS, thread_name_prefix='summary')
+pending_full_summaries = {}  # summary_id -> Future resolved once the full summary is saved
+pending_lock = threading.Lock()
+
+
+def persist_full_summary_when_ready(summary_id, full_future, url, short_summary, policy_types,
+                                    created=True):
+    """
+    Save the full summary once its background generation completes
+
+    If generation fails, the entry is removed only when this request
+    created it (created=True); an entry that existed before is left as is.
+    """
+    persisted = Future()
+    with pending_lock:
+        pending_full_summaries[summary_id] = persisted
+
+    def on_done(future):
+        try:
+            full_summary = future.result()
+            if is_error_summary(full_summary):
+                # Never persist a failure placeholder; drop a partial entry
+                # this request created so the next request regenerates it
+                if created:
+                    db.delete_summary(summary_id)
+                    print(f"❌ Full summary failed for ID: {summary_id} - entry removed")
+                else:
+                    print(f"❌ Full summary failed for ID: {summary_id} - previous entry kept")
+                return
+            db.save_summary(
+                url=url,
+                short_summary=short_summary,
+                full_summary=full_summary,
+                policy_types=policy_types
+            )
+            print(f"💾 Full summary saved for ID: {summary_id}")
+        except Exception as e:
+            print(f"❌ Error saving full summary for {summary_id}: {e}")
+        finally:
+            with pending_lock:
+                pending_full_summaries.pop(summary_id, None)
+            persisted.set_result(summary_id)
+
+    full_future.add_done_callback(on_done)
+
+
+def is_full_summary_pending(summary):
+    """
+    True while the full summary for a saved entry is still being generated,
+    either by this process or (within the grace period) by another worker
+    """
+    if summary.get('full_summary'):
+        return False
+    with pending_lock:
+        if summary['id'] in pending_full_summaries:
+            return True
+    try:
+        age = (datetime.now() - datetime.fromisoformat(summary.get('timestamp', ''))).total_seconds()
+    except (ValueError, TypeError):
+        return False
+    return age < Config.FULL_SUMMARY_GRACE_SECONDS
+
+
+# Concurrent misses for the same normalized URL share one fetch+summarize job
+request_coalescer = SingleFlight(Config.COALESCE_LOCK_DIR if Config.COALESCE_ACROSS_PROCESSES else None)
+
+
+def lookup_cached_summary(url):
+    """Cached summary for url, or None if missing, expired or incomplete"""
+    cached_summary = db.get_summary_by_url(url, expiry_days=Config.CACHE_EXPIRY_DAYS)
+    
+    # Failure placeholders saved by older versions are not real summaries
+    if cached_summary and (is_error_summary(cached_summary.get('short_summary'))
+                           or is_error_summary(cached_summary.get('full_summary'))):
+        cached_summary = None
+    
+    # An entry without a full summary whose generation is no longer running
+    # (e.g. the server restarted mid-way) is incomplete - regenerate it
+    if cached_summary and not cached_summary.get('full_summary') \
+            and not is_full_summary_pending(cached_summary):
+        cached_summary = None
+    
+    if has_request_context():
+        g.cache_hit = cached_summary is not None  # counted per endpoint in record_request_stats
+    return cached_summary
+
+
+def cached_summary_response(cached_summary):
+    return {
+        "id": cached_summary['id'],
+        "short_summary": cached_summary['short_summary'],
+        "url": cached_summary['url'],
+        "policy_types": cached_summary.get('policy_types', []),
+        "status": "success",
+        "cached": True,
+        "cached_at": cached_summary.get('created_at', 'N/A')
+    }, 200
+
+
+def condense_input(documents):
+    """
+    Join (header, text) documents into one LLM input, dropping boilerplate
+    and paragraphs repeated across documents when condensing is enabled
+    
+    Returns:
+        (text, token savings dict or None)
+    """
+    if not Config.CONDENSE_ENABLED:
+        text = "".join(f"\n\n{header}\n\n{body}" if header else body for header, body in documents)
+        return text, None
+    text, report = text_condenser.condense(documents)
+    print(f"🧹 Condensed input: {report.original_tokens} → {report.condensed_tokens} tokens "
+          f"(saved {report.saved_tokens}, {report.boilerplate_blocks} boilerplate / "
+          f"{report.duplicate_blocks} repeated blocks)")
+    return text, report.to_dict()
+
+
+def combine_policies(policy_data):
+    """Combine all found policies into one text for summarization"""
+    return condense_input([
+        (f"=== {policy_type.upper()} POLICY ===", policy_data['policies'][policy_type])
+        for policy_type in policy_data['found_types']
+    ])
+
+
+def run_fetch_and_summarize(url):
+    """
+    Fetch policies for url and generate summaries
+    
+    Returns:
+        (response body, HTTP status) tuple, shared by coalesced requests
+    """
+    print(f"🌐 Fetching policies for: {url}")
+    
+    # Fetch policies
+    policy_data = fetch_policy_for_url(url)
+    
+    if not policy_data['found_types']:
+        return {
+            "error": "No policies found",
+            "message": f"Could not find privacy policy, terms, or cookies policy for {url}"
+        }, 404
+    
+    combined_text, input_tokens = combine_policies(policy_data)
+    
+    print(f"✅ Found {len(policy_data['found_types'])} policies")
+    print(f"📝 Generating summaries...")
+    
+    # Generate both summaries concurrently
+    full_future = summary_executor.submit(cached_summary_call, 'full', combined_text, get_working_response)
+    short_summary = cached_summary_call('short', combined_text, generate_short_summary)
+    
+    if is_error_summary(short_summary):
+        # Nothing is saved; the full summary still finishes in the background
+        # and lands in the summary cache if it succeeds
+        return {
+            "error": "Summary generation failed",
+            "message": short_summary
+        }, 503
+    
+    # Store the short summary now; the full summary is saved in the
+    # background once it is ready. A complete entry from an earlier run
+    # (force_refresh) keeps serving until the new one replaces it.
+    previous = db.get_summary_by_url(policy_data['url'])
+    if previous and previous.get('full_summary') and not is_error_summary(previous['full_summary']):
+        summary_id = previous['id']
+    else:
+        summary_id = db.save_summary(
+            url=policy_data['url'],
+            short_summary=short_summary,
+            full_summary='',
+            policy_types=policy_data['found_types']
+        )
+    persist_full_summary_when_ready(
+        summary_id, full_future, policy_data['url'], short_summary, policy_data['found_types'],
+        created=previous is None
+    )
+    
+    print(f"💾 Saved with ID: {summary_id} (full summary pending)")
+    
+    return {
+        "id": summary_id,
+        "short_summary": short_summary,
+        "url": policy_data['url'],
+        "policy_types": policy_data['found_types'],
+        "input_tokens": input_tokens,
+        "status": "success",
+        "cached": False
+    }, 200
+
+
+def summarize_uncached(url, use_cache):
+    """
+    Fetch and summarize url, sharing the work with any concurrent
+    request for the same normalized URL
+    """
+    def recheck():
+        cached_summary = lookup_cached_summary(url) if use_cache else None
+        return cached_summary_response(cached_summary) if cached_summary else None
+    
+    return request_coalescer.do(
+        db.normalize_url(url),
+        lambda: run_fetch_and_summarize(url),
+        recheck=recheck
+    )
+
+
+def fetch_and_summarize_job(payload):
+    """Job queue handler for /fetch-and-summarize in async mode"""
+    url = payload['url']
+    use_cache = Config.CACHE_ENABLED and not payload.get('force_refresh', False)
+    
+    # Another job may have filled the cache while this one was queued
+    cached_summary = lookup_cached_summary(url) if use_cache else None
+    if cached_summary:
+        body, status = cached_summary_response(cached_summary)
+    else:
+        body, status = summarize_uncached(url, use_cache)
+    return {"http_status": status, "response": body}
+
+
+job_queue = JobQueue(
+    fetch_and_summarize_job,
+    directory=Config.JOBS_DIR,
+    workers=Config.JOB_WORKERS,
+    retention_hours=Config.JOB_RETENTION_HOURS,
+    lease_seconds=Config.JOB_LEASE_SECONDS
+)
+
+
+# Per-endpoint request counters, and their periodic snapshots
+endpoint_stats = EndpointStats()
+
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def record_request_stats(response):
+    """Count the request for its endpoint (streamed responses: time until the stream starts)"""
+    started = g.get('request_started')
+    if request.endpoint and started is not None:
+        ms = (time.perf_counter() - started) * 1000
+        endpoint_stats.record(request.endpoint, response.status_code, ms, g.get('cache_hit'))
+    return response
+
+
+def stats_snapshot():
+    """What StatsHistory stores: summary count and per-endpoint counters for the last interval"""
+    return {
+        'total_summaries': db.get_cache_stats().get('total_summaries'),
+        'endpoints': endpoint_stats.take_interval()
+    }
+
+
+stats_history = StatsHistory(
+    Config.STATS_HISTORY_FILE,
+    stats_snapshot,
+    interval_seconds=Config.STATS_SNAPSHOT_INTERVAL_SECONDS,
+    max_kb=Config.STATS_HISTORY_MAX_KB
+)
+if Config.STATS_HISTORY_ENABLED:
+    stats_history.start()
+
+
+# Streaming (Server-Sent Events)
+time_to_first_token = LatencyStats()
+
+
+def sse_event(event, data):
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def sse_response(events):
+    return Response(
+        stream_with_context(events),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+def stream_full_summary(text_content, on_token=None):
+    """
+    Yield SSE token events for the full summary of text_content and return
+    the accumulated text (None if generation failed)
+    
+    Identical text already in the summary cache is sent as a single token.
+    on_token is polled between tokens so callers can interleave their own events.
+    """
+    key = summary_cache_key('full', text_content) if Config.SUMMARY_CACHE_ENABLED else None
+    cached = summary_cache.get(key) if key else None
+    if cached is not None:
+        yield sse_event('token', {'text': cached})
+        return cached
+
+    parts = []
+    started = time.monotonic()
+    try:
+        for delta in stream_working_response(text_content):
+            if not parts:
+                ttft_ms = (time.monotonic() - started) * 1000
+                time_to_first_token.record(ttft_ms)
+                print(f"⚡ First token after {ttft_ms:.0f} ms")
+            parts.append(delta)
+            yield sse_event('token', {'text': delta})
+            if on_token:
+                yield from on_token()
+    except Exception as e:
+        print(f"Error streaming summary: {e}")
+        yield sse_event('error', {'error': str(e)})
+        return None
+
+    full_summary = ''.join(parts)
+    if key and full_summary:
+        summary_cache.put(key, full_summary)
+    return full_summary
+
+
+@app.route('/summarize/stream', methods=['POST'])
+def summarize_stream():
+    """
+    Streaming variant of /summarize
+    
+    Emits `token` events ({"text": "..."}) as the summary is generated,
+    then a `done` event ({"summary": "..."}) with the complete text.
+    """
+    data = request.get_json()
+    if not data or 'text' not in data:
+        return jsonify({"error": "No text provided"}), 400
+
+    text_content = data['text']
+    if len(text_content) > 1000000: # 1MB text limit for safety
+        return jsonify({"error": "Text content too large (max 1MB)"}), 413
+
+    text_content, _ = condense_input([('', text_content)])
+
+    def events():
+        summary_text = yield from stream_full_summary(text_content)
+        if summary_text is not None:
+            yield sse_event('done', {'summary': summary_text})
+
+    return sse_response(events())
+
+
+@app.route('/fetch-and-summarize/stream', methods=['POST'])
+def fetch_and_summarize_stream():
+    """
+    Streaming variant of /fetch-and-summarize for the full summary
+    
+    Events:
+    - meta: {"url", "policy_types", "input_tokens", "cached"} once policies are fetched
+    - short_summary: {"short_summary"} as soon as it is ready
+    - token: {"text"} full summary deltas
+    - done: {"id", "url", "policy_types"} after the summary is saved
+    - error: {"error"} if fetching or generation fails (nothing is saved)
+    
+    Request body is the same as /fetch-and-summarize (async is ignored).
+    """
+    data = request.get_json()
+    if not data or 'url' not in data:
+        return jsonify({"error": "No URL provided"}), 400
+
+    url = data['url']
+    use_cache = Config.CACHE_ENABLED and not data.get('force_refresh', False)
+
+    def events():
+        cached_summary = lookup_cached_summary(url) if use_cache else None
+        if cached_summary and cached_summary.get('full_summary'):
+            yield sse_event('meta', {'url': cached_summary['url'],
+                                     'policy_types': cached_summary.get('policy_types', []),
+                                     'cached': True})
+            yield sse_event('short_summary', {'short_summary': cached_summary['short_summary']})
+            yield sse_event('token', {'text': cached_summary['full_summary']})
+            yield sse_event('done', {'id': cached_summary['id'], 'url': cached_summary['url'],
+                                     'policy_types': cached_summary.get('policy_types', [])})
+            return
+
+        print(f"🌐 Fetching policies for: {url} (streaming)")
+        policy_data = fetch_policy_for_url(url)
+        if not policy_data['found_types']:
+            yield sse_event('error', {
+                'error': 'No policies found',
+                'message': f"Could not find privacy policy, terms, or cookies policy for {url}"
+            })
+            return
+
+        combined_text, input_tokens = combine_policies(policy_data)
+        yield sse_event('meta', {'url': policy_data['url'],
+                                 'policy_types': policy_data['found_types'],
+                                 'input_tokens': input_tokens,
+                                 'cached': False})
+
+        short_future = summary_executor.submit(cached_summary_call, 'short', combined_text, generate_short_summary)
+        short_sent = []
+
+        def send_short_summary_when_ready():
+            if not short_sent and short_future.done():
+                short_sent.append(True)
+                yield sse_event('short_summary', {'short_summary': short_future.result()})
+
+        full_summary = yield from stream_full_summary(combined_text, on_token=send_short_summary_when_ready)
+        if full_summary is None:
+            return
+
+        short_summary = short_future.result()
+        if is_error_summary(short_summary):
+            yield sse_event('error', {'error': 'Summary generation failed', 'message': short_summary})
+            return
+        if not short_sent:
+            yield sse_event('short_summary', {'short_summary': short_summary})
+
+        summary_id = db.save_summary(
+            url=policy_data['url'],
+            short_summary=short_summary,
+            full_summary=full_summary,
+            policy_types=policy_data['found_types']
+        )
+        print(f"💾 Saved streamed summary with ID: {summary_id}")
+        yield sse_event('done', {'id': summary_id, 'url': policy_data['url'],
+                                 'policy_types': policy_data['found_types']})
+
+    return sse_response(events())
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Latency metrics (time to first streamed token), LLM rate limiter state and input token savings"""
+    return jsonify({
+        'time_to_first_token': time_to_first_token.snapshot(),
+        'llm': llm.stats(),
+        'condensing': text_condenser.stats()
+    })
+
 
 @app.route('/summarize', methods=['POST'])
 def summarize():
@@ -235,8 +874,9 @@ def summarize():
         if len(text_content) > 1000000: # 1MB text limit for safety
              return jsonify({"error": "Text content too large (max 1MB)"}), 413
 
-        summary_text = get_working_response(text_content)
-        return jsonify({"summary": summary_text})
+        text_content, input_tokens = condense_input([('', text_content)])
+        summary_text = cached_summary_call('full', text_content, get_working_response)
+        return jsonify({"summary": summary_text, "input_tokens": input_tokens})
 
     except Exception as e:
         print(f"Error: {e}")
@@ -251,6 +891,8 @@ def fetch_and_summarize():
     Request body can include:
     - url: The URL to fetch and summarize (required)
     - force_refresh: If true, bypass cache and fetch fresh data (optional, default: false)
+    - async: If true, queue the work on a cache miss and return a job id
+             to poll at /jobs/<job_id> (optional, default: ASYNC_JOBS_DEFAULT)
     """
     try:
         data = request.get_json()
@@ -259,74 +901,38 @@ def fetch_and_summarize():
 
         url = data['url']
         force_refresh = data.get('force_refresh', False)
+        async_mode = data.get('async', Config.ASYNC_JOBS_DEFAULT)
         
         print(f"\n📥 Request for: {url}")
         if force_refresh:
             print(f"🔄 Force refresh requested - bypassing cache")
         
         # Check cache first if enabled and not forcing refresh
-        if Config.CACHE_ENABLED and not force_refresh:
-            cached_summary = db.get_summary_by_url(url, expiry_days=Config.CACHE_EXPIRY_DAYS)
+        use_cache = Config.CACHE_ENABLED and not force_refresh
+        if use_cache:
+            cached_summary = lookup_cached_summary(url)
             
             if cached_summary:
                 print(f"✨ CACHE HIT! Returning cached summary for: {url}")
                 print(f"💰 Tokens saved by using cache!")
                 
-                return jsonify({
-                    "id": cached_summary['id'],
-                    "short_summary": cached_summary['short_summary'],
-                    "url": cached_summary['url'],
-                    "policy_types": cached_summary.get('policy_types', []),
-                    "status": "success",
-                    "cached": True,
-                    "cached_at": cached_summary.get('created_at', 'N/A')
-                })
+                body, status = cached_summary_response(cached_summary)
+                return jsonify(body), status
             else:
                 print(f"🔍 Cache miss - will fetch and summarize")
         
-        # Not in cache or force refresh - proceed with fetching and summarizing
-        print(f"🌐 Fetching policies for: {url}")
-        
-        # Fetch policies
-        policy_data = fetch_policy_for_url(url)
-        
-        if not policy_data['found_types']:
+        # Not in cache or force refresh - queue it, or fetch and summarize now
+        if async_mode:
+            job_id = job_queue.submit({'url': url, 'force_refresh': force_refresh})
+            print(f"📦 Queued job {job_id} for: {url}")
             return jsonify({
-                "error": "No policies found",
-                "message": f"Could not find privacy policy, terms, or cookies policy for {url}"
-            }), 404
-        
-        # Combine all found policies
-        combined_text = ""
-        for policy_type in policy_data['found_types']:
-            combined_text += f"\n\n=== {policy_type.upper()} POLICY ===\n\n"
-            combined_text += policy_data['policies'][policy_type]
-        
-        print(f"✅ Found {len(policy_data['found_types'])} policies")
-        print(f"📝 Generating summaries...")
-        
-        # Generate both summaries
-        short_summary = generate_short_summary(combined_text)
-        full_summary = get_working_response(combined_text)
-        
-        # Store summaries (will update if URL already exists)
-        summary_id = db.save_summary(
-            url=policy_data['url'],
-            short_summary=short_summary,
-            full_summary=full_summary,
-            policy_types=policy_data['found_types']
-        )
-        
-        print(f"💾 Saved with ID: {summary_id}")
+                "job_id": job_id,
+                "status": "queued",
+                "status_url": f"/jobs/{job_id}"
+            }), 202
         
-        return jsonify({
-            "id": summary_id,
-            "short_summary": short_summary,
-            "url": policy_data['url'],
-            "policy_types": policy_data['found_types'],
-            "status": "success",
-            "cached": False
-        })
+        body, status = summarize_uncached(url, use_cache)
+        return jsonify(body), status
 
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -334,17 +940,57 @@ def fetch_and_summarize():
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
 
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """
+    Get status and result of a queued /fetch-and-summarize job
+    
+    Query parameters:
+    - wait: Seconds to wait for the job to finish (optional, default: 0, max: 60)
+    """
+    try:
+        wait = min(request.args.get('wait', 0, type=float), 60)
+        job = job_queue.wait(job_id, wait) if wait > 0 else job_queue.get(job_id)
+        
+        if not job:
+            return jsonify({"error": "Job not found"}), 404
+        
+        return jsonify(job)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 @app.route('/summary/<summary_id>', methods=['GET'])
 def get_summary(summary_id):
     """
     Retrieve full summary for frontend with structured sections
+    
+    Query parameters:
+    - wait: Seconds to wait for a full summary that is still being generated
+            (optional, default: 0, max: 60)
+    
+    Returns 202 with full_summary_status "pending" while generation is running
     """
     try:
+        wait = min(request.args.get('wait', 0, type=float), 60)
+        with pending_lock:
+            persisted = pending_full_summaries.get(summary_id)
+        if persisted is not None and wait > 0:
+            try:
+                persisted.result(timeout=wait)
+            except Exception:
+                pass
+        
         summary = db.get_summary_by_id(summary_id)
         
         if not summary:
             return jsonify({"error": "Summary not found"}), 404
         
+        if is_full_summary_pending(summary):
+            summary['full_summary_status'] = 'pending'
+            summary['sections'] = parse_summary_into_sections('')
+            return jsonify(summary), 202
+        summary['full_summary_status'] = 'ready'
+        
         # Parse the full_summary into structured sections
         full_text = summary.get('full_summary', '')
         sections = parse_summary_into_sections(full_text)
@@ -414,13 +1060,20 @@ def parse_summary_into_sections(summary_text):
     
     return sections
 
+RECENT_MAX_LIMIT = 100
+
+
 @app.route('/recent', methods=['GET'])
 def get_recent():
-    """Get recent summaries"""
+    """Get recent summaries, newest first (pass next_cursor back as ?cursor= for the next page)"""
     try:
-        limit = request.args.get('limit', 10, type=int)
-        recent = db.get_recent(limit=limit)
-        return jsonify({"summaries": recent})
+        limit = min(max(request.args.get('limit', 10, type=int), 1), RECENT_MAX_LIMIT)
+        cursor = request.args.get('cursor') or None
+        try:
+            recent, next_cursor = db.get_recent_page(limit=limit, cursor=cursor)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        return jsonify({"summaries": recent, "next_cursor": next_cursor})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -432,6 +1085,7 @@ def health():
         "service": "NakedPolicy API",
         "version": "1.0.0",
         "database": Config.DB_TYPE,
+        "llm_provider": Config.LLM_PROVIDER,
         "cache_enabled": Config.CACHE_ENABLED
     })
 
@@ -444,12 +1098,47 @@ def cache_stats():
             stats['cache_enabled'] = Config.CACHE_ENABLED
             stats['cache_expiry_days'] = Config.CACHE_EXPIRY_DAYS
             stats['db_type'] = Config.DB_TYPE
+            stats['summary_cache'] = summary_cache.stats()
+            stats['coalescing'] = request_coalescer.stats()
+            stats['jobs'] = job_queue.stats()
+            stats['endpoints'] = endpoint_stats.snapshot()
+            stats['expiry_sweeper'] = expiry_sweeper.stats()
             return jsonify(stats)
         else:
             return jsonify({"error": "Cache stats not available for this database type"}), 501
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+STATS_HISTORY_MAX_LIMIT = 1000
+
+
+@app.route('/cache/stats/history', methods=['GET'])
+def cache_stats_history():
+    """
+    Periodic stats snapshots, oldest first (one line per worker per interval)
+    
+    Query parameters:
+    - limit: Newest snapshots to return (optional, default: 100, max: 1000)
+    - since: Only snapshots after this ISO timestamp (optional)
+    """
+    try:
+        limit = min(max(request.args.get('limit', 100, type=int), 1), STATS_HISTORY_MAX_LIMIT)
+        return jsonify({
+            "enabled": Config.STATS_HISTORY_ENABLED,
+            "interval_seconds": Config.STATS_SNAPSHOT_INTERVAL_SECONDS,
+            "snapshots": stats_history.read(limit=limit, since=request.args.get('since') or None)
+        })
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/fetcher/stats', methods=['GET'])
+def fetcher_stats():
+    """Get policy fetcher statistics (browser pool usage etc.)"""
+    try:
+        return jsonify(get_fetcher_stats())
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 @app.route('/cache/clear', methods=['POST'])
 def cache_clear():
     """
@@ -574,9 +1263,15 @@ if __name__ == '__main__':
     print("  POST /fetch-and-summarize - Fetch and analyze policy")
     print("  POST /demo-summary        - Create demo summary (no API key needed)")
     print("  GET  /summary/<id>        - Get full summary")
+    print("  GET  /jobs/<id>           - Get queued job status/result")
     print("  POST /summarize           - Analyze uploaded text")
+    print("  POST /summarize/stream    - Analyze uploaded text (SSE stream)")
+    print("  POST /fetch-and-summarize/stream - Fetch and analyze (SSE stream)")
+    print("  GET  /metrics             - Latency metrics")
     print("  GET  /recent              - Get recent summaries")
     print("  GET  /health              - Health check")
     print("  GET  /cache/stats         - Cache statistics")
+    print("  GET  /cache/stats/history - Periodic stats snapshots")
     print("  POST /cache/clear         - Clear cache for specific URL")
+    print("  GET  /fetcher/stats       - Policy fetcher statistics")
     app.run(debug=True, port=5000)
\ No newline at end of file
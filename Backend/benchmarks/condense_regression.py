@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Regression check for input condensing (services/text_condenser.py)
+
+For every fixture in benchmarks/fixtures/condense/<name>/:
+- runs the fetched-page pipeline (clean_text, then TextCondenser)
+- checks that facts listed in expected.json survive and that chrome is dropped
+- reports input-token savings
+- summarizes the original and the condensed input with the configured
+  provider and checks that both parse into the four summary sections
+
+Usage (from Backend/):
+    python benchmarks/condense_regression.py              # fake provider, offline
+    LLM_PROVIDER=perplexity python benchmarks/condense_regression.py
+    python benchmarks/condense_regression.py --no-summaries
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("LLM_PROVIDER", "fake")
+os.environ.setdefault("FAKE_LLM_LATENCY_SECONDS", "0")
+# Importing app for the summary check must not touch the real database,
+# data/ or start background workers
+os.environ["DB_TYPE"] = "json"
+os.environ["SUMMARY_CACHE_ENABLED"] = "false"
+os.environ["HOT_CACHE_ENABLED"] = "false"
+os.environ["EXPIRY_SWEEP_ENABLED"] = "false"
+os.environ["STATS_HISTORY_ENABLED"] = "false"
+os.environ["JOB_WORKERS"] = "0"
+
+from services.text_condenser import TextCondenser
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "condense"
+SECTIONS = ("critical", "concerning", "good", "standard")
+
+
+def normalize(text):
+    return re.sub(r"\s+", " ", text).lower()
+
+
+def load_documents(fixture_dir, expected):
+    """(header, text) pairs as combine_policies builds them"""
+    documents = []
+    for name in expected["documents"]:
+        raw = (fixture_dir / name).read_text(encoding="utf-8")
+        if name.endswith(".html"):
+            from policy_fetcher_safe import clean_text
+            header = f"=== {Path(name).stem.upper()} POLICY ==="
+            documents.append((header, clean_text(raw)))
+        else:
+            documents.append(("", raw))
+    return documents
+
+
+def check_text(condensed, expected):
+    """Return a list of failure messages for the condensed text"""
+    failures = []
+    text = normalize(condensed)
+    for phrase in expected.get("must_keep", []):
+        if normalize(phrase) not in text:
+            failures.append(f"lost: {phrase!r}")
+    for phrase in expected.get("must_drop", []):
+        if normalize(phrase) in text:
+            failures.append(f"kept boilerplate: {phrase!r}")
+    for phrase, limit in expected.get("max_occurrences", {}).items():
+        count = text.count(normalize(phrase))
+        if count > limit:
+            failures.append(f"{phrase!r} appears {count} times (max {limit})")
+    return failures
+
+
+def import_isolated_app():
+    """Import app with every file and directory setting moved into a temp dir"""
+    from config.config import Config
+    scratch = tempfile.mkdtemp(prefix="condense-regression-")
+    for name, value in list(vars(Config).items()):
+        if isinstance(value, str) and Path(value).is_absolute() and Path(value).is_relative_to(BACKEND_DIR):
+            setattr(Config, name, os.path.join(scratch, os.path.relpath(value, BACKEND_DIR)))
+    import app
+    return app
+
+
+def check_summary(app, original, condensed):
+    """Summarize both inputs; return (failures, shared point ratio)"""
+    failures = []
+    points = {}
+    for label, text in (("original", original), ("condensed", condensed)):
+        summary = app.get_working_response(text)
+        if app.is_error_summary(summary):
+            failures.append(f"{label} summary failed")
+            continue
+        sections = app.parse_summary_into_sections(summary)
+        for key in SECTIONS:
+            if not sections[key]["header"] or not sections[key]["points"]:
+                failures.append(f"{label} summary missing section '{key}'")
+        points[label] = {p for key in SECTIONS for p in sections[key]["points"]}
+    if len(points) < 2 or not points["original"]:
+        return failures, None
+    shared = len(points["original"] & points["condensed"]) / len(points["original"])
+    return failures, shared
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--no-summaries", action="store_true", help="Only check condensed text (no LLM calls)")
+    parser.add_argument("fixtures", nargs="*", help="Fixture names (default: all)")
+    args = parser.parse_args()
+
+    app = None if args.no_summaries else import_isolated_app()
+
+    condenser = TextCondenser()
+    names = args.fixtures or sorted(p.name for p in FIXTURES_DIR.iterdir() if p.is_dir())
+    failed = 0
+
+    for name in names:
+        fixture_dir = FIXTURES_DIR / name
+        expected = json.loads((fixture_dir / "expected.json").read_text(encoding="utf-8"))
+        documents = load_documents(fixture_dir, expected)
+        original = "".join(f"\n\n{header}\n\n{body}" if header else body for header, body in documents)
+        condensed, report = condenser.condense(documents)
+        savings = report.to_dict()
+
+        failures = check_text(condensed, expected)
+        if savings["saved_percent"] < expected.get("min_saved_percent", 0):
+            failures.append(f"saved {savings['saved_percent']}% (expected >= {expected['min_saved_percent']}%)")
+
+        shared = None
+        if app is not None:
+            summary_failures, shared = check_summary(app, original, condensed)
+            failures.extend(summary_failures)
+
+        status = "FAIL" if failures else "ok"
+        line = (f"[{status}] {name}: {savings['original_tokens']} → {savings['condensed_tokens']} tokens "
+                f"(saved {savings['saved_percent']}%, {savings['boilerplate_blocks']} boilerplate / "
+                f"{savings['duplicate_blocks']} repeated blocks)")
+        if shared is not None:
+            line += f", {shared:.0%} of summary points unchanged"
+        print(line)
+        for failure in failures:
+            print(f"    - {failure}")
+        failed += bool(failures)
+
+    totals = condenser.stats()
+    print(f"\nTotal: {totals['original_tokens']} → {totals['condensed_tokens']} tokens "
+          f"(saved {totals['saved_percent']}%) across {totals['requests']} fixtures")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
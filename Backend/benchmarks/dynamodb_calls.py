@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+DynamoDB round trips per operation, against a moto in-memory table
+
+Counts the API calls DynamoDBAdapter makes for saves (new URL and
+update), lookups by URL and by id, with and without legacy_url_lookup,
+and for /cache/stats. Then checks that:
+- concurrent saves of one URL end up as a single item with a single id
+- migrate_to_url_keys moves items written with random keys, keeps their
+  ids working, and can be re-run
+- the maintained summary counter matches a full count afterwards
+- saving a URL again keeps its created_at and only moves updated_at
+
+Requires moto (pip install "moto[dynamodb]"); no AWS account is used.
+
+Usage (from Backend/):
+    python benchmarks/dynamodb_calls.py
+    python benchmarks/dynamodb_calls.py --threads 16 --saves 50
+"""
+
+import io
+import os
+import sys
+import time
+import uuid
+import argparse
+import threading
+from collections import Counter
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+try:
+    from moto import mock_aws
+except ImportError:
+    sys.exit('moto is not installed: pip install "moto[dynamodb]"')
+
+from database.dynamodb_adapter import DynamoDBAdapter, create_dynamodb_table, recent_bucket
+
+TABLE = 'naked-policy-summaries'
+REGION = 'us-east-1'
+
+
+class CallCounter:
+    """Counts DynamoDB API calls by operation name"""
+
+    def __init__(self, adapter):
+        self.calls = Counter()
+        adapter.table.meta.client.meta.events.register('before-call.dynamodb', self._count)
+
+    def _count(self, model, **kwargs):
+        self.calls[model.name] += 1
+
+    def measure(self, fn, *args):
+        self.calls.clear()
+        fn(*args)
+        return sum(self.calls.values()), dict(self.calls)
+
+
+def legacy_put(adapter, url, short_summary, timestamp=None):
+    """Write an item the way saves did before URL keys (random uuid4 key)"""
+    summary_id = str(uuid.uuid4())
+    timestamp = timestamp or datetime.now().isoformat()
+    adapter.table.put_item(Item={
+        'summary_id': summary_id, 'id': summary_id, 'url': url,
+        'normalized_url': adapter.normalize_url(url), 'url_hash': adapter.generate_url_hash(url),
+        'short_summary': short_summary, 'full_summary': 'full', 'policy_types': [],
+        'timestamp': timestamp, 'recent_bucket': recent_bucket(timestamp)
+    })
+    return summary_id
+
+
+def call_counts(adapter, counter):
+    rows = []
+    for legacy in (True, False):
+        adapter.legacy_url_lookup = legacy
+        tag = f"legacy_url_lookup={legacy}"
+        url = f"new-{legacy}.example.com"
+        rows.append((f"save, new URL ({tag})", *counter.measure(adapter.save_summary, url, 's', 'f')))
+        rows.append((f"save, existing URL ({tag})", *counter.measure(adapter.save_summary, url, 's2', 'f')))
+        rows.append((f"get by URL, hit ({tag})", *counter.measure(adapter.get_summary_by_url, url)))
+        rows.append((f"get by URL, miss ({tag})", *counter.measure(adapter.get_summary_by_url, 'missing.example.com')))
+        summary_id = adapter.get_summary_by_url(url)['id']
+        rows.append((f"get by id ({tag})", *counter.measure(adapter.get_summary_by_id, summary_id)))
+    adapter.legacy_url_lookup = True
+    rows.append(("cache stats", *counter.measure(adapter.get_cache_stats)))
+    return rows
+
+
+def counted_summaries(adapter):
+    """Summaries in the table, by scanning it"""
+    items = adapter.table.scan()['Items']
+    return sum(1 for item in items if 'url' in item and 'alias_of' not in item)
+
+
+def concurrent_saves(adapter, threads, saves):
+    """Every thread saves the same URL; there must be one item and one id afterwards"""
+    url = 'contended.example.com'
+    ids = set()
+    lock = threading.Lock()
+
+    def run(t):
+        for i in range(saves):
+            summary_id = adapter.save_summary(url, f"{t}:{i}", 'full')
+            with lock:
+                ids.add(summary_id)
+
+    workers = [threading.Thread(target=run, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    items = adapter.table.query(
+        IndexName='url_hash-index',
+        KeyConditionExpression='url_hash = :h',
+        ExpressionAttributeValues={':h': adapter.generate_url_hash(url)}
+    )['Items']
+    return ids, items
+
+
+def resave_timestamps(adapter):
+    """(created_at, updated_at) pairs after a first save and a later re-save of one URL"""
+    url = 'resaved.example.com'
+    adapter.save_summary(url, 'first', 'full')
+    first = adapter.get_summary_by_url(url)
+    time.sleep(1.1)  # created_at/updated_at have one-second resolution
+    adapter.save_summary(url, 'second', 'full')
+    second = adapter.get_summary_by_url(url)
+    return (first['created_at'], first['updated_at']), (second['created_at'], second['updated_at'])
+
+
+def migration(adapter):
+    failures = []
+    old = {f"legacy{i}.example.com": legacy_put(adapter, f"legacy{i}.example.com", 'old') for i in range(20)}
+    # Saved again after the upgrade but before the migration ran
+    adapter.save_summary('legacy0.example.com', 'newer', 'full')
+
+    first = adapter.migrate_to_url_keys()
+    second = adapter.migrate_to_url_keys()
+    adapter.legacy_url_lookup = False
+
+    for url, summary_id in old.items():
+        by_url = adapter.get_summary_by_url(url)
+        by_id = adapter.get_summary_by_id(summary_id)
+        if not by_url or by_url['id'] != summary_id:
+            failures.append(f"{url}: URL lookup lost the original id")
+        if not by_id or by_id['url'] != url:
+            failures.append(f"{url}: old id {summary_id} no longer resolves")
+    if adapter.get_summary_by_url('legacy0.example.com')['short_summary'] != 'newer':
+        failures.append("migration overwrote a newer save")
+    if adapter.save_summary('legacy1.example.com', 'again', 'full') != old['legacy1.example.com']:
+        failures.append("save after migration changed the id")
+    adapter.legacy_url_lookup = True
+    return first, second, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=8, help='threads saving the same URL')
+    parser.add_argument('--saves', type=int, default=20, help='saves per thread')
+    args = parser.parse_args()
+
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'testing')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'testing')
+    os.environ.setdefault('AWS_DEFAULT_REGION', REGION)
+
+    failures = []
+    with mock_aws(), redirect_stdout(io.StringIO()) as log:
+        create_dynamodb_table(TABLE, REGION)
+        adapter = DynamoDBAdapter(table_name=TABLE, region_name=REGION)
+        counter = CallCounter(adapter)
+        rows = call_counts(adapter, counter)
+        ids, items = concurrent_saves(adapter, args.threads, args.saves)
+        first_save, resave = resave_timestamps(adapter)
+        first, second, migration_failures = migration(adapter)
+        adapter.delete_summary_by_url('legacy2.example.com')
+        adapter.delete_summary(adapter.get_summary_by_url('contended.example.com')['id'])
+        counter_total = adapter.get_cache_stats()['total_summaries']
+        actual_total = counted_summaries(adapter)
+    errors = [line for line in log.getvalue().splitlines() if line.startswith('Error')]
+
+    print(f"{'operation':<46} {'calls':>5}  breakdown")
+    for name, total, breakdown in rows:
+        print(f"{name:<46} {total:>5}  {', '.join(f'{k} x{v}' for k, v in sorted(breakdown.items()))}")
+
+    print(f"\n{args.threads} threads x {args.saves} saves of one URL: {len(items)} item(s), {len(ids)} id(s)")
+    print(f"migration: first run {first}, re-run {second}")
+    print(f"summary counter: {counter_total}, actual summaries: {actual_total}")
+
+    saves = {name: total for name, total, _ in rows if name.startswith('save, existing')}
+    if any(total != 1 for total in saves.values()):
+        failures.append(f"saving an existing URL took more than one call: {saves}")
+    if len(items) != 1 or len(ids) != 1:
+        failures.append("concurrent saves of one URL created duplicates")
+    if resave[0] != first_save[0]:
+        failures.append(f"re-save changed created_at: {first_save[0]} -> {resave[0]}")
+    if resave[1] == first_save[1]:
+        failures.append("re-save did not move updated_at")
+    if second['migrated'] or second['superseded']:
+        failures.append("re-running the migration moved items again")
+    if counter_total != actual_total:
+        failures.append(f"summary counter is {counter_total}, table holds {actual_total}")
+    stats_calls = next(breakdown for name, _, breakdown in rows if name == 'cache stats')
+    if 'Scan' in stats_calls:
+        failures.append(f"cache stats scans the table: {stats_calls}")
+    failures += migration_failures + errors
+
+    print("\nFAIL" if failures else "\nOK: one round trip per save, no duplicates, created_at kept, "
+                                     "migration keeps ids, counter is exact")
+    for failure in failures[:20]:
+        print(f"  - {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the clean_text extraction backends in policy_fetcher_safe
+
+Compares throughput (MB/s, pages/s) of the lxml and bs4 backends over a
+corpus of saved policy HTML and checks that both produce the same text.
+
+Usage (from Backend/):
+    python benchmarks/html_extraction.py                       # fixtures + synthetic large page
+    python benchmarks/html_extraction.py data/html_corpus      # saved pages (*.html)
+    python benchmarks/html_extraction.py --save https://example.com/privacy ...
+"""
+
+import sys
+import time
+import argparse
+import difflib
+from pathlib import Path
+from urllib.parse import urlparse
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import policy_fetcher_safe as fetcher
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+DEFAULT_CORPUS_DIR = BACKEND_DIR / "data" / "html_corpus"
+SYNTHETIC_TARGET_BYTES = 3 * 1024 * 1024
+
+BACKENDS = {
+    "lxml": fetcher._clean_text_lxml,
+    "bs4": fetcher._clean_text_bs4,
+}
+
+
+def save_pages(urls, corpus_dir):
+    """Download raw HTML for urls into corpus_dir"""
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    client = fetcher.get_http_client()
+    for url in urls:
+        r = client.get(url, timeout=20)
+        if r.status_code != 200:
+            print(f"[skip] {url} -> HTTP {r.status_code}")
+            continue
+        parsed = urlparse(url)
+        name = f"{fetcher.safe_domain(url)}{parsed.path.replace('/', '_') or '_'}.html"
+        (corpus_dir / name).write_text(r.text, encoding="utf-8")
+        print(f"[saved] {name} ({len(r.text) // 1024} KB)")
+
+
+def synthetic_page(pages):
+    """One multi-megabyte page built from the corpus bodies (large Playwright dumps)"""
+    bodies = []
+    for html in pages.values():
+        start = html.find("<body")
+        end = html.rfind("</body>")
+        if start != -1 and end != -1:
+            bodies.append(html[html.index(">", start) + 1:end])
+    if not bodies:
+        return None
+    parts, size, i = [], 0, 0
+    while size < SYNTHETIC_TARGET_BYTES:
+        chunk = f'<div class="section" id="s{i}">{bodies[i % len(bodies)]}</div>\n'
+        parts.append(chunk)
+        size += len(chunk)
+        i += 1
+    return "<html><head><title>Synthetic</title></head><body>" + "".join(parts) + "</body></html>"
+
+
+def load_corpus(paths):
+    pages = {}
+    for path in paths:
+        files = sorted(path.rglob("*.html")) if path.is_dir() else [path]
+        for f in files:
+            pages[str(f)] = f.read_text(encoding="utf-8", errors="replace")
+    return pages
+
+
+def time_backend(fn, pages, repeat):
+    """Best-of-repeat seconds to extract every page"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in pages.values():
+            fn(html)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("corpus", nargs="*", type=Path, help="HTML files or directories (default: fixtures)")
+    parser.add_argument("--save", nargs="+", metavar="URL", help=f"Download pages into {DEFAULT_CORPUS_DIR}")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs per backend (best is reported)")
+    parser.add_argument("--no-synthetic", action="store_true", help="Skip the synthetic multi-MB page")
+    args = parser.parse_args()
+
+    if args.save:
+        save_pages(args.save, DEFAULT_CORPUS_DIR)
+        return
+
+    if fetcher.lxml_etree is None:
+        print("lxml is not installed (pip install lxml); only the bs4 backend is available")
+        sys.exit(1)
+
+    pages = load_corpus(args.corpus or [FIXTURES_DIR])
+    if not pages:
+        print("No HTML pages found")
+        sys.exit(1)
+    if not args.no_synthetic:
+        big = synthetic_page(pages)
+        if big:
+            pages["<synthetic>"] = big
+
+    total_mb = sum(len(html.encode("utf-8")) for html in pages.values()) / (1024 * 1024)
+    print(f"Corpus: {len(pages)} pages, {total_mb:.2f} MB\n")
+
+    timings = {}
+    for name, fn in BACKENDS.items():
+        seconds = time_backend(fn, pages, args.repeat)
+        timings[name] = seconds
+        print(f"{name:>5}: {seconds:7.3f}s  {total_mb / seconds:7.2f} MB/s  {len(pages) / seconds:8.1f} pages/s")
+    print(f"\nlxml speedup: {timings['bs4'] / timings['lxml']:.1f}x")
+
+    print("\nOutput equivalence (lxml vs bs4):")
+    identical = 0
+    for name, html in pages.items():
+        a = BACKENDS["lxml"](html)
+        b = BACKENDS["bs4"](html)
+        if a == b:
+            identical += 1
+            continue
+        ratio = difflib.SequenceMatcher(None, a.splitlines(), b.splitlines(), autojunk=False).ratio()
+        print(f"  [differs] {name}: {ratio:.1%} of lines match ({len(a)} vs {len(b)} chars)")
+    print(f"  {identical}/{len(pages)} pages identical")
+
+
+if __name__ == "__main__":
+    main()
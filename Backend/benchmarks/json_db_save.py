@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Save latency of JSONDatabase: append-only journal vs. full-file rewrite
+
+For each database size a snapshot with N summaries is created, then
+save_summary is timed for both storage engines. Startup (snapshot load
+plus journal replay) and clear_old are timed too.
+
+Usage (from Backend/):
+    python benchmarks/json_db_save.py                 # 1k, 10k and 100k entries
+    python benchmarks/json_db_save.py --sizes 1000 --saves 500
+"""
+
+import io
+import sys
+import json
+import time
+import tempfile
+import argparse
+import statistics
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from database.json_db import JSONDatabase
+
+FULL_SUMMARY = ("## ⚠️ CONCERNING PRACTICES\n" + "⚠️ We share data with partners for advertising. " * 30)
+# Rewriting 100k entries takes seconds per save, so the legacy engine gets fewer samples
+MAX_REWRITE_SECONDS = 20
+
+
+def build_snapshot(path: Path, entries: int):
+    """Write a summaries_db.json with `entries` summaries (1% older than 30 days)"""
+    db = JSONDatabase.__new__(JSONDatabase)  # only for normalize_url/generate_url_hash
+    summaries, index = {}, {}
+    now = datetime.now()
+    for i in range(entries):
+        url = f"site{i}.example.com"
+        sid = f"id-{i:07d}"
+        ts = (now - timedelta(days=60 if i % 100 == 0 else 1)).isoformat()
+        summaries[sid] = {
+            'id': sid, 'url': url, 'normalized_url': url,
+            'short_summary': '⚠️ Shares data with advertisers; 🚫 no deletion option.',
+            'full_summary': FULL_SUMMARY, 'policy_types': ['privacy', 'terms'],
+            'timestamp': ts, 'created_at': ts[:19].replace('T', ' '), 'updated_at': ts[:19].replace('T', ' ')
+        }
+        index[db.generate_url_hash(url)] = {'url': url, 'normalized_url': url, 'summary_id': sid, 'last_accessed': ts}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'summaries': summaries, 'url_index': index}, f, ensure_ascii=False)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run(entries: int, journal: bool, saves: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'summaries_db.json'
+        build_snapshot(path, entries)
+
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            db = JSONDatabase(path, journal=journal)
+            open_ms = (time.perf_counter() - start) * 1000
+
+            latencies = []
+            budget_end = time.perf_counter() + MAX_REWRITE_SECONDS
+            for i in range(saves):
+                # Alternate updates of existing URLs and brand-new URLs
+                url = f"site{i * 7 % entries}.example.com" if i % 2 else f"new{i}.example.com"
+                start = time.perf_counter()
+                db.save_summary(url, 'short', FULL_SUMMARY, ['privacy'])
+                latencies.append((time.perf_counter() - start) * 1000)
+                if not journal and time.perf_counter() > budget_end and len(latencies) >= 3:
+                    break
+
+            start = time.perf_counter()
+            cleared = db.clear_old(30)
+            clear_ms = (time.perf_counter() - start) * 1000
+
+            db.close()
+            start = time.perf_counter()
+            JSONDatabase(path, journal=journal).close()
+            reopen_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        'samples': len(latencies),
+        'p50': statistics.median(latencies),
+        'p95': percentile(latencies, 95),
+        'mean': statistics.mean(latencies),
+        'open_ms': open_ms,
+        'reopen_ms': reopen_ms,
+        'clear_ms': clear_ms,
+        'cleared': cleared,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--saves', type=int, default=200, help='save_summary calls per run')
+    args = parser.parse_args()
+
+    print(f"{'entries':>8} {'engine':>8} {'saves':>6} {'p50 ms':>9} {'p95 ms':>9} {'mean ms':>9} "
+          f"{'open ms':>9} {'reopen ms':>10} {'clear_old ms':>13}")
+    for entries in args.sizes:
+        for journal in (True, False):
+            r = run(entries, journal, args.saves)
+            engine = 'journal' if journal else 'rewrite'
+            print(f"{entries:>8} {engine:>8} {r['samples']:>6} {r['p50']:>9.2f} {r['p95']:>9.2f} {r['mean']:>9.2f} "
+                  f"{r['open_ms']:>9.0f} {r['reopen_ms']:>10.0f} {r['clear_ms']:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Concurrency stress test for JSONDatabase
+
+Several worker processes, each with several threads, save summaries into
+one database at the same time. A small compaction threshold makes journal
+rotations and snapshot swaps happen throughout the run. Afterwards it checks:
+- no lost updates: every URL's final summary is the last one its writer saved
+- no duplicates: each URL maps to exactly one summary id
+- change detection: every worker sees the other workers' final writes
+  without reopening the database
+- a fresh load of the files matches what the workers see
+
+Usage (from Backend/):
+    python benchmarks/json_db_stress.py
+    python benchmarks/json_db_stress.py --processes 8 --threads 8 --ops 300
+    python benchmarks/json_db_stress.py --legacy         # full-rewrite mode
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import threading
+import multiprocessing as mp
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from database.json_db import JSONDatabase
+
+SHARED_URLS = 50  # URLs every thread writes to (contended)
+
+
+def own_url(worker, thread, key):
+    return f"w{worker}-t{thread}-k{key}.example.com"
+
+
+def worker_main(worker, args, path, barrier, results):
+    sys.stdout = open(os.devnull, 'w')  # silence per-save logging
+    db = JSONDatabase(path, journal=not args.legacy, compact_ratio=0.5, compact_min_kb=args.compact_kb)
+    rng = random.Random(worker)
+    errors = []
+
+    def run_thread(thread):
+        try:
+            for i in range(args.ops):
+                # Own keys have one writer, so their final value is known
+                db.save_summary(own_url(worker, thread, i % args.keys), f"{worker}:{thread}:{i}", "full", ["privacy"])
+                db.save_summary(f"shared{rng.randrange(SHARED_URLS)}.example.com", f"{worker}:{thread}:{i}", "full")
+                if i % 10 == 0:
+                    db.get_recent(5)
+        except Exception as e:
+            errors.append(f"worker {worker} thread {thread}: {e!r}")
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=run_thread, args=(t,)) for t in range(args.threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    barrier.wait()  # every process is done writing
+
+    # Change detection: this instance must see everyone's final writes
+    stale = 0
+    for w in range(args.processes):
+        for t in range(args.threads):
+            for key in range(args.keys):
+                last = max(i for i in range(args.ops) if i % args.keys == key)
+                summary = db.get_summary_by_url(own_url(w, t, key))
+                if not summary or summary['short_summary'] != f"{w}:{t}:{last}":
+                    stale += 1
+
+    stats = db.get_cache_stats()
+    db.close()
+    results.put({
+        'worker': worker, 'elapsed': elapsed, 'errors': errors, 'stale': stale,
+        'total': stats['total_summaries'], 'reloads': stats['reloads'],
+        'external_records': stats['external_records'], 'compactions': stats.get('compactions', 0)
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--processes', type=int, default=4)
+    parser.add_argument('--threads', type=int, default=4, help='threads per process')
+    parser.add_argument('--ops', type=int, default=200, help='iterations per thread (2 saves each)')
+    parser.add_argument('--keys', type=int, default=20, help='own URLs per thread')
+    parser.add_argument('--compact-kb', type=int, default=64, help='compaction threshold (small = frequent)')
+    parser.add_argument('--legacy', action='store_true', help='full-rewrite mode instead of the journal')
+    parser.add_argument('--start-method', default=None, help='multiprocessing start method (fork, spawn, ...)')
+    args = parser.parse_args()
+
+    ctx = mp.get_context(args.start_method)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / 'summaries_db.json')
+        barrier = ctx.Barrier(args.processes)
+        results = ctx.Queue()
+        procs = [ctx.Process(target=worker_main, args=(w, args, path, barrier, results))
+                 for w in range(args.processes)]
+        for p in procs:
+            p.start()
+        reports = [results.get() for _ in procs]
+        for p in procs:
+            p.join()
+
+        sys_stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+        fresh = JSONDatabase(path, journal=not args.legacy)
+        sys.stdout = sys_stdout
+        summaries = fresh.data['summaries']
+        index = fresh.data['url_index']
+
+    saves = args.processes * args.threads * args.ops * 2
+    expected = args.processes * args.threads * args.keys + SHARED_URLS
+    slowest = max(r['elapsed'] for r in reports)
+    failures = [e for r in reports for e in r['errors']]
+
+    print(f"{args.processes} processes x {args.threads} threads, {saves} saves in {slowest:.1f}s "
+          f"({saves / slowest:.0f} saves/s, {'legacy' if args.legacy else 'journal'} mode)")
+    for r in sorted(reports, key=lambda r: r['worker']):
+        print(f"  worker {r['worker']}: {r['elapsed']:.1f}s, sees {r['total']} summaries, "
+              f"{r['external_records']} records from other processes, {r['reloads']} full reloads, "
+              f"{r['compactions']} compactions, {r['stale']} stale reads")
+
+    if len(summaries) != expected:
+        failures.append(f"{len(summaries)} summaries on disk, expected {expected}")
+    if len(index) != expected or {e['summary_id'] for e in index.values()} != set(summaries):
+        failures.append("URL index and summaries disagree (duplicate ids for one URL?)")
+    for r in reports:
+        if r['stale']:
+            failures.append(f"worker {r['worker']} read {r['stale']} stale summaries")
+        if r['total'] != len(summaries):
+            failures.append(f"worker {r['worker']} sees {r['total']} summaries, files hold {len(summaries)}")
+
+    print("\nFAIL" if failures else "\nOK: no lost updates, no duplicates, no stale reads")
+    for failure in failures[:20]:
+        print(f"  - {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -21,6 +21,19 @@ class Config:
     SUMMARIES_DIR = os.path.join(DATA_DIR, "summaries")
     SUMMARIES_DB = os.path.join(DATA_DIR, "summaries_db.json")
     
+    # LLM Provider: 'perplexity', 'gemini' or 'fake' (local deterministic stand-in)
+    LLM_PROVIDER = os.environ.get("LLM_PROVIDER", "perplexity")
+    LLM_BASE_URL = os.environ.get("LLM_BASE_URL")  # Override, e.g. a local fake server
+    
+    # Perplexity Configuration
+    PERPLEXITY_API_KEY = os.environ.get("PERPLEXITY_API_KEY")
+    PERPLEXITY_MODEL = os.environ.get("PERPLEXITY_MODEL", "sonar")
+    
+    # Fake Provider Configuration (offline benchmarks and load tests)
+    FAKE_LLM_LATENCY_SECONDS = float(os.environ.get("FAKE_LLM_LATENCY_SECONDS", 0.5))
+    FAKE_LLM_TOKENS_PER_SECOND = float(os.environ.get("FAKE_LLM_TOKENS_PER_SECOND", 200))
+    FAKE_LLM_ERROR_RATE = float(os.environ.get("FAKE_LLM_ERROR_RATE", 0.0))
+    
     # Gemini Configuration
     GEMINI_MODEL = "gemini-2.0-flash-exp"
     GEMINI_FALLBACK_MODEL = "gemini-1.5-flash"
@@ -29,24 +42,90 @@ class Config:
     TOP_K = 64
     MAX_OUTPUT_TOKENS = 8192
     
+    # LLM Rate Limiting (client-side, shared by all summary calls)
+    LLM_REQUESTS_PER_MINUTE = float(os.environ.get("LLM_REQUESTS_PER_MINUTE", 50))
+    LLM_TOKENS_PER_MINUTE = float(os.environ.get("LLM_TOKENS_PER_MINUTE", 0))  # 0 = unlimited
+    LLM_MAX_CONCURRENCY = int(os.environ.get("LLM_MAX_CONCURRENCY", 8))
+    LLM_TARGET_LATENCY_SECONDS = float(os.environ.get("LLM_TARGET_LATENCY_SECONDS", 30))  # Slower calls shrink concurrency
+    LLM_MAX_RETRIES = int(os.environ.get("LLM_MAX_RETRIES", 4))
+    LLM_QUEUE_TIMEOUT_SECONDS = float(os.environ.get("LLM_QUEUE_TIMEOUT_SECONDS", 120))
+    
     # Request Limits
     MAX_TEXT_SIZE = 1000000  # 1MB
     
+    # Chunked (map-reduce) summarization for long policies
+    CHUNK_THRESHOLD_CHARS = int(os.environ.get("CHUNK_THRESHOLD_CHARS", 20000))  # Longer inputs are chunked
+    CHUNK_MAX_CHARS = int(os.environ.get("CHUNK_MAX_CHARS", 12000))  # Size of each chunk
+    CHUNK_WORKERS = int(os.environ.get("CHUNK_WORKERS", 4))  # Parallel chunk summaries
+    
+    # Input condensing: strip boilerplate and repeated paragraphs before the LLM call
+    CONDENSE_ENABLED = os.environ.get("CONDENSE_ENABLED", "true").lower() == "true"
+    CONDENSE_SHINGLE_WORDS = int(os.environ.get("CONDENSE_SHINGLE_WORDS", 5))  # Words per shingle
+    CONDENSE_SIMILARITY = float(os.environ.get("CONDENSE_SIMILARITY", 0.7))  # Share of seen shingles that marks a repeat
+    
     # Database Configuration
-    DB_TYPE = os.environ.get("DB_TYPE", "json")  # 'json' or 'dynamodb'
+    DB_TYPE = os.environ.get("DB_TYPE", "json")  # 'json', 'sqlite' or 'dynamodb'
     
     # JSON Database (default)
     JSON_DB_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "summaries_db.json")
+    JSON_DB_JOURNAL = os.environ.get("JSON_DB_JOURNAL", "true").lower() == "true"  # Append-only journal instead of full rewrites
+    JSON_DB_COMPACT_RATIO = float(os.environ.get("JSON_DB_COMPACT_RATIO", 1.0))  # Compact when journal > ratio x snapshot
+    JSON_DB_COMPACT_MIN_KB = int(os.environ.get("JSON_DB_COMPACT_MIN_KB", 1024))
+    JSON_DB_FSYNC = os.environ.get("JSON_DB_FSYNC", "false").lower() == "true"  # fsync every journal write
+    
+    # SQLite Database
+    SQLITE_DB_FILE = os.environ.get("SQLITE_DB_FILE", os.path.join(os.path.dirname(os.path.dirname(__file__)), "summaries.db"))
+    SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000))  # Wait for other writers' locks
+    SQLITE_SYNCHRONOUS = os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL").upper()  # FULL = fsync every commit
     
     # DynamoDB Configuration (optional)
     DYNAMODB_TABLE_NAME = os.environ.get("DYNAMODB_TABLE_NAME", "naked-policy-summaries")
     DYNAMODB_REGION = os.environ.get("DYNAMODB_REGION", "us-east-1")
+    # Also look up items written before URL keys; set false once setup_dynamodb.py --migrate-url-keys has run
+    DYNAMODB_LEGACY_URL_LOOKUP = os.environ.get("DYNAMODB_LEGACY_URL_LOOKUP", "true").lower() == "true"
     AWS_ACCESS_KEY_ID = os.environ.get("AWS_ACCESS_KEY_ID")
     AWS_SECRET_ACCESS_KEY = os.environ.get("AWS_SECRET_ACCESS_KEY")
     
     # Cache Settings
     CACHE_ENABLED = os.environ.get("CACHE_ENABLED", "true").lower() == "true"
     CACHE_EXPIRY_DAYS = int(os.environ.get("CACHE_EXPIRY_DAYS", 30))  # Cache validity period
+    # Summaries are stamped with expires_at = save time + CACHE_EXPIRY_DAYS and deleted
+    # after it (DynamoDB: native TTL, JSON/SQLite: background sweeper)
+    EXPIRY_SWEEP_ENABLED = os.environ.get("EXPIRY_SWEEP_ENABLED", "true").lower() == "true"
+    EXPIRY_SWEEP_INTERVAL_SECONDS = float(os.environ.get("EXPIRY_SWEEP_INTERVAL_SECONDS", 3600))
+    
+    # In-memory hot tier in front of the database (URL and id lookups)
+    HOT_CACHE_ENABLED = os.environ.get("HOT_CACHE_ENABLED", "true").lower() == "true"
+    HOT_CACHE_MAX_ENTRIES = int(os.environ.get("HOT_CACHE_MAX_ENTRIES", 1000))
+    HOT_CACHE_TTL_SECONDS = float(os.environ.get("HOT_CACHE_TTL_SECONDS", 300))  # Max staleness vs other workers
+    HOT_CACHE_BROADCAST = os.environ.get("HOT_CACHE_BROADCAST", "false").lower() == "true"  # Cross-worker invalidation
+    HOT_CACHE_BROADCAST_FILE = os.path.join(DATA_DIR, "hot_cache_invalidations.log")
+    
+    # LLM Summary Cache (reuses output for identical policy text)
+    SUMMARY_CACHE_ENABLED = os.environ.get("SUMMARY_CACHE_ENABLED", "true").lower() == "true"
+    SUMMARY_CACHE_FILE = os.path.join(DATA_DIR, "summary_cache.json")
+    SUMMARY_CACHE_MAX_ENTRIES = int(os.environ.get("SUMMARY_CACHE_MAX_ENTRIES", 1000))
+    
+    # Background summary generation
+    SUMMARY_WORKERS = int(os.environ.get("SUMMARY_WORKERS", 4))
+    FULL_SUMMARY_GRACE_SECONDS = int(os.environ.get("FULL_SUMMARY_GRACE_SECONDS", 300))  # Treat as in progress elsewhere
+    
+    # Request coalescing (one fetch+summarize per URL at a time)
+    COALESCE_ACROSS_PROCESSES = os.environ.get("COALESCE_ACROSS_PROCESSES", "false").lower() == "true"
+    COALESCE_LOCK_DIR = os.path.join(DATA_DIR, "locks")
+    
+    # Async job mode for /fetch-and-summarize
+    ASYNC_JOBS_DEFAULT = os.environ.get("ASYNC_JOBS_DEFAULT", "false").lower() == "true"
+    JOB_WORKERS = int(os.environ.get("JOB_WORKERS", 2))  # Max concurrent fetch+summarize jobs
+    JOBS_DIR = os.path.join(DATA_DIR, "jobs")
+    JOB_RETENTION_HOURS = int(os.environ.get("JOB_RETENTION_HOURS", 24))
+    JOB_LEASE_SECONDS = int(os.environ.get("JOB_LEASE_SECONDS", 60))  # Unrenewed jobs are taken over after this
+    
+    # Periodic stats snapshots for trend views (/cache/stats/history)
+    STATS_HISTORY_ENABLED = os.environ.get("STATS_HISTORY_ENABLED", "true").lower() == "true"
+    STATS_HISTORY_FILE = os.path.join(DATA_DIR, "stats_history.jsonl")
+    STATS_SNAPSHOT_INTERVAL_SECONDS = float(os.environ.get("STATS_SNAPSHOT_INTERVAL_SECONDS", 300))
+    STATS_HISTORY_MAX_KB = int(os.environ.get("STATS_HISTORY_MAX_KB", 1024))  # Oldest half dropped beyond this
 
 
 class DevelopmentConfig(Config):
@@ -1,17 +1,25 @@
 """
 Database Package
-Supports multiple database backends: JSON, DynamoDB, etc.
+Supports multiple database backends: JSON, SQLite, DynamoDB, etc.
 """
 
 from .db_interface import DatabaseInterface
 from .json_db import JSONDatabase
-from .dynamodb_adapter import DynamoDBAdapter, create_dynamodb_table
+from .sqlite_db import SQLiteDatabase
+from .cached_db import CachedDatabase
+from .sweeper import ExpirySweeper
+from .dynamodb_adapter import DynamoDBAdapter, create_dynamodb_table, add_recent_index, enable_ttl
 
 __all__ = [
     'DatabaseInterface',
     'JSONDatabase',
+    'SQLiteDatabase',
+    'CachedDatabase',
+    'ExpirySweeper',
     'DynamoDBAdapter',
     'create_dynamodb_table',
+    'add_recent_index',
+    'enable_ttl',
     'get_database'
 ]
 
@@ -21,7 +29,7 @@ def get_database(db_type='json', **kwargs):
     Factory function to get database instance
     
     Args:
-        db_type: Type of database ('json' or 'dynamodb')
+        db_type: Type of database ('json', 'sqlite' or 'dynamodb')
         **kwargs: Additional arguments passed to database constructor
     
     Returns:
@@ -31,6 +39,9 @@ def get_database(db_type='json', **kwargs):
         # Use JSON database (default)
         db = get_database('json', storage_file='summaries_db.json')
         
+        # Use SQLite (several worker processes on one host)
+        db = get_database('sqlite', db_file='summaries.db')
+        
         # Use DynamoDB
         db = get_database('dynamodb', 
                          table_name='naked-policy-summaries',
@@ -38,6 +49,8 @@ def get_database(db_type='json', **kwargs):
     """
     if db_type.lower() == 'json':
         return JSONDatabase(**kwargs)
+    elif db_type.lower() == 'sqlite':
+        return SQLiteDatabase(**kwargs)
     elif db_type.lower() == 'dynamodb':
         return DynamoDBAdapter(**kwargs)
     else:
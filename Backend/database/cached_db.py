@@ -0,0 +1,288 @@
+"""
+Hot-tier Cache
+Bounded in-memory LRU in front of any DatabaseInterface backend
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+from .db_interface import DatabaseInterface
+
+
+class CachedDatabase(DatabaseInterface):
+    """
+    LRU + TTL cache for URL and id lookups, wrapping another backend
+
+    A few popular sites make up most cache checks; for DynamoDB each one
+    is a network query. Hits are served from memory for up to ttl_seconds.
+    Saves and deletes invalidate; the next lookup caches the record as the
+    backend stored it (original id and created_at, backend-maintained
+    fields). Summaries without a full summary yet are never cached, so a
+    pending summary finished by another worker is seen at once.
+
+    Other workers' writes become visible after at most ttl_seconds. With
+    `broadcast_file` set, every write and delete also appends the key to
+    that file; each worker checks the file before a cache hit and drops
+    the keys it lists (one stat per lookup, lines read only when it grew).
+
+    Callers get copies of cached summaries, so they can add fields freely.
+    Anything not in DatabaseInterface (clear_old, close, ...) is passed
+    through to the backend.
+    """
+
+    def __init__(self, backend: DatabaseInterface, max_entries: int = 1000, ttl_seconds: float = 300,
+                 broadcast_file: Optional[str] = None, broadcast_max_kb: int = 256):
+        """
+        Args:
+            backend: Database to cache
+            max_entries: Summaries kept in memory (least recently used are evicted)
+            ttl_seconds: How long a cached summary is served without asking the backend
+            broadcast_file: Shared file for invalidations between worker processes
+            broadcast_max_kb: Truncate the broadcast file beyond this size
+        """
+        self.backend = backend
+        self.ttl_days = backend.ttl_days
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.broadcast_file = Path(broadcast_file) if broadcast_file else None
+        self.broadcast_max_bytes = broadcast_max_kb * 1024
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # url_hash -> (expires_at monotonic, summary)
+        self._ids = {}                 # summary id -> url_hash
+        self._writes = 0               # bumped by every local write; guards miss fills
+        self._broadcast_ino = None
+        self._broadcast_offset = 0
+        self._stats = {'hits': 0, 'misses': 0, 'expired': 0, 'evictions': 0,
+                       'invalidations': 0, 'remote_invalidations': 0}
+        if self.broadcast_file:
+            self.broadcast_file.parent.mkdir(parents=True, exist_ok=True)
+            self.broadcast_file.touch()
+            st = os.stat(self.broadcast_file)
+            self._broadcast_ino, self._broadcast_offset = st.st_ino, st.st_size
+
+    def __getattr__(self, name):
+        # Only called for attributes not found here: backend-specific extras
+        if name == 'backend':
+            raise AttributeError(name)
+        return getattr(self.backend, name)
+
+    # ------------------------------------------------------------------
+    # Cache internals (caller holds self._lock)
+    # ------------------------------------------------------------------
+
+    def _get(self, url_hash: str) -> Optional[Dict]:
+        entry = self._entries.get(url_hash)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._drop(url_hash)
+            self._stats['expired'] += 1
+            return None
+        self._entries.move_to_end(url_hash)
+        return entry[1]
+
+    def _put(self, url_hash: str, summary: Dict):
+        if not summary.get('full_summary'):
+            self._drop(url_hash)  # still being generated; always ask the backend
+            return
+        self._drop(url_hash)
+        self._entries[url_hash] = (time.monotonic() + self.ttl_seconds, summary)
+        self._ids[summary['id']] = url_hash
+        while len(self._entries) > self.max_entries:
+            old_hash, (_, old) = self._entries.popitem(last=False)
+            self._ids.pop(old['id'], None)
+            self._stats['evictions'] += 1
+
+    def _fill(self, url_hash: str, summary: Dict, writes: int):
+        """Cache a backend read unless a local write happened while it was in flight"""
+        with self._lock:
+            if self._writes == writes:
+                self._put(url_hash, summary)
+
+    def _drop(self, url_hash: str) -> bool:
+        entry = self._entries.pop(url_hash, None)
+        if entry is None:
+            return False
+        self._ids.pop(entry[1]['id'], None)
+        return True
+
+    def _drop_id(self, summary_id: str) -> bool:
+        url_hash = self._ids.get(summary_id)
+        return self._drop(url_hash) if url_hash else False
+
+    # ------------------------------------------------------------------
+    # Cross-worker invalidation
+    # ------------------------------------------------------------------
+
+    def _poll_broadcast(self):
+        """Drop keys other workers invalidated since the last check (caller holds self._lock)"""
+        if not self.broadcast_file:
+            return
+        try:
+            st = os.stat(self.broadcast_file)
+        except FileNotFoundError:
+            st = None
+        if st and st.st_ino == self._broadcast_ino and st.st_size == self._broadcast_offset:
+            return
+        if not st or st.st_ino != self._broadcast_ino or st.st_size < self._broadcast_offset:
+            # Truncated or replaced: lines may have been missed, start over
+            self._stats['remote_invalidations'] += len(self._entries)
+            self._entries.clear()
+            self._ids.clear()
+            self._broadcast_ino = st.st_ino if st else None
+            self._broadcast_offset = st.st_size if st else 0
+            return
+        with open(self.broadcast_file, 'rb') as f:
+            f.seek(self._broadcast_offset)
+            chunk = f.read(st.st_size - self._broadcast_offset)
+        end = chunk.rfind(b'\n') + 1  # a partial last line is read next time
+        self._broadcast_offset += end
+        for line in chunk[:end].decode('utf-8', 'replace').splitlines():
+            kind, _, key = line.partition(' ')
+            dropped = self._drop(key) if kind == 'u' else self._drop_id(key)
+            self._stats['remote_invalidations'] += dropped
+
+    def _broadcast(self, kind: str, key: str):
+        """Tell other workers to drop a key: 'u' for a URL hash, 'i' for a summary id"""
+        if not self.broadcast_file:
+            return
+        try:
+            if os.path.getsize(self.broadcast_file) > self.broadcast_max_bytes:
+                # Swap in an empty file; everyone notices the new inode and clears their cache once
+                tmp = self.broadcast_file.with_name(f"{self.broadcast_file.name}.{os.getpid()}")
+                open(tmp, 'wb').close()
+                os.replace(tmp, self.broadcast_file)
+            # One short O_APPEND write per line, so lines from workers never interleave
+            fd = os.open(self.broadcast_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+            try:
+                os.write(fd, f"{kind} {key}\n".encode('utf-8'))
+            finally:
+                os.close(fd)
+            with self._lock:
+                st = os.stat(self.broadcast_file)
+                if st.st_ino == self._broadcast_ino and st.st_size == self._broadcast_offset + len(key) + 3:
+                    self._broadcast_offset = st.st_size  # only our own line is new
+        except OSError as e:
+            print(f"⚠️  Could not broadcast cache invalidation: {e}")
+
+    # ------------------------------------------------------------------
+    # DatabaseInterface
+    # ------------------------------------------------------------------
+
+    def get_summary_by_url(self, url: str, expiry_days: int = None) -> Optional[Dict]:
+        """Cached summary for url; falls back to the backend on a miss"""
+        url_hash = self.generate_url_hash(url)
+        with self._lock:
+            self._poll_broadcast()
+            summary = self._get(url_hash)
+            self._stats['hits' if summary else 'misses'] += 1
+            writes = self._writes
+        if summary is None:
+            summary = self.backend.get_summary_by_url(url, expiry_days=expiry_days)
+            if summary is None:
+                return None
+            self._fill(url_hash, summary, writes)
+            return dict(summary)
+
+        if expiry_days is not None and self.is_summary_expired(summary, expiry_days):
+            print(f"⏰ Cache expired for URL: {url}")
+            return None
+        return dict(summary)
+
+    def get_summary_by_id(self, summary_id: str) -> Optional[Dict]:
+        """Cached summary by id; falls back to the backend on a miss"""
+        with self._lock:
+            self._poll_broadcast()
+            url_hash = self._ids.get(summary_id)
+            summary = self._get(url_hash) if url_hash else None
+            self._stats['hits' if summary else 'misses'] += 1
+            writes = self._writes
+        if summary is None:
+            summary = self.backend.get_summary_by_id(summary_id)
+            if summary is None:
+                return None
+            self._fill(self.generate_url_hash(summary['url']), summary, writes)
+        return dict(summary)
+
+    def save_summary(self, url: str, short_summary: str, full_summary: str,
+                    policy_types: List[str] = None) -> str:
+        """Save to the backend and invalidate the cached summary; the next read caches the stored record"""
+        summary_id = self.backend.save_summary(url, short_summary, full_summary, policy_types)
+        url_hash = self.generate_url_hash(url)
+        with self._lock:
+            self._writes += 1
+            if self._drop(url_hash) | self._drop_id(summary_id):
+                self._stats['invalidations'] += 1
+        self._broadcast('u', url_hash)
+        return summary_id
+
+    def get_recent(self, limit: int = 10) -> List[Dict]:
+        """Get recent summaries (always from the backend)"""
+        return self.backend.get_recent(limit=limit)
+
+    def get_recent_page(self, limit: int = 10, cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """Page through recent summaries (always from the backend)"""
+        return self.backend.get_recent_page(limit=limit, cursor=cursor)
+
+    def delete_summary(self, summary_id: str) -> bool:
+        """Delete from the backend and invalidate the cached entry"""
+        deleted = self.backend.delete_summary(summary_id)
+        with self._lock:
+            self._writes += 1
+            if self._drop_id(summary_id):
+                self._stats['invalidations'] += 1
+        self._broadcast('i', summary_id)
+        return deleted
+
+    def delete_summary_by_url(self, url: str) -> bool:
+        """Delete a summary by URL and invalidate the cached entry"""
+        url_hash = self.generate_url_hash(url)
+        deleted = self.backend.delete_summary_by_url(url)
+        with self._lock:
+            self._writes += 1
+            if self._drop(url_hash):
+                self._stats['invalidations'] += 1
+        self._broadcast('u', url_hash)
+        return deleted
+
+    def clear_old(self, days: int = 30) -> int:
+        """Clear old summaries in the backend and empty the cache"""
+        cleared = self.backend.clear_old(days)
+        self.clear()
+        return cleared
+
+    def sweep_expired(self) -> int:
+        """Sweep expired summaries in the backend and empty the cache if any were deleted"""
+        swept = self.backend.sweep_expired()
+        if swept:
+            self.clear()
+        return swept
+
+    def clear(self):
+        """Empty this worker's cache"""
+        with self._lock:
+            self._writes += 1
+            self._stats['invalidations'] += len(self._entries)
+            self._entries.clear()
+            self._ids.clear()
+
+    def stats(self) -> Dict:
+        """Hit/miss counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        stats['max_entries'] = self.max_entries
+        stats['ttl_seconds'] = self.ttl_seconds
+        stats['broadcast'] = self.broadcast_file is not None
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        return stats
+
+    def get_cache_stats(self) -> Dict:
+        """Backend statistics plus the hot tier's hit ratio"""
+        stats = self.backend.get_cache_stats()
+        stats['hot_cache'] = self.stats()
+        return stats
@@ -4,14 +4,20 @@ Provides abstraction for different database backends (JSON, DynamoDB, etc.)
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+import base64
 import hashlib
+import json
+import time
 from datetime import datetime, timedelta
 
 
 class DatabaseInterface(ABC):
     """Abstract base class for database operations"""
     
+    # Days a saved summary lives; stored per summary as an epoch `expires_at` (None = never)
+    ttl_days: Optional[int] = None
+    
     @abstractmethod
     def get_summary_by_url(self, url: str) -> Optional[Dict]:
         """Retrieve cached summary by URL"""
@@ -33,6 +39,30 @@ class DatabaseInterface(ABC):
         """Get recent summaries"""
         pass
     
+    def get_recent_page(self, limit: int = 10, cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Page through summaries, newest first
+        
+        Args:
+            limit: Page size
+            cursor: next_cursor from the previous page (None = first page)
+        
+        Returns:
+            (summaries, next_cursor) - next_cursor is None after the last page
+        
+        Default implementation re-reads get_recent with a growing limit
+        until the page is past the cursor - backends with a recency index
+        override it
+        """
+        after = self.decode_recent_cursor(cursor) if cursor else None
+        fetch = limit
+        while True:
+            summaries = self.get_recent(limit=fetch)
+            page = [s for s in summaries if after is None or self.recency_key(s) < after]
+            if len(page) >= limit or len(summaries) < fetch:
+                return self.recent_page(page[:limit], limit)
+            fetch *= 2
+    
     @abstractmethod
     def delete_summary(self, summary_id: str) -> bool:
         """Delete a summary"""
@@ -80,6 +110,61 @@ class DatabaseInterface(ABC):
             # If timestamp is invalid, consider it expired
             return True
     
+    def expires_at_for_save(self) -> Optional[int]:
+        """Epoch second a summary saved now expires at (None if ttl_days is unset)"""
+        if self.ttl_days is None:
+            return None
+        return int(time.time()) + int(self.ttl_days * 86400)
+    
+    def is_summary_expired(self, summary: Dict, expiry_days: int) -> bool:
+        """
+        Read-time expiry check: compares the stored `expires_at` epoch with
+        the clock. Summaries saved before `expires_at` existed fall back to
+        parsing their timestamp against expiry_days.
+        """
+        expires_at = summary.get('expires_at')
+        if expires_at is not None:
+            return expires_at <= time.time()
+        if 'timestamp' in summary:
+            return self.is_cache_expired(summary['timestamp'], expiry_days)
+        return False
+    
+    def sweep_expired(self) -> int:
+        """
+        Delete expired summaries in one write; returns how many were removed
+        Default implementation - backends with storage-level expiry override it
+        """
+        return 0
+    
+    @staticmethod
+    def recency_key(summary: Dict) -> Tuple[str, str]:
+        """Sort key for recency: (timestamp, id), so equal timestamps still have an order"""
+        return (summary.get('timestamp', ''), summary.get('id', ''))
+    
+    @staticmethod
+    def encode_recent_cursor(timestamp: str, summary_id: str) -> str:
+        """Opaque pagination cursor pointing just past (timestamp, summary_id)"""
+        raw = json.dumps([timestamp, summary_id], separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+    
+    @staticmethod
+    def decode_recent_cursor(cursor: str) -> Tuple[str, str]:
+        """Inverse of encode_recent_cursor; raises ValueError for a malformed cursor"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            timestamp, summary_id = json.loads(raw)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid cursor: {cursor!r}") from e
+        if not isinstance(timestamp, str) or not isinstance(summary_id, str):
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+        return timestamp, summary_id
+    
+    def recent_page(self, summaries: List[Dict], limit: int) -> Tuple[List[Dict], Optional[str]]:
+        """(summaries, next_cursor) for a page that came back full (limit items) or short (last page)"""
+        if len(summaries) < limit or not summaries:
+            return summaries, None
+        return summaries, self.encode_recent_cursor(*self.recency_key(summaries[-1]))
+    
     def delete_summary_by_url(self, url: str) -> bool:
         """
         Delete a summary by URL (for cache clearing)
@@ -3,25 +3,71 @@ DynamoDB Database Implementation
 Cloud-based storage with URL caching
 """
 
+import time
 import uuid
 import boto3
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from .db_interface import DatabaseInterface
 from decimal import Decimal
 import json
 
 
+# Namespace for item keys derived from the URL hash (uuid5, so keys look like the old uuid4 ids)
+URL_KEY_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, 'nakedpolicy/summary')
+
+# Number attribute DynamoDB TTL deletes items by (epoch seconds)
+TTL_ATTRIBUTE = 'expires_at'
+
+# Item holding the maintained summary count (never matches a uuid key)
+STATS_KEY = 'stats#summaries'
+
+# Time-ordered GSI: partition per month of `timestamp`, sorted by `timestamp`
+RECENT_INDEX = 'recent-index'
+
+
+RECENT_INDEX_SCHEMA = {
+    'IndexName': RECENT_INDEX,
+    'KeySchema': [
+        {'AttributeName': 'recent_bucket', 'KeyType': 'HASH'},
+        {'AttributeName': 'timestamp', 'KeyType': 'RANGE'}
+    ],
+    'Projection': {'ProjectionType': 'ALL'},
+    'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+}
+
+
+def recent_bucket(timestamp: str) -> str:
+    """Recency partition for an ISO timestamp ('2024-05-17T...' -> '2024-05')"""
+    return timestamp[:7]
+
+
+def previous_bucket(bucket: str) -> str:
+    year, month = int(bucket[:4]), int(bucket[5:7]) - 1
+    if month == 0:
+        year, month = year - 1, 12
+    return f"{year:04d}-{month:02d}"
+
+
 class DynamoDBAdapter(DatabaseInterface):
     """
     DynamoDB database implementation with URL-based caching
     
     Table Schema:
-    - Primary Key: summary_id (String) - UUID for each summary
-    - GSI (Global Secondary Index): url_hash (String) - For URL lookups
+    - Primary Key: summary_id (String) - uuid5 of the URL hash, so a URL's
+      item can be read and upserted directly without looking it up first
+    - GSI (Global Secondary Index): url_hash (String) - URL lookups for
+      items written before URL keys (see migrate_to_url_keys)
+    - GSI recent-index: recent_bucket (String, 'YYYY-MM') + timestamp (String)
+      sort key - newest-first listing, one partition per month
     
     Attributes:
-    - summary_id: Unique identifier
+    - summary_id: Item key
+    - id: Public summary id; equals summary_id, except for migrated items,
+      which keep their original id (the old item becomes an alias stub
+      {summary_id: old id, alias_of: new key} so old links still resolve)
+    - The item {summary_id: 'stats#summaries', total_summaries: n} is an
+      atomic counter updated on create/delete, read by get_cache_stats
     - url: Original URL
     - normalized_url: Normalized URL for consistency
     - url_hash: Hash of normalized URL (for indexing)
@@ -29,12 +75,15 @@ class DynamoDBAdapter(DatabaseInterface):
     - full_summary: 1000-word summary
     - policy_types: List of policy types
     - timestamp: ISO timestamp
+    - recent_bucket: Month of timestamp (recent-index partition)
+    - expires_at: Epoch seconds; the table's TTL attribute (see enable_ttl)
     - created_at: Human-readable creation time
     - updated_at: Last update time
     """
     
     def __init__(self, table_name='naked-policy-summaries', region_name='us-east-1',
-                 aws_access_key_id=None, aws_secret_access_key=None):
+                 aws_access_key_id=None, aws_secret_access_key=None, recent_max_buckets=24,
+                 legacy_url_lookup=True, ttl_days=None):
         """
         Initialize DynamoDB connection
         
@@ -43,8 +92,18 @@ class DynamoDBAdapter(DatabaseInterface):
             region_name: AWS region
             aws_access_key_id: AWS access key (optional, can use environment variables)
             aws_secret_access_key: AWS secret key (optional, can use environment variables)
+            recent_max_buckets: How many months back get_recent looks for summaries when
+                the oldest month is not recorded yet (see oldest_bucket)
+            legacy_url_lookup: On a URL-key miss, also query url_hash-index for items
+                written before URL keys (turn off once migrate_to_url_keys has run)
+            ttl_days: Stamp saved items with an `expires_at` epoch this many days ahead
+                for DynamoDB TTL to delete (None = items never expire)
         """
         self.table_name = table_name
+        self.recent_max_buckets = recent_max_buckets
+        self._oldest_bucket = None  # (month, monotonic time read) from the stats item
+        self.legacy_url_lookup = legacy_url_lookup
+        self.ttl_days = ttl_days
         
         # Initialize DynamoDB client
         session_params = {'region_name': region_name}
@@ -55,9 +114,14 @@ class DynamoDBAdapter(DatabaseInterface):
         self.dynamodb = boto3.resource('dynamodb', **session_params)
         self.table = self.dynamodb.Table(table_name)
     
+    @staticmethod
+    def url_key(url_hash: str) -> str:
+        """Item key for a URL hash"""
+        return str(uuid.uuid5(URL_KEY_NAMESPACE, url_hash))
+    
     def get_summary_by_url(self, url: str, expiry_days: int = None) -> Optional[Dict]:
         """
-        Retrieve cached summary by URL using GSI
+        Retrieve cached summary by URL (one get_item on the URL key)
         Returns None if not found or if cache has expired
         
         Args:
@@ -67,25 +131,28 @@ class DynamoDBAdapter(DatabaseInterface):
         try:
             url_hash = self.generate_url_hash(url)
             
-            # Query using GSI on url_hash
-            response = self.table.query(
-                IndexName='url_hash-index',
-                KeyConditionExpression='url_hash = :url_hash',
-                ExpressionAttributeValues={
-                    ':url_hash': url_hash
-                },
-                Limit=1
-            )
+            response = self.table.get_item(Key={'summary_id': self.url_key(url_hash)})
+            item = response.get('Item')
+            
+            if item is None and self.legacy_url_lookup:
+                # Written before URL keys: query using GSI on url_hash
+                response = self.table.query(
+                    IndexName='url_hash-index',
+                    KeyConditionExpression='url_hash = :url_hash',
+                    ExpressionAttributeValues={
+                        ':url_hash': url_hash
+                    },
+                    Limit=1
+                )
+                item = response['Items'][0] if response['Items'] else None
             
-            if response['Items']:
-                item = response['Items'][0]
+            if item:
                 deserialized_item = self._deserialize_item(item)
                 
-                # Check if cache has expired
-                if expiry_days is not None and 'timestamp' in deserialized_item:
-                    if self.is_cache_expired(deserialized_item['timestamp'], expiry_days):
-                        print(f"⏰ Cache expired for URL: {url}")
-                        return None
+                # Check if cache has expired (TTL deletion can lag by a day or two)
+                if expiry_days is not None and self.is_summary_expired(deserialized_item, expiry_days):
+                    print(f"⏰ Cache expired for URL: {url}")
+                    return None
                 
                 return deserialized_item
             
@@ -100,39 +167,61 @@ class DynamoDBAdapter(DatabaseInterface):
         """
         Save summary to DynamoDB
         If URL already exists, update the existing entry
+        
+        One update_item on the URL key: concurrent saves of a URL land on
+        the same item, and `id` and `created_at` are only set when missing,
+        so the summary id and creation time stay stable. ALL_OLD tells us whether the item existed and what
+        its id is. While legacy_url_lookup is on, creating an item also
+        checks url_hash-index for a pre-URL-key item and takes over its id.
         """
         try:
             url_hash = self.generate_url_hash(url)
+            key = self.url_key(url_hash)
+            timestamp = datetime.now().isoformat()
+            now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             
-            # Check if URL already exists
-            existing = self.get_summary_by_url(url)
+            update = (
+                'SET #id = if_not_exists(#id, :key), #url = :url, normalized_url = :normalized_url, '
+                'url_hash = :url_hash, short_summary = :short_summary, full_summary = :full_summary, '
+                'policy_types = :policy_types, #ts = :timestamp, recent_bucket = :recent_bucket, '
+                'created_at = if_not_exists(created_at, :now), updated_at = :now'
+            )
+            values = {
+                ':key': key,
+                ':url': url,
+                ':normalized_url': self.normalize_url(url),
+                ':url_hash': url_hash,
+                ':short_summary': short_summary,
+                ':full_summary': full_summary,
+                ':policy_types': policy_types or [],
+                ':timestamp': timestamp,
+                ':recent_bucket': recent_bucket(timestamp),
+                ':now': now
+            }
+            expires_at = self.expires_at_for_save()
+            if expires_at is not None:
+                update += f', {TTL_ATTRIBUTE} = :expires_at'
+                values[':expires_at'] = expires_at
+            else:
+                update += f' REMOVE {TTL_ATTRIBUTE}'
             
-            if existing:
-                # Update existing entry
-                summary_id = existing['id']
+            response = self.table.update_item(
+                Key={'summary_id': key},
+                UpdateExpression=update,
+                ExpressionAttributeNames={'#id': 'id', '#url': 'url', '#ts': 'timestamp'},
+                ExpressionAttributeValues=values,
+                ReturnValues='ALL_OLD'  # UPDATED_OLD may leave out an unchanged `id`
+            )
+            
+            previous = response.get('Attributes', {})
+            summary_id = previous.get('id', key)
+            if previous:
                 print(f"🔄 Updating existing summary in DynamoDB for URL: {url}")
             else:
-                # Create new entry
-                summary_id = str(uuid.uuid4())
                 print(f"✨ Creating new summary in DynamoDB for URL: {url}")
-            
-            # Prepare item
-            item = {
-                'summary_id': summary_id,
-                'url': url,
-                'normalized_url': self.normalize_url(url),
-                'url_hash': url_hash,
-                'short_summary': short_summary,
-                'full_summary': full_summary,
-                'policy_types': policy_types or [],
-                'timestamp': datetime.now().isoformat(),
-                'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'id': summary_id  # For compatibility with frontend
-            }
-            
-            # Save to DynamoDB
-            self.table.put_item(Item=item)
+                self._count_summaries(1)
+                if self.legacy_url_lookup:
+                    summary_id = self._adopt_legacy_item(url_hash, key) or summary_id
             
             return summary_id
             
@@ -140,15 +229,116 @@ class DynamoDBAdapter(DatabaseInterface):
             print(f"Error saving to DynamoDB: {e}")
             raise
     
+    def _adopt_legacy_item(self, url_hash: str, key: str) -> Optional[str]:
+        """
+        Give the item at `key` the id of the URL's pre-URL-key item and turn
+        that item into an alias stub; returns the adopted id, if any
+        """
+        response = self.table.query(
+            IndexName='url_hash-index',
+            KeyConditionExpression='url_hash = :url_hash',
+            ExpressionAttributeValues={':url_hash': url_hash}
+        )
+        legacy = [item for item in response['Items'] if item['summary_id'] != key]
+        if not legacy:
+            return None
+        old_id = legacy[0].get('id', legacy[0]['summary_id'])
+        update, values = 'SET #id = :old_id', {':old_id': old_id}
+        if legacy[0].get('created_at'):
+            update += ', created_at = :created_at'
+            values[':created_at'] = legacy[0]['created_at']
+        self.table.update_item(
+            Key={'summary_id': key},
+            UpdateExpression=update,
+            ExpressionAttributeNames={'#id': 'id'},
+            ExpressionAttributeValues=values
+        )
+        for item in legacy:
+            self.table.put_item(Item={'summary_id': item['summary_id'], 'alias_of': key})
+        self._count_summaries(-len(legacy))
+        return old_id
+    
+    def _count_summaries(self, delta: int):
+        """Adjust the summary counter (only once recount_summaries has created it)"""
+        try:
+            self.table.update_item(
+                Key={'summary_id': STATS_KEY},
+                UpdateExpression='ADD total_summaries :delta',
+                ConditionExpression='attribute_exists(summary_id)',
+                ExpressionAttributeValues={':delta': delta}
+            )
+        except self.table.meta.client.exceptions.ConditionalCheckFailedException:
+            pass
+        except Exception as e:
+            print(f"⚠️  Could not update summary counter: {e}")
+    
+    def recount_summaries(self) -> int:
+        """
+        Count summaries with a full (paginated) scan and correct the counter
+        item; run once for tables created before the counter, or to repair
+        drift (e.g. items DynamoDB TTL deleted). The correction is added as
+        a delta against the counter read before the scan, so saves and
+        deletes counted meanwhile are kept rather than overwritten.
+        """
+        before = self.table.get_item(Key={'summary_id': STATS_KEY}, ConsistentRead=True).get('Item')
+        total = 0
+        oldest = None
+        params = {
+            'ProjectionExpression': 'recent_bucket',
+            'FilterExpression': 'attribute_exists(#url) AND attribute_not_exists(alias_of)',
+            'ExpressionAttributeNames': {'#url': 'url'}
+        }
+        while True:
+            response = self.table.scan(**params)
+            total += response.get('Count', 0)
+            for item in response.get('Items', []):
+                bucket = item.get('recent_bucket')
+                if bucket and (oldest is None or bucket < oldest):
+                    oldest = bucket
+            if 'LastEvaluatedKey' not in response:
+                break
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        
+        counted_at = datetime.now().isoformat()
+        oldest = oldest or recent_bucket(counted_at)
+        self._oldest_bucket = (oldest, time.monotonic())
+        if before is None:
+            try:
+                self.table.put_item(
+                    Item={'summary_id': STATS_KEY, 'total_summaries': total, 'counted_at': counted_at,
+                          'oldest_bucket': oldest},
+                    ConditionExpression='attribute_not_exists(summary_id)'
+                )
+                return total
+            except self.table.meta.client.exceptions.ConditionalCheckFailedException:
+                # Another recount created it meanwhile from its own scan
+                counter = self.table.get_item(Key={'summary_id': STATS_KEY}, ConsistentRead=True)['Item']
+                return int(counter['total_summaries'])
+        response = self.table.update_item(
+            Key={'summary_id': STATS_KEY},
+            UpdateExpression='ADD total_summaries :delta SET counted_at = :counted_at, oldest_bucket = :oldest',
+            ExpressionAttributeValues={
+                ':delta': total - int(before.get('total_summaries', 0)),
+                ':counted_at': counted_at,
+                ':oldest': oldest
+            },
+            ReturnValues='ALL_NEW'
+        )
+        return int(response['Attributes']['total_summaries'])
+    
     def get_summary_by_id(self, summary_id: str) -> Optional[Dict]:
-        """Retrieve summary by unique ID"""
+        """Retrieve summary by unique ID (follows the alias stub of a migrated id)"""
         try:
             response = self.table.get_item(
                 Key={'summary_id': summary_id}
             )
+            item = response.get('Item')
+            
+            if item and 'alias_of' in item:
+                item = self.table.get_item(Key={'summary_id': item['alias_of']}).get('Item')
             
-            if 'Item' in response:
-                return self._deserialize_item(response['Item'])
+            if item:
+                return self._deserialize_item(item)
             
             return None
             
@@ -156,43 +346,231 @@ class DynamoDBAdapter(DatabaseInterface):
             print(f"Error retrieving from DynamoDB: {e}")
             return None
     
+    @staticmethod
+    def recency_key(summary: Dict) -> Tuple[str, str]:
+        """(timestamp, item key): the cursor becomes a recent-index ExclusiveStartKey"""
+        return (summary.get('timestamp', ''), summary.get('summary_id', summary.get('id', '')))
+    
     def get_recent(self, limit: int = 10) -> List[Dict]:
+        """Get most recent summaries"""
+        return self.get_recent_page(limit)[0]
+    
+    def get_recent_page(self, limit: int = 10, cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
         """
-        Get most recent summaries
-        Uses scan with filtering (not efficient for large datasets)
-        Consider adding a sort key or separate GSI for production
+        Newest summaries first via the recent-index GSI
+        
+        Queries month partitions newest to oldest, each in descending
+        timestamp order, until the page is full or the oldest month holding
+        summaries (oldest_bucket in the stats item) has been read. A cursor
+        resumes inside its month with ExclusiveStartKey. Items saved before
+        the index existed only show up after backfill_recent_index().
         """
+        if cursor:
+            timestamp, summary_id = self.decode_recent_cursor(cursor)
+            bucket = recent_bucket(timestamp)
+            start_key = {'summary_id': summary_id, 'recent_bucket': bucket, 'timestamp': timestamp}
+        else:
+            bucket = recent_bucket(datetime.now().isoformat())
+            start_key = None
+        
+        items = []
         try:
-            response = self.table.scan(
-                Limit=limit * 2  # Get extra to sort properly
-            )
-            
-            items = response.get('Items', [])
-            
-            # Sort by timestamp
-            sorted_items = sorted(
-                items,
-                key=lambda x: x.get('timestamp', ''),
-                reverse=True
-            )[:limit]
-            
-            return [self._deserialize_item(item) for item in sorted_items]
-            
+            oldest = self.oldest_bucket()
+            for _ in range(self.recent_max_buckets):
+                while len(items) < limit:
+                    params = {
+                        'IndexName': RECENT_INDEX,
+                        'KeyConditionExpression': 'recent_bucket = :bucket',
+                        'ExpressionAttributeValues': {':bucket': bucket},
+                        'ScanIndexForward': False,
+                        'Limit': limit - len(items)
+                    }
+                    if start_key:
+                        params['ExclusiveStartKey'] = start_key
+                    response = self.table.query(**params)
+                    items.extend(response.get('Items', []))
+                    start_key = response.get('LastEvaluatedKey')
+                    if not start_key:
+                        break
+                if len(items) >= limit or (oldest is not None and bucket <= oldest):
+                    break
+                bucket = previous_bucket(bucket)
+                start_key = None
         except Exception as e:
-            print(f"Error scanning DynamoDB: {e}")
-            return []
+            print(f"Error querying DynamoDB recent-index: {e}")
+            return [], None
+        
+        return self.recent_page([self._deserialize_item(item) for item in items], limit)
+    
+    def oldest_bucket(self) -> Optional[str]:
+        """
+        Oldest month that may hold summaries, from the stats item (re-read
+        every 5 minutes); None until recount_summaries or
+        backfill_recent_index has recorded it. New saves never need to
+        move it: they always land in the current month.
+        """
+        if self._oldest_bucket is None or time.monotonic() - self._oldest_bucket[1] > 300:
+            counter = self.table.get_item(Key={'summary_id': STATS_KEY}).get('Item') or {}
+            self._oldest_bucket = (counter.get('oldest_bucket'), time.monotonic())
+        return self._oldest_bucket[0]
+    
+    def _record_oldest_bucket(self, bucket: Optional[str]):
+        """Store the oldest month found by a full scan (only once the stats item exists)"""
+        bucket = bucket or recent_bucket(datetime.now().isoformat())
+        try:
+            self.table.update_item(
+                Key={'summary_id': STATS_KEY},
+                UpdateExpression='SET oldest_bucket = :bucket',
+                ConditionExpression='attribute_exists(summary_id)',
+                ExpressionAttributeValues={':bucket': bucket}
+            )
+            self._oldest_bucket = (bucket, time.monotonic())
+        except self.table.meta.client.exceptions.ConditionalCheckFailedException:
+            pass
+    
+    def backfill_recent_index(self) -> int:
+        """Set recent_bucket on items saved before recent-index existed; returns items updated"""
+        updated = 0
+        oldest = None
+        params = {
+            'ProjectionExpression': 'summary_id, #ts, recent_bucket',
+            'ExpressionAttributeNames': {'#ts': 'timestamp'}
+        }
+        while True:
+            response = self.table.scan(**params)
+            for item in response.get('Items', []):
+                bucket = item.get('recent_bucket') or (item.get('timestamp') and recent_bucket(item['timestamp']))
+                if bucket and (oldest is None or bucket < oldest):
+                    oldest = bucket
+                if 'recent_bucket' in item or not item.get('timestamp'):
+                    continue
+                self.table.update_item(
+                    Key={'summary_id': item['summary_id']},
+                    UpdateExpression='SET recent_bucket = :bucket',
+                    ExpressionAttributeValues={':bucket': recent_bucket(item['timestamp'])}
+                )
+                updated += 1
+            if 'LastEvaluatedKey' not in response:
+                self._record_oldest_bucket(oldest)
+                return updated
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    
+    def backfill_expiry(self) -> int:
+        """Set expires_at (timestamp + ttl_days) on summaries saved without it; returns items updated"""
+        if self.ttl_days is None:
+            return 0
+        updated = 0
+        params = {
+            'ProjectionExpression': 'summary_id, #ts, #ttl',
+            'ExpressionAttributeNames': {'#ts': 'timestamp', '#ttl': TTL_ATTRIBUTE}
+        }
+        while True:
+            response = self.table.scan(**params)
+            for item in response.get('Items', []):
+                if TTL_ATTRIBUTE in item or not item.get('timestamp'):
+                    continue
+                try:
+                    saved = datetime.fromisoformat(item['timestamp']).timestamp()
+                except ValueError:
+                    continue
+                self.table.update_item(
+                    Key={'summary_id': item['summary_id']},
+                    UpdateExpression=f'SET {TTL_ATTRIBUTE} = :expires_at',
+                    ExpressionAttributeValues={':expires_at': int(saved + self.ttl_days * 86400)}
+                )
+                updated += 1
+            if 'LastEvaluatedKey' not in response:
+                return updated
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    
+    def sweep_expired(self) -> int:
+        """
+        DynamoDB TTL deletes expired items itself, so there is nothing to do
+        here and the table is never scanned. TTL deletions are not
+        subtracted from the summary counter; run
+        `setup_dynamodb.py --recount-stats` periodically to correct it.
+        """
+        return 0
     
     def delete_summary(self, summary_id: str) -> bool:
-        """Delete a summary"""
+        """Delete a summary (and its alias stub or target)"""
         try:
-            self.table.delete_item(
-                Key={'summary_id': summary_id}
+            response = self.table.delete_item(
+                Key={'summary_id': summary_id},
+                ReturnValues='ALL_OLD'
             )
+            old = response.get('Attributes', {})
+            removed = 1 if 'url' in old else 0
+            # Migrated summary: the id was an alias stub, or the item had an alias
+            linked = old.get('alias_of') or (old.get('id') if old.get('id') not in (None, summary_id) else None)
+            if linked:
+                response = self.table.delete_item(Key={'summary_id': linked}, ReturnValues='ALL_OLD')
+                removed += 1 if 'url' in response.get('Attributes', {}) else 0
+            if removed:
+                self._count_summaries(-removed)
             return True
         except Exception as e:
             print(f"Error deleting from DynamoDB: {e}")
             return False
     
+    def delete_summary_by_url(self, url: str) -> bool:
+        """Delete a summary by URL (for cache clearing)"""
+        cached = self.get_summary_by_url(url)
+        if cached:
+            return self.delete_summary(cached['summary_id'])
+        return False
+    
+    def migrate_to_url_keys(self) -> Dict:
+        """
+        Move items written before URL keys to their URL key
+        
+        Each old item is copied to url_key(url_hash), keeping its `id`, unless
+        a newer save for that URL is already there. Then the old item is
+        replaced with an alias stub. Safe to re-run after an interruption.
+        Recounts summaries at the end.
+        
+        Returns:
+            {'migrated': n, 'superseded': n, 'skipped': n}
+        """
+        counts = {'migrated': 0, 'superseded': 0, 'skipped': 0}
+        params = {}
+        while True:
+            response = self.table.scan(**params)
+            for item in response.get('Items', []):
+                if 'alias_of' in item or not item.get('url'):
+                    continue
+                key = self.url_key(self.generate_url_hash(item['url']))
+                if item['summary_id'] == key:
+                    counts['skipped'] += 1
+                    continue
+                
+                old_id = item.get('id', item['summary_id'])
+                moved = dict(item, summary_id=key, id=old_id, url_hash=self.generate_url_hash(item['url']))
+                try:
+                    self.table.put_item(
+                        Item=moved,
+                        ConditionExpression='attribute_not_exists(summary_id) OR #ts < :ts',
+                        ExpressionAttributeNames={'#ts': 'timestamp'},
+                        ExpressionAttributeValues={':ts': item.get('timestamp', '')}
+                    )
+                    counts['migrated'] += 1
+                except self.table.meta.client.exceptions.ConditionalCheckFailedException:
+                    # A newer save for this URL already lives at the key: keep it, under the old id
+                    self.table.update_item(
+                        Key={'summary_id': key},
+                        UpdateExpression='SET #id = :old_id',
+                        ExpressionAttributeNames={'#id': 'id'},
+                        ExpressionAttributeValues={':old_id': old_id}
+                    )
+                    counts['superseded'] += 1
+                
+                self.table.put_item(Item={'summary_id': item['summary_id'], 'alias_of': key})
+            
+            if 'LastEvaluatedKey' not in response:
+                self.recount_summaries()
+                return counts
+            params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    
     def _deserialize_item(self, item: Dict) -> Dict:
         """
         Convert DynamoDB item to regular Python dict
@@ -209,13 +587,18 @@ class DynamoDBAdapter(DatabaseInterface):
         raise TypeError
     
     def get_cache_stats(self) -> Dict:
-        """Get statistics about cache usage"""
+        """Get statistics about cache usage (one get_item on the counter item)"""
         try:
-            # This is expensive for large tables - use CloudWatch metrics in production
-            response = self.table.scan(Select='COUNT')
+            counter = self.table.get_item(Key={'summary_id': STATS_KEY}).get('Item')
+            if counter:
+                total, source = int(counter['total_summaries']), 'counter'
+            else:
+                # No counter yet (run recount_summaries): DynamoDB's ~6-hourly item count
+                total, source = self.table.item_count, 'table_item_count'
             
             return {
-                'total_summaries': response.get('Count', 0),
+                'total_summaries': total,
+                'total_summaries_source': source,
                 'table_name': self.table_name,
                 'table_status': self.table.table_status
             }
@@ -251,6 +634,14 @@ def create_dynamodb_table(table_name='naked-policy-summaries', region_name='us-e
                 {
                     'AttributeName': 'url_hash',
                     'AttributeType': 'S'  # String
+                },
+                {
+                    'AttributeName': 'recent_bucket',
+                    'AttributeType': 'S'  # String ('YYYY-MM')
+                },
+                {
+                    'AttributeName': 'timestamp',
+                    'AttributeType': 'S'  # String (ISO)
                 }
             ],
             GlobalSecondaryIndexes=[
@@ -269,7 +660,8 @@ def create_dynamodb_table(table_name='naked-policy-summaries', region_name='us-e
                         'ReadCapacityUnits': 5,
                         'WriteCapacityUnits': 5
                     }
-                }
+                },
+                RECENT_INDEX_SCHEMA
             ],
             ProvisionedThroughput={
                 'ReadCapacityUnits': 5,
@@ -279,14 +671,89 @@ def create_dynamodb_table(table_name='naked-policy-summaries', region_name='us-e
         
         # Wait for table to be created
         table.meta.client.get_waiter('table_exists').wait(TableName=table_name)
+        table.put_item(Item={'summary_id': STATS_KEY, 'total_summaries': 0,
+                             'oldest_bucket': recent_bucket(datetime.now().isoformat())})
+        table.meta.client.update_time_to_live(
+            TableName=table_name,
+            TimeToLiveSpecification={'Enabled': True, 'AttributeName': TTL_ATTRIBUTE}
+        )
         
         print(f"✅ DynamoDB table '{table_name}' created successfully!")
         print(f"   Region: {region_name}")
         print(f"   Primary Key: summary_id")
-        print(f"   GSI: url_hash-index")
+        print(f"   GSI: url_hash-index, {RECENT_INDEX}")
+        print(f"   TTL: {TTL_ATTRIBUTE}")
         
         return table
         
     except Exception as e:
         print(f"Error creating table: {e}")
         raise
+
+
+def add_recent_index(table_name='naked-policy-summaries', region_name='us-east-1', **session_params):
+    """
+    Add the recent-index GSI to an existing table and backfill recent_bucket
+    
+    Usage:
+        from database.dynamodb_adapter import add_recent_index
+        add_recent_index()
+    """
+    dynamodb = boto3.resource('dynamodb', region_name=region_name, **session_params)
+    client = dynamodb.meta.client
+    
+    description = client.describe_table(TableName=table_name)['Table']
+    existing = [index['IndexName'] for index in description.get('GlobalSecondaryIndexes', [])]
+    if RECENT_INDEX not in existing:
+        index = dict(RECENT_INDEX_SCHEMA)
+        if description.get('BillingModeSummary', {}).get('BillingMode') == 'PAY_PER_REQUEST':
+            index.pop('ProvisionedThroughput')  # on-demand tables reject index throughput settings
+        client.update_table(
+            TableName=table_name,
+            AttributeDefinitions=[
+                {'AttributeName': 'recent_bucket', 'AttributeType': 'S'},
+                {'AttributeName': 'timestamp', 'AttributeType': 'S'}
+            ],
+            GlobalSecondaryIndexUpdates=[{'Create': index}]
+        )
+        print(f"⏳ Creating {RECENT_INDEX} on '{table_name}' (this can take several minutes)...")
+        while True:
+            indexes = client.describe_table(TableName=table_name)['Table'].get('GlobalSecondaryIndexes', [])
+            status = next((i.get('IndexStatus') for i in indexes if i['IndexName'] == RECENT_INDEX), None)
+            if status == 'ACTIVE':
+                break
+            time.sleep(10)
+    else:
+        print(f"✅ {RECENT_INDEX} already exists on '{table_name}'")
+    
+    adapter = DynamoDBAdapter(table_name=table_name, region_name=region_name, **session_params)
+    updated = adapter.backfill_recent_index()
+    print(f"✅ Backfilled recent_bucket on {updated} existing summaries")
+    return updated
+
+
+def enable_ttl(table_name='naked-policy-summaries', region_name='us-east-1', ttl_days=None, **session_params):
+    """
+    Turn on DynamoDB TTL (attribute expires_at) for an existing table and,
+    with ttl_days, stamp expires_at on items saved before it existed
+    
+    Usage:
+        from database.dynamodb_adapter import enable_ttl
+        enable_ttl(ttl_days=30)
+    """
+    client = boto3.client('dynamodb', region_name=region_name, **session_params)
+    
+    status = client.describe_time_to_live(TableName=table_name)['TimeToLiveDescription']
+    if status.get('TimeToLiveStatus') in ('ENABLED', 'ENABLING'):
+        print(f"✅ TTL already on for '{table_name}' (attribute {status.get('AttributeName')})")
+    else:
+        client.update_time_to_live(
+            TableName=table_name,
+            TimeToLiveSpecification={'Enabled': True, 'AttributeName': TTL_ATTRIBUTE}
+        )
+        print(f"✅ TTL enabled for '{table_name}' on {TTL_ATTRIBUTE}")
+    
+    adapter = DynamoDBAdapter(table_name=table_name, region_name=region_name, ttl_days=ttl_days, **session_params)
+    updated = adapter.backfill_expiry()
+    print(f"✅ Set {TTL_ATTRIBUTE} on {updated} existing summaries")
+    return updated
@@ -1,167 +1,673 @@
 """
 JSON Database Implementation
-File-based storage (current implementation)
+File-based storage: a JSON snapshot plus an append-only journal of mutations
 """
 
+import os
 import json
 import uuid
-from datetime import datetime
+import shutil
+import time
+import threading
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from .db_interface import DatabaseInterface
 
+try:
+    import fcntl  # POSIX only; without it only threads of one process are coordinated
+except ImportError:
+    fcntl = None
+
 
 class JSONDatabase(DatabaseInterface):
-    """JSON file-based database (backward compatible with summaries_db.json)"""
-    
-    def __init__(self, storage_file='summaries_db.json'):
+    """
+    JSON file-based database (backward compatible with summaries_db.json)
+
+    In journal mode (default) every save/delete appends one JSON line to
+    `<storage_file>.journal` instead of rewriting the whole file. Once the
+    journal outgrows the snapshot it is compacted in the background: the
+    current state is written to a temporary file, fsynced and atomically
+    renamed over `storage_file`. On startup the snapshot is loaded and the
+    journal replayed; a torn last line from a crash is discarded.
+
+    Journal mode off rewrites the whole file on every change (legacy mode).
+
+    Several threads and worker processes can share one database. Writes
+    and file swaps (journal rotation, snapshot rename) happen under an
+    exclusive lock on `<storage_file>.lock`, after catching up with what
+    other processes wrote. Before each read the snapshot and journal are
+    stat'ed: new journal lines are replayed from the last offset, and the
+    snapshot is only reloaded when it was replaced in a way this process
+    did not follow (legacy-mode writes, missed compactions).
+
+    A file in the flat layout written by summary_store.py is migrated on
+    load; the original is copied to `<storage_file>.legacy` first.
+
+    With ttl_days set, summaries carry an `expires_at` epoch; reads compare
+    it with the clock and sweep_expired() deletes expired summaries.
+    """
+
+    def __init__(self, storage_file='summaries_db.json', journal: bool = True,
+                 compact_ratio: float = 1.0, compact_min_kb: int = 1024, fsync: bool = False,
+                 ttl_days: Optional[int] = None):
+        """
+        Args:
+            storage_file: Snapshot file (the classic summaries_db.json)
+            journal: Append mutations to a journal instead of rewriting the file
+            compact_ratio: Compact once the journal is this large relative to the snapshot
+            compact_min_kb: ...but never before the journal reaches this size
+            fsync: fsync the journal after every write (survives power loss, slower)
+            ttl_days: Stamp saved summaries with an `expires_at` epoch this many days
+                ahead; sweep_expired() deletes them once it has passed
+        """
         self.storage_file = Path(storage_file)
-        self.data = self._load()
-    
-    def _load(self) -> Dict:
-        """Load data from JSON file"""
-        if self.storage_file.exists():
+        self.ttl_days = ttl_days
+        self.journal_file = self._sibling('.journal')
+        self._compacting_file = self._sibling('.journal.compacting')
+        self._lock_file = self._sibling('.lock')
+        self._compact_lock_file = self._sibling('.compact.lock')
+        self.journal = journal
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_kb * 1024
+        self.fsync = fsync
+
+        self._lock = threading.Lock()
+        self._pid = None
+        self._lock_fh = None
+        self._journal_fh = None
+        self._compacting = False
+        self._needs_compaction = False
+        self._stats = {'compactions': 0, 'reloads': 0, 'external_records': 0}
+
+        # What this process has applied: snapshot identity, the journal being
+        # tailed (inode + bytes read) and a rotated segment already read in full
+        self._snapshot_id = None
+        self._journal_ino = None
+        self._journal_offset = 0
+        self._journal_records = 0
+        self._segment_ino = None
+
+        if fcntl is None:
+            print("⚠️  File locking unavailable - JSON database is only safe within one process")
+
+        self.data = {'summaries': {}, 'url_index': {}}
+        # (timestamp, id) of every summary, oldest first; kept in step with self.data
+        self._recent: List[Tuple[str, str]] = []
+        with self._lock, self._file_lock():
+            self._reload()
+            if not self.journal and (self._journal_ino or self._segment_ino or self._needs_compaction):
+                # Switching back to legacy mode: fold the journal into the file once
+                self._save()
+        if self.journal and (self._needs_compaction or self._segment_ino):
+            # Migrated legacy file or an interrupted compaction: settle into one snapshot now
+            self.compact()
+
+    def _sibling(self, suffix: str) -> Path:
+        return self.storage_file.with_name(self.storage_file.name + suffix)
+
+    # ------------------------------------------------------------------
+    # Locking
+    # ------------------------------------------------------------------
+
+    def _after_fork(self):
+        """Reopen per-process handles; a forked worker must not share the parent's lock"""
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._lock_fh = open(self._lock_file, 'a') if fcntl else None
+        self._journal_fh = None
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive cross-process lock around journal appends and file swaps (caller holds self._lock)"""
+        self._after_fork()
+        if self._lock_fh is None:
+            yield
+            return
+        fcntl.flock(self._lock_fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fh, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _writing(self):
+        """Hold both locks with self.data caught up with every other writer"""
+        with self._lock, self._file_lock():
+            self._sync_locked()
+            yield
+
+    # ------------------------------------------------------------------
+    # Loading, replay and change detection
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _file_id(path: Path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _ino(path: Path) -> Optional[int]:
+        try:
+            return os.stat(path).st_ino
+        except FileNotFoundError:
+            return None
+
+    def _reload(self):
+        """Load the snapshot and replay all journal records (caller holds both locks)"""
+        self.data = self._read_snapshot()
+        self._recent = sorted(self.recency_key(summary) for summary in self.data['summaries'].values())
+        self._segment_ino = None
+        self._journal_ino = None
+        self._journal_offset = 0
+        self._journal_records = 0
+        if self._compacting_file.exists():
+            self._segment_ino = self._ino(self._compacting_file)
+            self._read_records(self._compacting_file, 0, locked=True, external=False)
+        if self.journal_file.exists():
+            self._journal_ino = self._ino(self.journal_file)
+            self._journal_offset = self._read_records(self.journal_file, 0, locked=True, external=False)
+        self._stats['reloads'] += 1
+
+    def _refresh(self):
+        """Pick up changes made by other processes (caller holds self._lock)"""
+        if self._snapshot_id == self._file_id(self.storage_file) and self._journal_ino == self._ino(self.journal_file):
+            if self._journal_ino is None:
+                return
+            try:
+                with open(self.journal_file, 'rb') as f:
+                    if os.fstat(f.fileno()).st_ino == self._journal_ino:
+                        # Lock-free tail: appends are whole lines, a partial one is still being written
+                        self._journal_offset = self._read_records(f, self._journal_offset, locked=False)
+                        return
+            except FileNotFoundError:
+                pass
+        with self._file_lock():
+            self._sync_locked()
+
+    def _sync_locked(self):
+        """Bring self.data up to date (caller holds both locks)"""
+        snapshot_id = self._file_id(self.storage_file)
+        if snapshot_id != self._snapshot_id and self._segment_ino is None:
+            # Replaced by a legacy-mode write or a compaction we did not see start
+            self._reload()
+            return
+
+        journal_ino = self._ino(self.journal_file)
+        if journal_ino != self._journal_ino:
+            if self._journal_ino is not None:
+                # Rotated by a compaction: finish the old journal, now the compacting segment
+                if self._ino(self._compacting_file) != self._journal_ino:
+                    self._reload()
+                    return
+                self._read_records(self._compacting_file, self._journal_offset, locked=True)
+                self._segment_ino = self._journal_ino
+            self._journal_ino = journal_ino
+            self._journal_offset = 0
+            self._journal_records = 0
+
+        if snapshot_id != self._snapshot_id:
+            # The new snapshot is the compaction of a segment already applied
+            self._snapshot_id = snapshot_id
+            if self._ino(self._compacting_file) != self._segment_ino:
+                self._segment_ino = None
+
+        if self._journal_ino is not None:
+            self._journal_offset = self._read_records(self.journal_file, self._journal_offset, locked=True)
+
+    def _read_snapshot(self) -> Dict:
+        if not self.storage_file.exists():
+            self._snapshot_id = None
+            return {'summaries': {}, 'url_index': {}}
+        try:
+            with open(self.storage_file, 'r', encoding='utf-8') as f:
+                st = os.fstat(f.fileno())
+                self._snapshot_id = (st.st_ino, st.st_mtime_ns, st.st_size)
+                raw = json.load(f)
+        except (OSError, ValueError) as e:
+            # Keep the unreadable file for inspection instead of overwriting it
+            corrupt = self._sibling(f".corrupt-{datetime.now().strftime('%Y%m%d%H%M%S')}")
+            print(f"⚠️  Could not read {self.storage_file} ({e}); moved to {corrupt.name}")
+            try:
+                os.replace(self.storage_file, corrupt)
+            except OSError:
+                pass
+            self._snapshot_id = None
+            return {'summaries': {}, 'url_index': {}}
+
+        legacy = {k: v for k, v in raw.items() if k not in ('summaries', 'url_index')}
+        if not legacy:
+            raw.setdefault('summaries', {})
+            raw.setdefault('url_index', {})
+            return raw
+        data = self._migrate_flat(legacy)
+        data['summaries'].update(raw.get('summaries', {}))
+        data['url_index'].update(raw.get('url_index', {}))
+        return data
+
+    def _migrate_flat(self, raw: Dict) -> Dict:
+        """Convert the flat {id: summary} layout written by summary_store.py"""
+        data = {'summaries': {}, 'url_index': {}}
+        for summary_id, summary in raw.items():
+            if not isinstance(summary, dict) or 'url' not in summary:
+                continue
+            summary = dict(summary, id=summary.get('id', summary_id))
+            summary.setdefault('normalized_url', self.normalize_url(summary['url']))
+            summary.setdefault('policy_types', [])
+            data['summaries'][summary['id']] = summary
+
+            # Newest summary wins when several share a URL
+            url_hash = self.generate_url_hash(summary['url'])
+            current = data['url_index'].get(url_hash)
+            if current and data['summaries'][current['summary_id']].get('timestamp', '') >= summary.get('timestamp', ''):
+                continue
+            data['url_index'][url_hash] = {
+                'url': summary['url'],
+                'normalized_url': summary['normalized_url'],
+                'summary_id': summary['id'],
+                'last_accessed': summary.get('timestamp', datetime.now().isoformat())
+            }
+        print(f"📦 Migrated {len(data['summaries'])} summaries from legacy format in {self.storage_file}")
+        # The snapshot rewrite that follows replaces the legacy file: keep it
+        backup = self._sibling('.legacy')
+        if not backup.exists():
+            try:
+                shutil.copy2(self.storage_file, backup)
+                print(f"📦 Legacy file kept as {backup}")
+            except OSError as e:
+                print(f"⚠️  Could not back up legacy file to {backup}: {e}")
+        self._needs_compaction = True
+        return data
+
+    def _read_records(self, source, offset: int, locked: bool, external: bool = True) -> int:
+        """
+        Apply journal records from byte offset of source (a path or open file)
+
+        Returns the offset after the last complete record. With the file
+        lock held (locked=True) nobody else is writing, so an incomplete
+        tail is a torn record from a crash and is cut off.
+        """
+        if isinstance(source, Path):
+            with open(source, 'rb') as f:
+                return self._read_records(f, offset, locked, external)
+        source.seek(offset)
+        applied = 0
+        for line in source:
+            if not line.endswith(b'\n'):
+                break
             try:
-                with open(self.storage_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return {'summaries': {}, 'url_index': {}}
-        return {'summaries': {}, 'url_index': {}}
-    
+                record = json.loads(line)
+            except ValueError:
+                break
+            self._apply(record)
+            applied += 1
+            offset += len(line)
+        self._journal_records += applied
+        if external:
+            self._stats['external_records'] += applied
+        if locked and offset < os.fstat(source.fileno()).st_size:
+            print(f"⚠️  Discarding incomplete journal record at byte {offset} of {Path(source.name).name}")
+            os.truncate(source.name, offset)
+        return offset
+
+    def _apply(self, record: Dict):
+        """Apply one journal record to self.data and the recency index (idempotent, so replaying twice is harmless)"""
+        summaries = self.data['summaries']
+        if record['op'] == 'put':
+            self._unindex_recent(summaries.get(record['id']))
+            summaries[record['id']] = record['summary']
+            insort(self._recent, self.recency_key(record['summary']))
+            self.data['url_index'][record['url_hash']] = record['index']
+        elif record['op'] == 'delete':
+            self._unindex_recent(summaries.pop(record['id'], None))
+            if record.get('url_hash'):
+                self.data['url_index'].pop(record['url_hash'], None)
+
+    def _unindex_recent(self, summary: Optional[Dict]):
+        if summary is None:
+            return
+        key = self.recency_key(summary)
+        i = bisect_left(self._recent, key)
+        if i < len(self._recent) and self._recent[i] == key:
+            del self._recent[i]
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
     def _save(self):
-        """Save data to JSON file"""
-        with open(self.storage_file, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
-    
+        """Atomically rewrite the whole JSON file (legacy mode, caller holds both locks)"""
+        self._snapshot_id = self._write_snapshot(self.data, indent=2)
+        # The journal is folded in; leaving it would replay older records over newer ones
+        for path in (self._compacting_file, self.journal_file):
+            if path.exists():
+                path.unlink()
+        self._journal_fh = None
+        self._journal_ino = None
+        self._journal_offset = 0
+        self._journal_records = 0
+        self._segment_ino = None
+
+    def _write_snapshot(self, data: Dict, indent: Optional[int] = None):
+        """Write data to a temp file, fsync it and rename it over the snapshot; returns its file id"""
+        tmp = self._sibling(f'.tmp.{os.getpid()}')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            if indent:
+                json.dump(data, f, indent=indent, ensure_ascii=False)
+            else:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.storage_file)
+        return self._file_id(self.storage_file)
+
+    def _commit(self, records: List[Dict]):
+        """Persist mutation records (caller holds both locks, via _writing)"""
+        if not self.journal:
+            self._save()
+            return
+        payload = ''.join(
+            json.dumps(r, ensure_ascii=False, separators=(',', ':')) + '\n' for r in records
+        ).encode('utf-8')
+        if self._journal_fh is None or self._journal_ino is None or \
+                os.fstat(self._journal_fh.fileno()).st_ino != self._journal_ino:
+            if self._journal_fh is not None:
+                self._journal_fh.close()
+            self._journal_fh = open(self.journal_file, 'ab')
+            if self._journal_ino is None:
+                self._journal_ino = os.fstat(self._journal_fh.fileno()).st_ino
+                self._journal_offset = 0
+        # One write per commit under the file lock, so readers only ever see whole lines appear
+        self._journal_fh.write(payload)
+        self._journal_fh.flush()
+        if self.fsync:
+            os.fsync(self._journal_fh.fileno())
+        self._journal_offset += len(payload)
+        self._journal_records += len(records)
+
+        if self._over_threshold() and not self._compacting:
+            self._compacting = True
+            threading.Thread(target=self._compact_started, daemon=True).start()
+
+    def _over_threshold(self) -> bool:
+        snapshot_bytes = self._snapshot_id[2] if self._snapshot_id else 0
+        return self._journal_offset > max(self.compact_min_bytes, self.compact_ratio * snapshot_bytes)
+
+    def compact(self) -> bool:
+        """Fold the journal into a fresh snapshot; returns False if a compaction is already running"""
+        with self._lock:
+            if self._compacting:
+                return False
+            self._compacting = True
+        return self._compact_started(force=True)
+
+    @contextmanager
+    def _compact_lock(self):
+        """Non-blocking lock held for a whole compaction; yields False if another process holds it"""
+        if fcntl is None:
+            yield True
+            return
+        with open(self._compact_lock_file, 'a') as f:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _compact_started(self, force: bool = False) -> bool:
+        try:
+            with self._compact_lock() as acquired:
+                if not acquired:
+                    return False
+                with self._writing():
+                    if not force and not self._over_threshold():
+                        return False  # another process compacted first
+                    # Rotate the journal so writes continue while the snapshot is written.
+                    # Summary and index entries are replaced, never mutated, so shallow
+                    # copies are a consistent view.
+                    if self._journal_fh is not None:
+                        self._journal_fh.close()
+                        self._journal_fh = None
+                    if self.journal_file.exists():
+                        if self._compacting_file.exists():
+                            # Left over from an interrupted compaction (already applied);
+                            # its owner is gone or it would hold the compact lock
+                            with open(self._compacting_file, 'ab') as dst, open(self.journal_file, 'rb') as src:
+                                dst.write(src.read())
+                            self.journal_file.unlink()
+                        else:
+                            os.replace(self.journal_file, self._compacting_file)
+                    self._segment_ino = self._ino(self._compacting_file)
+                    self._journal_ino = None
+                    self._journal_offset = 0
+                    self._journal_records = 0
+                    snapshot = {
+                        'summaries': dict(self.data['summaries']),
+                        'url_index': dict(self.data['url_index'])
+                    }
+
+                tmp = self._sibling(f'.tmp.{os.getpid()}')
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                with self._lock, self._file_lock():
+                    os.replace(tmp, self.storage_file)
+                    if self._compacting_file.exists():
+                        self._compacting_file.unlink()
+                    self._snapshot_id = self._file_id(self.storage_file)
+                    self._segment_ino = None
+                    self._stats['compactions'] += 1
+                return True
+        except OSError as e:
+            print(f"⚠️  Journal compaction failed: {e}")
+            return False
+        finally:
+            with self._lock:
+                self._compacting = False
+
+    def close(self):
+        """Flush and close the journal"""
+        with self._lock:
+            if self._journal_fh is not None:
+                self._journal_fh.close()
+                self._journal_fh = None
+
+    # ------------------------------------------------------------------
+    # DatabaseInterface
+    # ------------------------------------------------------------------
+
     def get_summary_by_url(self, url: str, expiry_days: int = None) -> Optional[Dict]:
         """
         Retrieve cached summary by URL
         Returns None if not found or if cache has expired
-        
+
         Args:
             url: URL to look up
             expiry_days: Number of days before cache expires (None = never expire)
         """
         url_hash = self.generate_url_hash(url)
-        
-        # Check if URL is in index
-        if url_hash not in self.data.get('url_index', {}):
-            return None
-        
-        summary_id = self.data['url_index'][url_hash]['summary_id']
-        summary = self.data['summaries'].get(summary_id)
-        
+
+        with self._lock:
+            self._refresh()
+            # Check if URL is in index
+            index_entry = self.data['url_index'].get(url_hash)
+            if not index_entry:
+                return None
+            summary = self.data['summaries'].get(index_entry['summary_id'])
+
         if not summary:
             return None
-        
+
         # Check if cache has expired
-        if expiry_days is not None and 'timestamp' in summary:
-            if self.is_cache_expired(summary['timestamp'], expiry_days):
-                print(f"⏰ Cache expired for URL: {url}")
-                return None
-        
+        if expiry_days is not None and self.is_summary_expired(summary, expiry_days):
+            print(f"⏰ Cache expired for URL: {url}")
+            return None
+
         return summary
-    
-    def save_summary(self, url: str, short_summary: str, full_summary: str, 
+
+    def save_summary(self, url: str, short_summary: str, full_summary: str,
                     policy_types: List[str] = None) -> str:
         """
         Save summary with URL indexing for caching
         If URL already exists, update the existing entry
         """
         url_hash = self.generate_url_hash(url)
-        
-        # Check if URL already exists
-        if url_hash in self.data.get('url_index', {}):
-            # Update existing entry
-            summary_id = self.data['url_index'][url_hash]['summary_id']
-            print(f"🔄 Updating existing summary for URL: {url}")
-        else:
-            # Create new entry
-            summary_id = str(uuid.uuid4())
-            print(f"✨ Creating new summary for URL: {url}")
-        
-        # Ensure data structure exists
-        if 'summaries' not in self.data:
-            self.data['summaries'] = {}
-        if 'url_index' not in self.data:
-            self.data['url_index'] = {}
-        
-        # Save summary data
-        self.data['summaries'][summary_id] = {
-            'id': summary_id,
-            'url': url,
-            'normalized_url': self.normalize_url(url),
-            'short_summary': short_summary,
-            'full_summary': full_summary,
-            'policy_types': policy_types or [],
-            'timestamp': datetime.now().isoformat(),
-            'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-        
-        # Update URL index for fast lookups
-        self.data['url_index'][url_hash] = {
-            'url': url,
-            'normalized_url': self.normalize_url(url),
-            'summary_id': summary_id,
-            'last_accessed': datetime.now().isoformat()
-        }
-        
-        self._save()
+
+        with self._writing():
+            # Check if URL already exists
+            if url_hash in self.data['url_index']:
+                # Update existing entry
+                summary_id = self.data['url_index'][url_hash]['summary_id']
+                print(f"🔄 Updating existing summary for URL: {url}")
+            else:
+                # Create new entry
+                summary_id = str(uuid.uuid4())
+                print(f"✨ Creating new summary for URL: {url}")
+
+            # Save summary data
+            summary = {
+                'id': summary_id,
+                'url': url,
+                'normalized_url': self.normalize_url(url),
+                'short_summary': short_summary,
+                'full_summary': full_summary,
+                'policy_types': policy_types or [],
+                'timestamp': datetime.now().isoformat(),
+                'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+            expires_at = self.expires_at_for_save()
+            if expires_at is not None:
+                summary['expires_at'] = expires_at
+
+            # Update URL index for fast lookups
+            index_entry = {
+                'url': url,
+                'normalized_url': self.normalize_url(url),
+                'summary_id': summary_id,
+                'last_accessed': datetime.now().isoformat()
+            }
+
+            record = {'op': 'put', 'id': summary_id, 'summary': summary,
+                      'url_hash': url_hash, 'index': index_entry}
+            self._apply(record)
+            self._commit([record])
         return summary_id
-    
+
     def get_summary_by_id(self, summary_id: str) -> Optional[Dict]:
         """Retrieve summary by unique ID"""
-        return self.data['summaries'].get(summary_id)
-    
+        with self._lock:
+            self._refresh()
+            return self.data['summaries'].get(summary_id)
+
     def get_recent(self, limit: int = 10) -> List[Dict]:
         """Get most recent summaries"""
-        sorted_summaries = sorted(
-            self.data['summaries'].values(),
-            key=lambda x: x.get('timestamp', ''),
-            reverse=True
-        )
-        return sorted_summaries[:limit]
-    
+        return self.get_recent_page(limit)[0]
+
+    def get_recent_page(self, limit: int = 10, cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """Newest summaries first, read off the end of the recency index (O(limit))"""
+        after = self.decode_recent_cursor(cursor) if cursor else None
+        with self._lock:
+            self._refresh()
+            end = bisect_left(self._recent, after) if after else len(self._recent)
+            keys = self._recent[max(0, end - limit):end]
+            summaries = [self.data['summaries'][summary_id] for _, summary_id in reversed(keys)]
+        return self.recent_page(summaries, limit)
+
+    def _delete_record(self, summary_id: str) -> Dict:
+        """Journal record removing a summary and its URL index entry"""
+        url_hash = self.generate_url_hash(self.data['summaries'][summary_id]['url'])
+        indexed = self.data['url_index'].get(url_hash, {}).get('summary_id') == summary_id
+        return {'op': 'delete', 'id': summary_id, 'url_hash': url_hash if indexed else None}
+
     def delete_summary(self, summary_id: str) -> bool:
         """Delete a summary and its URL index"""
-        if summary_id in self.data['summaries']:
-            # Find and remove from URL index
-            summary = self.data['summaries'][summary_id]
-            url_hash = self.generate_url_hash(summary['url'])
-            if url_hash in self.data.get('url_index', {}):
-                del self.data['url_index'][url_hash]
-            
-            # Remove summary
-            del self.data['summaries'][summary_id]
-            self._save()
-            return True
-        return False
-    
+        with self._writing():
+            if summary_id not in self.data['summaries']:
+                return False
+            record = self._delete_record(summary_id)
+            self._apply(record)
+            self._commit([record])
+        return True
+
     def clear_old(self, days: int = 30) -> int:
-        """Clear summaries older than specified days"""
-        from datetime import timedelta
+        """Clear summaries older than specified days (one write for the whole batch)"""
         cutoff = datetime.now() - timedelta(days=days)
-        
-        to_delete = []
-        for sid, summary in self.data['summaries'].items():
-            try:
-                timestamp = datetime.fromisoformat(summary['timestamp'])
-                if timestamp < cutoff:
-                    to_delete.append(sid)
-            except:
-                continue
-        
-        for sid in to_delete:
-            self.delete_summary(sid)
-        
+
+        with self._writing():
+            to_delete = []
+            for sid, summary in self.data['summaries'].items():
+                try:
+                    timestamp = datetime.fromisoformat(summary['timestamp'])
+                    if timestamp < cutoff:
+                        to_delete.append(sid)
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+            records = []
+            for sid in to_delete:
+                record = self._delete_record(sid)
+                self._apply(record)
+                records.append(record)
+            if records:
+                self._commit(records)
+
         return len(to_delete)
-    
+
+    def sweep_expired(self) -> int:
+        """
+        Delete summaries whose `expires_at` has passed (one journal write for
+        the whole batch). With ttl_days set, summaries saved before
+        `expires_at` existed are swept by their timestamp.
+        """
+        now = time.time()
+        cutoff = (datetime.now() - timedelta(days=self.ttl_days)).isoformat() if self.ttl_days is not None else None
+
+        with self._writing():
+            records = []
+            for sid, summary in self.data['summaries'].items():
+                expires_at = summary.get('expires_at')
+                if expires_at is not None:
+                    expired = expires_at <= now
+                else:
+                    # ISO timestamps of one format order like the times they represent
+                    expired = cutoff is not None and summary.get('timestamp', cutoff) < cutoff
+                if expired:
+                    records.append(self._delete_record(sid))
+            for record in records:
+                self._apply(record)
+            if records:
+                self._commit(records)
+        return len(records)
+
     def get_cache_stats(self) -> Dict:
         """Get statistics about cache usage"""
-        return {
-            'total_summaries': len(self.data['summaries']),
-            'total_urls': len(self.data.get('url_index', {})),
-            'storage_file': str(self.storage_file),
-            'file_size_kb': self.storage_file.stat().st_size / 1024 if self.storage_file.exists() else 0
-        }
+        with self._lock:
+            self._refresh()
+            stats = {
+                'total_summaries': len(self.data['summaries']),
+                'total_urls': len(self.data['url_index']),
+                'storage_file': str(self.storage_file),
+                'file_size_kb': self._snapshot_id[2] / 1024 if self._snapshot_id else 0,
+                'storage_engine': 'journal' if self.journal else 'snapshot',
+                'process_safe': fcntl is not None,
+                'reloads': self._stats['reloads'],
+                'external_records': self._stats['external_records']
+            }
+            if self.journal:
+                stats['journal_size_kb'] = round(self._journal_offset / 1024, 1)
+                stats['journal_records'] = self._journal_records
+                stats['compactions'] = self._stats['compactions']
+        return stats
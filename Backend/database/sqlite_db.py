@@ -0,0 +1,343 @@
+"""
+SQLite Database Implementation
+Single-file storage with indexed lookups, shared safely by several worker processes
+"""
+
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Dict, List, Iterable, Tuple
+from .db_interface import DatabaseInterface
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    normalized_url TEXT NOT NULL,
+    url_hash TEXT NOT NULL UNIQUE,
+    short_summary TEXT,
+    full_summary TEXT,
+    policy_types TEXT NOT NULL DEFAULT '[]',
+    timestamp TEXT NOT NULL,
+    created_at TEXT,
+    updated_at TEXT,
+    expires_at INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_recent ON summaries (timestamp, id);
+DROP INDEX IF EXISTS idx_summaries_timestamp;
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Row count kept by triggers, so stats never run COUNT(*). Seeded and
+# created in one write transaction, so no save can slip in between.
+COUNTER_SCHEMA = """
+BEGIN IMMEDIATE;
+INSERT OR IGNORE INTO counters (name, value) SELECT 'summaries', COUNT(*) FROM summaries;
+CREATE TRIGGER IF NOT EXISTS summaries_count_insert AFTER INSERT ON summaries
+BEGIN UPDATE counters SET value = value + 1 WHERE name = 'summaries'; END;
+CREATE TRIGGER IF NOT EXISTS summaries_count_delete AFTER DELETE ON summaries
+BEGIN UPDATE counters SET value = value - 1 WHERE name = 'summaries'; END;
+COMMIT;
+"""
+
+COLUMNS = ('id', 'url', 'normalized_url', 'url_hash', 'short_summary', 'full_summary',
+           'policy_types', 'timestamp', 'created_at', 'updated_at', 'expires_at')
+
+# Created after SCHEMA, once older databases have the expires_at column
+EXPIRY_INDEX = 'CREATE INDEX IF NOT EXISTS idx_summaries_expires ON summaries (expires_at)'
+
+SYNCHRONOUS_LEVELS = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+# Rows per transaction when importing
+IMPORT_BATCH_SIZE = 500
+
+
+class SQLiteDatabase(DatabaseInterface):
+    """
+    SQLite database implementation with URL-based caching
+
+    Rows live on disk and are looked up through indexes (id primary key,
+    unique url_hash, (timestamp, id)), so startup does not load the whole cache
+    into memory. The database runs in WAL mode: readers in other threads
+    and gunicorn workers are never blocked by a writer, and writers wait
+    up to busy_timeout_ms for each other. Expiry and recency are evaluated
+    in SQL, and triggers keep the row count in `counters` for stats. With
+    ttl_days set, rows carry an `expires_at` epoch and sweep_expired()
+    deletes the expired ones through an index.
+
+    Each thread (and each process after a fork) opens its own connection.
+    """
+
+    def __init__(self, db_file='summaries.db', busy_timeout_ms: int = 5000, synchronous: str = 'NORMAL',
+                 ttl_days: Optional[int] = None):
+        """
+        Args:
+            db_file: SQLite database file (created if missing)
+            busy_timeout_ms: How long a writer waits for another writer's lock
+            synchronous: PRAGMA synchronous level; NORMAL is safe in WAL mode
+                and only loses the last commits on power loss, FULL syncs every commit
+            ttl_days: Stamp saved rows with an `expires_at` epoch this many days
+                ahead; sweep_expired() deletes them once it has passed
+        """
+        if synchronous.upper() not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"synchronous must be one of {', '.join(SYNCHRONOUS_LEVELS)}, got {synchronous!r}")
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.busy_timeout_ms = busy_timeout_ms
+        self.synchronous = synchronous.upper()
+        self.ttl_days = ttl_days
+        self._local = threading.local()
+
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        columns = {row['name'] for row in conn.execute('PRAGMA table_info(summaries)')}
+        if 'expires_at' not in columns:
+            try:
+                conn.execute('ALTER TABLE summaries ADD COLUMN expires_at INTEGER')
+            except sqlite3.OperationalError:
+                pass  # another worker added it first
+        conn.execute(EXPIRY_INDEX)
+        conn.executescript(COUNTER_SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connection for the current thread, reopened after a fork"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        # isolation_level=None: explicit BEGIN/COMMIT, no implicit transactions
+        conn = sqlite3.connect(str(self.db_file), timeout=self.busy_timeout_ms / 1000, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(f'PRAGMA synchronous={self.synchronous}')
+        conn.execute(f'PRAGMA busy_timeout={int(self.busy_timeout_ms)}')
+        # Rows removed by INSERT OR REPLACE must fire the delete trigger too
+        conn.execute('PRAGMA recursive_triggers=ON')
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Write transaction; BEGIN IMMEDIATE takes the write lock up front so read-then-write cannot race"""
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def close(self):
+        """Close this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict:
+        summary = dict(row)
+        summary.pop('url_hash', None)
+        try:
+            summary['policy_types'] = json.loads(summary.get('policy_types') or '[]')
+        except ValueError:
+            summary['policy_types'] = []
+        return summary
+
+    def _row_values(self, summary: Dict) -> tuple:
+        """Column values for a summary dict (as stored by the JSON database)"""
+        timestamp = summary.get('timestamp') or datetime.now().isoformat()
+        expires_at = summary.get('expires_at')
+        if expires_at is None and self.ttl_days is not None:
+            try:
+                expires_at = int(datetime.fromisoformat(timestamp).timestamp() + self.ttl_days * 86400)
+            except ValueError:
+                pass
+        return (
+            summary['id'],
+            summary['url'],
+            summary.get('normalized_url') or self.normalize_url(summary['url']),
+            self.generate_url_hash(summary['url']),
+            summary.get('short_summary'),
+            summary.get('full_summary'),
+            json.dumps(summary.get('policy_types') or []),
+            timestamp,
+            summary.get('created_at'),
+            summary.get('updated_at'),
+            expires_at,
+        )
+
+    # ------------------------------------------------------------------
+    # DatabaseInterface
+    # ------------------------------------------------------------------
+
+    def get_summary_by_url(self, url: str, expiry_days: int = None) -> Optional[Dict]:
+        """
+        Retrieve cached summary by URL
+        Returns None if not found or if cache has expired
+
+        Args:
+            url: URL to look up
+            expiry_days: Number of days before cache expires (None = never expire)
+        """
+        url_hash = self.generate_url_hash(url)
+        if expiry_days is None:
+            row = self._connect().execute(
+                'SELECT * FROM summaries WHERE url_hash = ?', (url_hash,)
+            ).fetchone()
+        else:
+            # Rows saved before expires_at existed fall back to their timestamp
+            cutoff = (datetime.now() - timedelta(days=expiry_days)).isoformat()
+            row = self._connect().execute(
+                'SELECT * FROM summaries WHERE url_hash = ? '
+                'AND (expires_at > ? OR (expires_at IS NULL AND timestamp >= ?))',
+                (url_hash, int(time.time()), cutoff)
+            ).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def save_summary(self, url: str, short_summary: str, full_summary: str,
+                    policy_types: List[str] = None) -> str:
+        """
+        Save summary with URL indexing for caching
+        If URL already exists, update the existing entry
+        """
+        url_hash = self.generate_url_hash(url)
+        now = datetime.now()
+
+        with self._transaction() as conn:
+            row = conn.execute('SELECT id FROM summaries WHERE url_hash = ?', (url_hash,)).fetchone()
+            if row:
+                summary_id = row['id']
+                print(f"🔄 Updating existing summary for URL: {url}")
+            else:
+                summary_id = str(uuid.uuid4())
+                print(f"✨ Creating new summary for URL: {url}")
+
+            conn.execute(
+                f"INSERT OR REPLACE INTO summaries ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                (summary_id, url, self.normalize_url(url), url_hash, short_summary, full_summary,
+                 json.dumps(policy_types or []), now.isoformat(),
+                 now.strftime('%Y-%m-%d %H:%M:%S'), now.strftime('%Y-%m-%d %H:%M:%S'),
+                 self.expires_at_for_save())
+            )
+        return summary_id
+
+    def get_summary_by_id(self, summary_id: str) -> Optional[Dict]:
+        """Retrieve summary by unique ID"""
+        row = self._connect().execute('SELECT * FROM summaries WHERE id = ?', (summary_id,)).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def get_recent(self, limit: int = 10) -> List[Dict]:
+        """Get most recent summaries"""
+        return self.get_recent_page(limit)[0]
+
+    def get_recent_page(self, limit: int = 10, cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """Newest summaries first, walking the (timestamp, id) index backwards from the cursor"""
+        if cursor:
+            timestamp, summary_id = self.decode_recent_cursor(cursor)
+            rows = self._connect().execute(
+                'SELECT * FROM summaries WHERE (timestamp, id) < (?, ?) ORDER BY timestamp DESC, id DESC LIMIT ?',
+                (timestamp, summary_id, limit)
+            ).fetchall()
+        else:
+            rows = self._connect().execute(
+                'SELECT * FROM summaries ORDER BY timestamp DESC, id DESC LIMIT ?', (limit,)
+            ).fetchall()
+        return self.recent_page([self._row_to_dict(row) for row in rows], limit)
+
+    def delete_summary(self, summary_id: str) -> bool:
+        """Delete a summary"""
+        with self._transaction() as conn:
+            cursor = conn.execute('DELETE FROM summaries WHERE id = ?', (summary_id,))
+        return cursor.rowcount > 0
+
+    def delete_summary_by_url(self, url: str) -> bool:
+        """Delete a summary by URL (for cache clearing)"""
+        with self._transaction() as conn:
+            cursor = conn.execute('DELETE FROM summaries WHERE url_hash = ?', (self.generate_url_hash(url),))
+        return cursor.rowcount > 0
+
+    def clear_old(self, days: int = 30) -> int:
+        """Clear summaries older than specified days"""
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        with self._transaction() as conn:
+            cursor = conn.execute('DELETE FROM summaries WHERE timestamp < ?', (cutoff,))
+        return cursor.rowcount
+
+    def sweep_expired(self) -> int:
+        """
+        Delete rows whose `expires_at` has passed in one statement (via the
+        expires_at index). With ttl_days set, rows saved before expires_at
+        existed are swept by their timestamp.
+        """
+        if self.ttl_days is None:
+            where, params = 'expires_at <= ?', (int(time.time()),)
+        else:
+            cutoff = (datetime.now() - timedelta(days=self.ttl_days)).isoformat()
+            where = 'expires_at <= ? OR (expires_at IS NULL AND timestamp < ?)'
+            params = (int(time.time()), cutoff)
+        with self._transaction() as conn:
+            cursor = conn.execute(f'DELETE FROM summaries WHERE {where}', params)
+        return cursor.rowcount
+
+    def import_summaries(self, summaries: Iterable[Dict], replace: bool = False) -> Dict:
+        """
+        Bulk-insert summary dicts (as stored by JSONDatabase), IMPORT_BATCH_SIZE rows per transaction
+
+        Args:
+            summaries: Dicts with at least 'id' and 'url'
+            replace: Overwrite rows whose id or URL already exists (default: keep them)
+
+        Returns:
+            {'imported': n, 'skipped': n} - skipped covers existing rows and
+            older summaries of a URL that is already present
+        """
+        verb = 'INSERT OR REPLACE' if replace else 'INSERT OR IGNORE'
+        sql = f"{verb} INTO summaries ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+        rows = []
+        skipped = 0
+        for summary in summaries:
+            if isinstance(summary, dict) and summary.get('id') and summary.get('url'):
+                rows.append(self._row_values(summary))
+            else:
+                skipped += 1
+        # The newest summary of a URL must win: first in when ignoring, last in when replacing
+        rows.sort(key=lambda row: row[COLUMNS.index('timestamp')], reverse=not replace)
+
+        imported = 0
+        for start in range(0, len(rows), IMPORT_BATCH_SIZE):
+            with self._transaction() as conn:
+                # rowcount leaves out the counter triggers' updates
+                imported += conn.executemany(sql, rows[start:start + IMPORT_BATCH_SIZE]).rowcount
+        return {'imported': imported, 'skipped': skipped + len(rows) - imported}
+
+    def get_cache_stats(self) -> Dict:
+        """Get statistics about cache usage"""
+        total = self._connect().execute("SELECT value FROM counters WHERE name = 'summaries'").fetchone()[0]
+        size = sum(
+            path.stat().st_size
+            for path in (self.db_file, Path(f"{self.db_file}-wal"))
+            if path.exists()
+        )
+        return {
+            'total_summaries': total,
+            'total_urls': total,
+            'storage_file': str(self.db_file),
+            'file_size_kb': size / 1024,
+            'storage_engine': 'sqlite'
+        }
@@ -0,0 +1,66 @@
+"""
+Expiry Sweeper
+Background thread that deletes expired summaries from a database backend
+"""
+
+import threading
+from typing import Dict
+from .db_interface import DatabaseInterface
+
+
+class ExpirySweeper:
+    """
+    Calls db.sweep_expired() every interval_seconds
+
+    Each call is one batched write (a journal record for JSON, one DELETE
+    for SQLite), so expired summaries are reclaimed without read-time
+    work. Running one sweeper per worker process is fine: a second sweep
+    right after another finds nothing to delete.
+    """
+
+    def __init__(self, db: DatabaseInterface, interval_seconds: float = 3600):
+        """
+        Args:
+            db: Database to sweep
+            interval_seconds: Time between sweeps (the first runs one interval after start)
+        """
+        self.db = db
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread = None
+        self._stats = {'sweeps': 0, 'swept': 0, 'errors': 0}
+
+    def start(self):
+        """Start the background thread (once per process)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='expiry-sweeper', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background thread after its current wait"""
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            self.sweep()
+
+    def sweep(self) -> int:
+        """Sweep now; returns how many summaries were deleted"""
+        try:
+            swept = self.db.sweep_expired()
+        except Exception as e:
+            self._stats['errors'] += 1
+            print(f"⚠️  Expiry sweep failed: {e}")
+            return 0
+        self._stats['sweeps'] += 1
+        self._stats['swept'] += swept
+        if swept:
+            print(f"🧹 Swept {swept} expired summaries")
+        return swept
+
+    def stats(self) -> Dict:
+        """Sweep counters for this process"""
+        stats = dict(self._stats)
+        stats['interval_seconds'] = self.interval_seconds
+        stats['running'] = self._thread is not None and not self._stop.is_set()
+        return stats
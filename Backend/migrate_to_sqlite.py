@@ -0,0 +1,52 @@
+"""
+JSON to SQLite Migration Script
+Copies every summary from summaries_db.json (snapshot + journal) into the SQLite database
+
+Usage:
+    python migrate_to_sqlite.py
+    python migrate_to_sqlite.py --json path/to/summaries_db.json --sqlite path/to/summaries.db
+    python migrate_to_sqlite.py --replace     # overwrite summaries already in SQLite
+
+Then set DB_TYPE=sqlite in your .env file.
+"""
+
+import sys
+import argparse
+
+from config.config import Config
+from database import JSONDatabase, SQLiteDatabase
+
+
+def migrate(json_file, sqlite_file, replace=False):
+    """Import all JSON summaries into SQLite; returns the importer's counts"""
+    print(f"\n📂 Reading {json_file}")
+    source = JSONDatabase(json_file)
+    summaries = list(source.data['summaries'].values())
+    source.close()
+    print(f"   Found {len(summaries)} summaries")
+
+    print(f"🗄️  Writing to {sqlite_file}")
+    target = SQLiteDatabase(sqlite_file, ttl_days=Config.CACHE_EXPIRY_DAYS)
+    result = target.import_summaries(summaries, replace=replace)
+    print(f"✅ Imported {result['imported']} summaries ({result['skipped']} skipped)")
+    print(f"   SQLite now holds {target.get_cache_stats()['total_summaries']} summaries")
+    target.close()
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Import summaries_db.json into the SQLite database")
+    parser.add_argument('--json', default=Config.JSON_DB_FILE, help=f"JSON database (default: {Config.JSON_DB_FILE})")
+    parser.add_argument('--sqlite', default=Config.SQLITE_DB_FILE, help=f"SQLite file (default: {Config.SQLITE_DB_FILE})")
+    parser.add_argument('--replace', action='store_true', help="Overwrite summaries that already exist in SQLite")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  JSON → SQLite Migration for NakedPolicy")
+    print("=" * 60)
+    try:
+        migrate(args.json, args.sqlite, replace=args.replace)
+        print("\n📝 Set DB_TYPE=sqlite in your .env file to use it.")
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        sys.exit(1)
@@ -12,10 +12,31 @@ Ethical, production-safe policy fetcher:
 import os
 import re
 import sys
+import time
+import queue
+import atexit
+import threading
 import requests
+from typing import NamedTuple
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, TimeoutError as PWTimeoutError
+from playwright.sync_api import sync_playwright, Error as PWError, TimeoutError as PWTimeoutError
+from services.document_cache import DocumentCache
+
+try:
+    import httpx  # Optional: HTTP/2 support (pip install "httpx[http2]")
+except ImportError:
+    httpx = None
+
+try:
+    from lxml import etree as lxml_etree  # Optional: faster HTML-to-text extraction (pip install lxml)
+except ImportError:
+    lxml_etree = None
 
 
 # =========================================================
@@ -34,6 +55,48 @@ HEADERS = {
 MIN_TEXT_LEN = 500
 OUT_DIR = "policies"
 
+# Concurrent discovery
+DISCOVERY_WORKERS = 8      # parallel probes per site
+SITE_DEADLINE = 60         # seconds before giving up on a site
+
+# Shared HTTP connection pool (Tier 1)
+HTTP_POOL_HOSTS = 16                    # origins kept in the pool
+HTTP_POOL_MAXSIZE = DISCOVERY_WORKERS   # keep-alive connections per origin
+HTTP2_ENABLED = False                   # multiplex over HTTP/2 (requires httpx[http2])
+
+# Persistent document cache (conditional revalidation)
+DOC_CACHE_ENABLED = True
+DOC_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "documents")
+DOC_CACHE_MAX_MB = 100
+
+# Streaming pre-filter: decide from the first chunk whether a page is worth downloading
+PREFILTER_ENABLED = True
+PREFILTER_HEAD_BYTES = 32 * 1024          # bytes inspected for <title>, headings and meta tags
+MAX_DOCUMENT_BYTES = 8 * 1024 * 1024      # larger bodies are not policy pages
+STREAM_CHUNK_BYTES = 16 * 1024
+DRAIN_MAX_BYTES = 64 * 1024               # finish small bodies so the connection is reused
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+# Link discovery
+LINK_CANDIDATES_PER_TYPE = 3   # homepage links probed per policy type
+LINK_TEXT_MAX_LEN = 60         # longer anchor texts are prose, not footer links
+
+# Shared Playwright browser pool
+BROWSER_POOL_SIZE = 2      # warm Chromium instances
+BROWSER_MAX_PAGES = 50     # pages served before a browser is recycled
+BROWSER_JOB_TIMEOUT = SITE_DEADLINE  # seconds a caller waits for a pooled page load
+
+# Text extraction: site chrome dropped and block elements kept on their own lines
+TEXT_EXTRACTOR = "lxml"        # "lxml" (C parser) or "bs4" (html.parser); bs4 is the fallback
+MAIN_CONTENT_MIN_SHARE = 0.5   # <main>/<article> is used only if it holds this share of the text
+SKIP_TAGS = ["script", "style", "noscript", "iframe"]
+CHROME_TAGS = ["nav", "footer", "aside", "button"]
+CHROME_ROLES = ["navigation", "contentinfo", "complementary"]
+BLOCK_TAGS = [
+    "p", "div", "li", "tr", "br", "section", "article", "header", "main",
+    "h1", "h2", "h3", "h4", "h5", "h6", "dt", "dd", "blockquote", "pre", "table",
+]
+
 BOT_PHRASES = [
     "just a moment",
     "checking your browser",
@@ -44,6 +107,26 @@ BOT_PHRASES = [
     "security check",
 ]
 
+# Static fetch outcomes
+OK = "ok"
+NOT_FOUND = "not_found"            # 404 / 410
+BLOCKED = "blocked"                # 401 / 403 / 429 or a bot-check page
+TOO_SHORT = "too_short"            # rendered page, just not enough text
+JS_REQUIRED = "js_required"        # short text from a client-rendered app shell
+HTTP_ERROR = "http_error"          # any other non-200 status
+NETWORK_ERROR = "network_error"    # DNS, connection or timeout failure
+NOT_HTML = "not_html"              # PDF, image, JSON... (rejected before download)
+TOO_LARGE = "too_large"            # body over MAX_DOCUMENT_BYTES
+OFF_TOPIC = "off_topic"            # title/headings/URL show no sign of a policy page
+
+# Only these outcomes are worth a headless browser load
+ESCALATE_OUTCOMES = {JS_REQUIRED, BLOCKED}
+
+JS_SHELL_MARKERS = re.compile(
+    r'id=["\'](?:root|app|__next|__nuxt)["\']|data-reactroot|ng-app|__NEXT_DATA__|<noscript',
+    re.IGNORECASE,
+)
+
 # =========================================================
 # KEYWORDS (used for content validation)
 # =========================================================
@@ -78,6 +161,23 @@ KEYWORDS = {
     ],
 }
 
+
+def _phrase_pattern(phrases) -> re.Pattern:
+    """One case-insensitive alternation, so a document is scanned once for a whole phrase list"""
+    return re.compile("|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True)), re.IGNORECASE)
+
+
+BOT_PATTERN = _phrase_pattern(BOT_PHRASES)
+KEYWORD_PATTERNS = {policy_type: _phrase_pattern(phrases) for policy_type, phrases in KEYWORDS.items()}
+
+# Generic signs of a legal page; the pre-filter never rejects a page showing one
+POLICY_HINTS = ["legal", "policy", "policies", "agreement", "notice", "conditions", "guidelines"]
+POLICY_HINT_PATTERN = _phrase_pattern(POLICY_HINTS)
+
+
+def _has_phrase(text: str, pattern: re.Pattern | None) -> bool:
+    return pattern is not None and pattern.search(text or "") is not None
+
 # =========================================================
 # COMMON PATHS (single source of truth)
 # =========================================================
@@ -143,22 +243,91 @@ for paths in COMMON_PATHS.values():
 # UTILITIES
 # =========================================================
 
-def clean_text(html: str) -> str:
+def _normalize_text(text: str) -> str:
+    """Collapse whitespace within lines and drop blank lines"""
+    lines = (" ".join(line.split()) for line in text.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _clean_text_bs4(html: str) -> str:
     soup = BeautifulSoup(html or "", "html.parser")
-    for tag in soup(["script", "style", "noscript", "iframe"]):
+    for tag in soup(SKIP_TAGS + CHROME_TAGS):
+        tag.decompose()
+    for tag in soup.find_all(attrs={"role": CHROME_ROLES}):
         tag.decompose()
-    text = soup.get_text(" ", strip=True)
-    return re.sub(r"\s{2,}", " ", text)
+
+    region = soup
+    total = len(soup.get_text())
+    for candidate in (soup.find("main"), soup.find(attrs={"role": "main"}), soup.find("article")):
+        if candidate is not None and len(candidate.get_text()) >= MAIN_CONTENT_MIN_SHARE * total:
+            region = candidate
+            break
+
+    for tag in region.find_all(BLOCK_TAGS):
+        tag.insert_after("\n")
+    return _normalize_text(region.get_text(" ", strip=False))
+
+
+_LXML_DROP_XPATH = " | ".join(
+    [f"//{tag}" for tag in SKIP_TAGS + CHROME_TAGS]
+    + [f"//*[@role='{role}']" for role in CHROME_ROLES]
+)
+_LXML_MAIN_XPATHS = ["//main", "//*[@role='main']", "//article"]
+
+
+def _lxml_text_len(el) -> int:
+    return len(lxml_etree.tostring(el, method="text", encoding=str, with_tail=False))
+
+
+def _clean_text_lxml(html: str) -> str:
+    if not (html or "").strip():
+        return ""
+    # Plain etree elements: lxml.html's Python element classes cost ~2x on large pages
+    parser = lxml_etree.HTMLParser(remove_comments=True, remove_pis=True)
+    root = lxml_etree.fromstring(html, parser)
+    if root is None:
+        return ""
+    for el in root.xpath(_LXML_DROP_XPATH):
+        parent = el.getparent()
+        if parent is None:
+            continue
+        if el.tail:  # keep the text that follows the element
+            prev = el.getprevious()
+            if prev is not None:
+                prev.tail = (prev.tail or "") + el.tail
+            else:
+                parent.text = (parent.text or "") + el.tail
+        parent.remove(el)
+
+    region = root
+    total = _lxml_text_len(root)
+    for xpath in _LXML_MAIN_XPATHS:
+        found = root.xpath(xpath)
+        if found and _lxml_text_len(found[0]) >= MAIN_CONTENT_MIN_SHARE * total:
+            region = found[0]
+            break
+
+    for el in region.iter(BLOCK_TAGS):
+        el.tail = "\n" + (el.tail or "")
+    return _normalize_text(" ".join(region.itertext()))
+
+
+def clean_text(html: str) -> str:
+    """Visible page text, one line per block element, without site chrome"""
+    if TEXT_EXTRACTOR == "lxml" and lxml_etree is not None:
+        try:
+            return _clean_text_lxml(html)
+        except (ValueError, lxml_etree.LxmlError):
+            pass  # e.g. a str with an XML encoding declaration; html.parser copes
+    return _clean_text_bs4(html)
 
 
 def is_bot_page(text: str) -> bool:
-    lower = (text or "").lower()
-    return any(p in lower for p in BOT_PHRASES)
+    return _has_phrase(text, BOT_PATTERN)
 
 
 def contains_keywords(text: str, policy_type: str) -> bool:
-    lower = (text or "").lower()
-    return any(k in lower for k in KEYWORDS.get(policy_type, []))
+    return _has_phrase(text, KEYWORD_PATTERNS.get(policy_type))
 
 
 def safe_domain(url: str) -> str:
@@ -169,6 +338,11 @@ def save_file(domain: str, policy_type: str, text: str):
     os.makedirs(OUT_DIR, exist_ok=True)
     fname = f"{domain}_{policy_type}.txt"
     path = os.path.join(OUT_DIR, fname)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                print(f"[unchanged] {fname} ({len(text)} chars)")
+                return
     with open(path, "w", encoding="utf-8") as f:
         f.write(text)
     print(f"[saved] {fname} ({len(text)} chars)")
@@ -178,57 +352,936 @@ def save_file(domain: str, policy_type: str, text: str):
 # TIER 1 — STATIC FETCH
 # =========================================================
 
-def fetch_static(url: str) -> str | None:
-    try:
-        r = requests.get(url, headers=HEADERS, timeout=15)
-        if r.status_code != 200:
-            return None
-        text = clean_text(r.text)
-        if len(text) < MIN_TEXT_LEN or is_bot_page(text):
+class StreamedResponse:
+    """
+    HTTP response whose body is pulled on demand, so a page can be
+    rejected after its first chunk without downloading the rest.
+    """
+
+    def __init__(self, status_code: int, headers, url: str, chunks, close):
+        self.status_code = status_code
+        self.headers = headers
+        self.url = url
+        self.bytes_read = 0
+        self._chunks = chunks
+        self._close = close
+        self._buffer = bytearray()
+        self._exhausted = False
+
+    @property
+    def content_length(self) -> int | None:
+        try:
+            return int(self.headers.get("Content-Length"))
+        except (TypeError, ValueError):
             return None
-        return text
-    except Exception:
+
+    @property
+    def complete(self) -> bool:
+        return self._exhausted
+
+    def _pull(self) -> bool:
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._exhausted = True
+            return False
+        self._buffer += chunk
+        self.bytes_read += len(chunk)
+        return True
+
+    def head(self, size: int) -> bytes:
+        """First `size` bytes of the body (less if the body is shorter)"""
+        while len(self._buffer) < size and self._pull():
+            pass
+        return bytes(self._buffer[:size])
+
+    def read(self, limit: int) -> bytes | None:
+        """The whole body, or None as soon as it exceeds `limit` bytes"""
+        while len(self._buffer) <= limit and self._pull():
+            pass
+        return None if len(self._buffer) > limit else bytes(self._buffer)
+
+    def close(self, drain: int = DRAIN_MAX_BYTES):
+        """
+        Release the connection. A body known to end within `drain` more
+        bytes is read to the end so the connection goes back to the pool.
+        """
+        length = self.content_length
+        if length is not None and length <= self.bytes_read + drain:
+            start = self.bytes_read
+            while self.bytes_read - start < drain and self._pull():
+                pass
+        self._close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _no_cookie_jar() -> RequestsCookieJar:
+    """Cookie jar that rejects every cookie set by a response"""
+    jar = RequestsCookieJar()
+    jar.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return jar
+
+
+class HttpClient:
+    """
+    Connection-pooled HTTP client shared by all static fetches.
+
+    Connections are kept alive and pooled per origin, so probing dozens of
+    paths on one host only pays for DNS/TCP/TLS once. With HTTP/2 enabled
+    (and httpx installed) requests to an origin are multiplexed instead.
+    Cookies are never stored: the client is shared by every crawl in the
+    process, so a jar would grow without bound and carry one user's
+    session cookies into another user's fetches.
+    """
+
+    def __init__(self, pool_hosts: int = HTTP_POOL_HOSTS,
+                 pool_maxsize: int = HTTP_POOL_MAXSIZE, http2: bool = HTTP2_ENABLED):
+        self.http2 = bool(http2 and httpx is not None)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._http2_responses = 0
+
+        if self.http2:
+            self._client = httpx.Client(
+                http2=True,
+                headers=HEADERS,
+                follow_redirects=True,
+                cookies=httpx.Cookies(_no_cookie_jar()),
+                limits=httpx.Limits(
+                    max_connections=pool_hosts * pool_maxsize,
+                    max_keepalive_connections=pool_hosts * pool_maxsize,
+                ),
+            )
+        else:
+            self._client = requests.Session()
+            self._client.headers.update(HEADERS)
+            self._client.cookies = _no_cookie_jar()
+            adapter = HTTPAdapter(
+                pool_connections=pool_hosts,
+                pool_maxsize=pool_maxsize,
+                pool_block=True,
+            )
+            self._client.mount("http://", adapter)
+            self._client.mount("https://", adapter)
+
+    def get(self, url: str, timeout: float = 15, headers: dict | None = None):
+        """GET a URL; the response exposes status_code, headers and text"""
+        with self._lock:
+            self._requests += 1
+        r = self._client.get(url, headers=headers, timeout=timeout)
+        if self.http2 and r.http_version == "HTTP/2":
+            with self._lock:
+                self._http2_responses += 1
+        return r
+
+    def open(self, url: str, timeout: float = 15, headers: dict | None = None) -> StreamedResponse:
+        """GET a URL without reading the body yet (see StreamedResponse)"""
+        with self._lock:
+            self._requests += 1
+        if self.http2:
+            r = self._client.send(
+                self._client.build_request("GET", url, headers=headers, timeout=timeout), stream=True
+            )
+            if r.http_version == "HTTP/2":
+                with self._lock:
+                    self._http2_responses += 1
+            return StreamedResponse(r.status_code, r.headers, str(r.url),
+                                    r.iter_bytes(STREAM_CHUNK_BYTES), r.close)
+        r = self._client.get(url, headers=headers, timeout=timeout, stream=True)
+        return StreamedResponse(r.status_code, r.headers, r.url,
+                                r.iter_content(STREAM_CHUNK_BYTES), r.close)
+
+    def stats(self) -> dict:
+        """Connection reuse counters"""
+        with self._lock:
+            stats = {
+                'backend': 'httpx' if self.http2 else 'requests',
+                'requests': self._requests,
+            }
+        if self.http2:
+            stats['http2_responses'] = self._http2_responses
+            return stats
+
+        hosts = connections = pooled_requests = 0
+        for adapter in set(self._client.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                hosts += 1
+                connections += pool.num_connections
+                pooled_requests += pool.num_requests
+        stats['pooled_hosts'] = hosts
+        stats['connections_opened'] = connections
+        stats['connections_reused'] = max(pooled_requests - connections, 0)
+        return stats
+
+    def close(self):
+        self._client.close()
+
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide HTTP client, creating it on first use"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = HttpClient()
+            atexit.register(_http_client.close)
+        return _http_client
+
+
+_document_cache = None
+_document_cache_lock = threading.Lock()
+
+
+def get_document_cache() -> DocumentCache | None:
+    """Return the process-wide document cache (None when disabled)"""
+    global _document_cache
+    if not DOC_CACHE_ENABLED:
+        return None
+    with _document_cache_lock:
+        if _document_cache is None:
+            _document_cache = DocumentCache(DOC_CACHE_DIR, max_bytes=DOC_CACHE_MAX_MB * 1024 * 1024)
+        return _document_cache
+
+
+_HEAD_TITLE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_HEAD_SIGNALS = re.compile(
+    r"<h[1-3][^>]*>(.*?)</h[1-3]>"
+    r"|<meta[^>]+(?:name|property)=[\"'](?:description|og:title)[\"'][^>]*content=[\"']([^\"']*)",
+    re.IGNORECASE | re.DOTALL,
+)
+_TAG = re.compile(r"<[^>]+>")
+_HEAD_BODY = re.compile(r"<body[^>]*>(.*?)</body>", re.IGNORECASE | re.DOTALL)
+_HEAD_SCRIPTS = re.compile(r"<(script|style|noscript|template)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+# An empty <div id=...> as the first element of <body>: the page is rendered client-side
+_MOUNT_POINT = re.compile(
+    r"<body[^>]*>\s*(?:<(script|noscript)\b.*?</\1\s*>\s*)*<div\s[^>]*\bid=[\"'][^\"']+[\"'][^>]*>\s*</div>",
+    re.IGNORECASE | re.DOTALL,
+)
+_META_CHARSET = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+
+def decode_body(body: bytes, headers) -> str:
+    """Decode with the Content-Type charset, else the <meta> charset, else UTF-8"""
+    match = re.search(r"charset=[\"']?([\w.:-]+)", headers.get("Content-Type") or "", re.IGNORECASE)
+    if not match:
+        match = _META_CHARSET.search(body[:4096])
+    encoding = match.group(1) if match else "utf-8"
+    if isinstance(encoding, bytes):
+        encoding = encoding.decode("ascii", "ignore")
+    try:
+        return body.decode(encoding, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def is_app_shell(head: str) -> bool:
+    """True when the HTML is a client-side app shell: an empty root mount point or a near-empty <body>"""
+    if _MOUNT_POINT.search(head):
+        return True
+    body = _HEAD_BODY.search(head)
+    return bool(body) and len(_TAG.sub(" ", _HEAD_SCRIPTS.sub(" ", body.group(1))).strip()) < MIN_TEXT_LEN
+
+
+def prefilter_head(head: str, url: str, policy_type: str | None = None,
+                   explicit: bool = False) -> str | None:
+    """
+    Judge a page from the start of its HTML, before the body is downloaded.
+
+    Returns BLOCKED for bot-check titles, OFF_TOPIC when neither the title,
+    headings, meta description nor the URL path mention the policy type
+    and there is no other sign of a policy page (a known policy path such
+    as /conditions or /aup, or words like "legal" or "agreement"), or None
+    when the page should be fetched and parsed in full. Pages without a
+    <title> in the inspected window are never rejected. Neither are app
+    shells, whose head often carries only the site name, so the full read
+    can still escalate them to the browser; nor, with `explicit`, URLs the
+    user supplied rather than discovered candidates.
+    """
+    title = _HEAD_TITLE.search(head)
+    if not title:
+        return None
+    title_text = _TAG.sub(" ", title.group(1))
+    if is_bot_page(title_text):
+        return BLOCKED
+    if not policy_type or explicit or is_app_shell(head):
+        return None
+    signals = " ".join([title_text] + [_TAG.sub(" ", a or b) for a, b in _HEAD_SIGNALS.findall(head)])
+    parsed = urlparse(url)
+    path = parsed.path.rstrip("/").lower()
+    if _score_link(signals.lower(), path + "?" + parsed.query.lower(), policy_type):
+        return None
+    if any(path.endswith(p) for p in COMMON_PATHS.get(policy_type, [])):
+        return None
+    if _has_phrase(signals + " " + path, POLICY_HINT_PATTERN):
         return None
+    return OFF_TOPIC
+
+
+class StaticResult(NamedTuple):
+    """Outcome of a Tier 1 fetch"""
+    outcome: str
+    text: str | None = None
+    status_code: int | None = None
+
+
+def _read_static(r: StreamedResponse, url: str, policy_type: str | None,
+                 cache: DocumentCache | None, cached: dict | None,
+                 explicit: bool = False) -> tuple[StaticResult, bool]:
+    """Classify a static response, parsing it only if it passes the pre-filter"""
+    if r.status_code == 304 and cached:
+        cache.mark_validated(url)
+        return StaticResult(OK, cached['text'], r.status_code), False
+
+    if r.status_code in (404, 410):
+        return StaticResult(NOT_FOUND, status_code=r.status_code), False
+    if r.status_code in (401, 403, 429):
+        return StaticResult(BLOCKED, status_code=r.status_code), False
+    if r.status_code != 200:
+        return StaticResult(HTTP_ERROR, status_code=r.status_code), False
+
+    content_type = (r.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+    if content_type and content_type not in HTML_CONTENT_TYPES:
+        return StaticResult(NOT_HTML, status_code=r.status_code), False
+    if (r.content_length or 0) > MAX_DOCUMENT_BYTES:
+        return StaticResult(TOO_LARGE, status_code=r.status_code), False
+    if PREFILTER_ENABLED:
+        head = decode_body(r.head(PREFILTER_HEAD_BYTES), r.headers)
+        outcome = prefilter_head(head, str(r.url), policy_type, explicit)
+        if outcome:
+            return StaticResult(outcome, status_code=r.status_code), False
+    body = r.read(MAX_DOCUMENT_BYTES)
+    if body is None:
+        return StaticResult(TOO_LARGE, status_code=r.status_code), False
+    html = decode_body(body, r.headers)
+
+    started = time.thread_time()
+    try:
+        text = clean_text(html)
+    except Exception:
+        return StaticResult(HTTP_ERROR, status_code=r.status_code), False
+    _record_parse(len(body), time.thread_time() - started)
+
+    if is_bot_page(text):
+        return StaticResult(BLOCKED, status_code=r.status_code), True
+    if len(text) < MIN_TEXT_LEN:
+        outcome = JS_REQUIRED if JS_SHELL_MARKERS.search(html) else TOO_SHORT
+        return StaticResult(outcome, status_code=r.status_code), True
+    if cache:
+        cache.put(url, text, r.headers.get("ETag"), r.headers.get("Last-Modified"))
+    return StaticResult(OK, text, r.status_code), True
+
+
+def fetch_static(url: str, policy_type: str | None = None,
+                 tally: "_RequestTally | None" = None, explicit: bool = False) -> StaticResult:
+    """
+    Tier 1 fetch. The body is streamed: error statuses, non-HTML and
+    oversized responses, and pages whose first chunk shows they are a
+    bot check or (unless `explicit`) not about `policy_type` are rejected
+    without being downloaded in full or parsed.
+    """
+    cache = get_document_cache()
+    cached = cache.get(url) if cache else None
+    try:
+        r = get_http_client().open(url, timeout=15, headers=cache.conditional_headers(cached) if cached else None)
+    except Exception:
+        return StaticResult(NETWORK_ERROR)
+
+    parsed = False
+    try:
+        with r:
+            result, parsed = _read_static(r, url, policy_type, cache, cached, explicit)
+    except Exception:
+        result = StaticResult(NETWORK_ERROR, status_code=r.status_code)
+    _record_transfer(r, parsed, tally)
+    return result
+
+
+def needs_browser(result: StaticResult) -> bool:
+    """Tier escalation policy: only load a page in Playwright when rendering could help"""
+    return result.outcome in ESCALATE_OUTCOMES
 
 
 # =========================================================
 # TIER 2 — PLAYWRIGHT FALLBACK
 # =========================================================
 
+class BrowserPool:
+    """
+    Keeps warm Chromium instances alive across requests.
+
+    Playwright's sync API is bound to the thread that started it, so each
+    browser is owned by a dedicated worker thread that takes jobs from a
+    shared queue. Every job gets a fresh, isolated browser context.
+    Browsers are relaunched after `max_pages` pages or when they crash.
+    Worker threads that died, or that belong to the parent of a forked
+    worker process, are started again on the next submit.
+    """
+
+    def __init__(self, size: int = BROWSER_POOL_SIZE,
+                 max_pages: int = BROWSER_MAX_PAGES, headless: bool = True):
+        self.size = size
+        self.max_pages = max_pages
+        self.headless = headless
+        self._jobs = queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._stats = {
+            'browsers_alive': 0,
+            'busy': 0,
+            'pages_served': 0,
+            'launches': 0,
+            'recycled': 0,
+            'crashes': 0,
+        }
+
+    def _ensure_started(self):
+        if self._pid != os.getpid():
+            # Forked: the parent's threads, browsers and lock state did not come along
+            self._pid = os.getpid()
+            self._lock = threading.Lock()
+            self._jobs = queue.Queue()
+            self._threads = []
+            self._stats.update(browsers_alive=0, busy=0)
+        with self._lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            for i in range(len(self._threads), self.size):
+                t = threading.Thread(target=self._worker, name=f"browser-pool-{i}", daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    def _bump(self, key: str, delta: int = 1):
+        with self._lock:
+            self._stats[key] += delta
+
+    def submit(self, fn) -> Future:
+        """Queue `fn(context)` to run on a pooled browser"""
+        self._ensure_started()
+        future = Future()
+        self._jobs.put((fn, future))
+        return future
+
+    def run(self, fn, timeout: float | None = BROWSER_JOB_TIMEOUT):
+        """
+        Run `fn(context)` on a pooled browser and wait for its result
+
+        Raises concurrent.futures.TimeoutError after `timeout` seconds; a
+        job still waiting in the queue is cancelled.
+        """
+        future = self.submit(fn)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def _worker(self):
+        try:
+            pw = sync_playwright().start()
+        except Exception as e:
+            print(f"[browser-pool] Playwright failed to start: {e}")
+            pw = None
+
+        browser = None
+        pages = 0
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            fn, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            if pw is None:
+                future.set_exception(RuntimeError("Playwright is not available"))
+                continue
+
+            try:
+                if browser is not None and (pages >= self.max_pages or not browser.is_connected()):
+                    if browser.is_connected():
+                        self._bump('recycled')
+                    else:
+                        self._bump('crashes')
+                    self._close_browser(browser)
+                    browser = None
+                if browser is None:
+                    browser = pw.chromium.launch(headless=self.headless)
+                    pages = 0
+                    self._bump('launches')
+                    self._bump('browsers_alive')
+            except Exception as e:
+                future.set_exception(e)
+                continue
+
+            context = None
+            self._bump('busy')
+            try:
+                context = browser.new_context(
+                    user_agent=HEADERS["User-Agent"],
+                    locale="en-US",
+                    viewport={"width": 1920, "height": 1080},
+                )
+                future.set_result(fn(context))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                if context is not None:
+                    try:
+                        context.close()
+                    except PWError:
+                        pass
+                pages += 1
+                self._bump('busy', -1)
+                self._bump('pages_served')
+
+        if browser is not None:
+            self._close_browser(browser)
+        if pw is not None:
+            pw.stop()
+
+    def _close_browser(self, browser):
+        try:
+            browser.close()
+        except PWError:
+            pass
+        self._bump('browsers_alive', -1)
+
+    def stats(self) -> dict:
+        """Pool size, queue depth and usage counters"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['size'] = self.size
+        stats['workers'] = sum(1 for t in self._threads if t.is_alive())
+        stats['queue_depth'] = self._jobs.qsize()
+        return stats
+
+    def shutdown(self, timeout: float = 10):
+        """Close all browsers and stop the worker threads"""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._jobs.put(None)
+        for t in threads:
+            t.join(timeout)
+
+
+_browser_pool = None
+_browser_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide browser pool, creating it on first use"""
+    global _browser_pool
+    with _browser_pool_lock:
+        if _browser_pool is None:
+            _browser_pool = BrowserPool()
+            atexit.register(_browser_pool.shutdown)
+        return _browser_pool
+
+
 def fetch_playwright(url: str) -> str | None:
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent=HEADERS["User-Agent"],
-            locale="en-US",
-            viewport={"width": 1920, "height": 1080},
-        )
+    def load(context):
         page = context.new_page()
         try:
             page.goto(url, wait_until="domcontentloaded", timeout=30000)
             page.wait_for_timeout(3000)
             html = page.content()
-            text = clean_text(html)
-            if len(text) < MIN_TEXT_LEN or is_bot_page(text):
-                return None
-            return text
         except PWTimeoutError:
             return None
-        finally:
-            browser.close()
+        text = clean_text(html)
+        if len(text) < MIN_TEXT_LEN or is_bot_page(text):
+            return None
+        return text
+
+    try:
+        return get_browser_pool().run(load)
+    except FutureTimeoutError:
+        print(f"[playwright] {url}: no result within {BROWSER_JOB_TIMEOUT}s")
+        return None
+    except Exception as e:
+        print(f"[playwright] {url}: {e}")
+        return None
+
+
+# =========================================================
+# LINK DISCOVERY (homepage footer links)
+# =========================================================
+
+def _base_domain(netloc: str) -> str:
+    host = netloc.lower().split(":")[0]
+    if host.startswith("www."):
+        host = host[4:]
+    labels = host.split(".")
+    # Keep three labels for country-code second levels like example.co.uk
+    if len(labels) > 2 and len(labels[-1]) == 2 and len(labels[-2]) <= 3:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def _score_link(text: str, href: str, policy_type: str) -> int:
+    """Score an anchor against the KEYWORDS table (multi-word phrases weigh more)"""
+    score = 0
+    for kw in KEYWORDS.get(policy_type, []):
+        weight = len(kw.split())
+        if kw in text:
+            score += 2 * weight
+        if any(form in href for form in (kw.replace(" ", "-"), kw.replace(" ", "_"), kw.replace(" ", ""))):
+            score += weight
+    return score
+
+
+def extract_policy_links(html: str, base_url: str) -> dict:
+    """
+    Extract same-site anchor links that look like policy pages.
+
+    Returns:
+        dict: policy_type -> list of absolute URLs, best match first
+    """
+    soup = BeautifulSoup(html or "", "html.parser")
+    site = _base_domain(urlparse(base_url).netloc)
+    ranked = {t: {} for t in KEYWORDS}
+
+    for position, a in enumerate(soup.find_all("a", href=True)):
+        href = a["href"].strip()
+        if not href or href.startswith(("#", "mailto:", "javascript:", "tel:")):
+            continue
+        url = urljoin(base_url, href).split("#")[0]
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or _base_domain(parsed.netloc) != site:
+            continue
+
+        text = a.get_text(" ", strip=True).lower()
+        if len(text) > LINK_TEXT_MAX_LEN:
+            continue
+        path = (parsed.path + "?" + parsed.query).lower()
+
+        for policy_type in KEYWORDS:
+            score = _score_link(text, path, policy_type)
+            if score and (url not in ranked[policy_type] or ranked[policy_type][url][0] < score):
+                # Higher score first; footer links sit late in the page, so prefer later anchors on ties
+                ranked[policy_type][url] = (score, position)
+
+    links = {}
+    for policy_type, candidates in ranked.items():
+        if candidates:
+            ordered = sorted(candidates.items(), key=lambda kv: (-kv[1][0], -kv[1][1]))
+            links[policy_type] = [url for url, _ in ordered[:LINK_CANDIDATES_PER_TYPE]]
+    return links
+
+
+def discover_policy_links(origin: str) -> dict:
+    """Fetch the homepage once and return ranked policy links per type"""
+    try:
+        r = get_http_client().get(origin, timeout=15)
+        if r.status_code != 200:
+            return {}
+        return extract_policy_links(r.text, str(getattr(r, "url", origin)))
+    except Exception:
+        return {}
+
+
+def common_path_candidates(origin: str, policy_types=None) -> dict:
+    """Brute-force candidate URLs from COMMON_PATHS"""
+    return {
+        t: [urljoin(origin, p) for p in paths]
+        for t, paths in COMMON_PATHS.items()
+        if policy_types is None or t in policy_types
+    }
+
+
+# =========================================================
+# STATS
+# =========================================================
+
+_stats_lock = threading.Lock()
+_discovery_stats = {
+    strategy: {'sites': 0, 'requests': 0, 'types_found': 0}
+    for strategy in ('link', 'brute_force')
+}
+
+
+_outcome_stats = {
+    'static_outcomes': {o: 0 for o in (OK, NOT_FOUND, BLOCKED, TOO_SHORT, JS_REQUIRED, HTTP_ERROR, NETWORK_ERROR,
+                                       NOT_HTML, TOO_LARGE, OFF_TOPIC)},
+    'browser_escalations': 0,
+    'browser_launches_avoided': 0,
+}
 
 
+def _record_outcome(outcome: str, escalated: bool | None = None):
+    with _stats_lock:
+        _outcome_stats['static_outcomes'][outcome] += 1
+        if escalated is True:
+            _outcome_stats['browser_escalations'] += 1
+        elif escalated is False:
+            _outcome_stats['browser_launches_avoided'] += 1
+
+
+class _RequestTally:
+    """Thread-safe per-site counts: requests made, bytes read and work avoided"""
+
+    def __init__(self):
+        self.count = 0
+        self.bytes_read = 0
+        self.bytes_avoided = 0
+        self.cpu_seconds_saved = 0.0
+        self.rejected_before_parse = 0
+        self._lock = threading.Lock()
+
+    def add(self, n: int = 1):
+        with self._lock:
+            self.count += n
+
+    def add_transfer(self, bytes_read: int, bytes_avoided: int = 0,
+                     cpu_seconds_saved: float = 0.0, rejected: bool = False):
+        with self._lock:
+            self.bytes_read += bytes_read
+            self.bytes_avoided += bytes_avoided
+            self.cpu_seconds_saved += cpu_seconds_saved
+            self.rejected_before_parse += int(rejected)
+
+    def transfer_summary(self) -> dict:
+        with self._lock:
+            return {
+                'requests': self.count,
+                'bytes_read': self.bytes_read,
+                'bytes_avoided': self.bytes_avoided,
+                'cpu_ms_saved': round(self.cpu_seconds_saved * 1000, 1),
+                'rejected_before_parse': self.rejected_before_parse,
+            }
+
+
+_transfer_stats = {
+    'pages_parsed': 0,
+    'bytes_parsed': 0,
+    'parse_cpu_seconds': 0.0,
+    'rejected_before_parse': 0,
+    'bytes_read': 0,
+    'bytes_avoided': 0,
+    'cpu_seconds_saved': 0.0,
+}
+_last_site_transfer = None  # transfer summary of the most recently fetched site
+
+
+def _record_parse(size: int, cpu_seconds: float):
+    with _stats_lock:
+        _transfer_stats['pages_parsed'] += 1
+        _transfer_stats['bytes_parsed'] += size
+        _transfer_stats['parse_cpu_seconds'] += cpu_seconds
+
+
+def _record_transfer(r: StreamedResponse, parsed: bool, tally: _RequestTally | None):
+    """
+    Count bytes read for one static response and, for 200 responses the
+    pre-filter rejected, estimate the download and parse work avoided
+    (full size from Content-Length when uncompressed, else the average
+    parsed page; parse cost from the measured CPU time per byte).
+    """
+    avoided = cpu_saved = 0
+    rejected = r.status_code == 200 and not parsed
+    with _stats_lock:
+        stats = _transfer_stats
+        stats['bytes_read'] += r.bytes_read
+        if rejected:
+            size = r.content_length if not r.headers.get("Content-Encoding") else None
+            if size is None and stats['pages_parsed']:
+                size = stats['bytes_parsed'] // stats['pages_parsed']
+            size = max(size or 0, r.bytes_read)
+            avoided = 0 if r.complete else size - r.bytes_read
+            if stats['bytes_parsed']:
+                cpu_saved = size * stats['parse_cpu_seconds'] / stats['bytes_parsed']
+            stats['rejected_before_parse'] += 1
+            stats['bytes_avoided'] += avoided
+            stats['cpu_seconds_saved'] += cpu_saved
+    if tally:
+        tally.add_transfer(r.bytes_read, avoided, cpu_saved, rejected)
+
+
+def _record_site_transfer(site: str, transfer: dict):
+    global _last_site_transfer
+    with _stats_lock:
+        _last_site_transfer = dict(transfer, site=site)
+
+
+def _record_strategy(strategy: str, requests_made: int, types_found: int):
+    with _stats_lock:
+        stats = _discovery_stats[strategy]
+        stats['sites'] += 1
+        stats['requests'] += requests_made
+        stats['types_found'] += types_found
+
+
+def get_fetcher_stats() -> dict:
+    """Runtime statistics for monitoring"""
+    pool = _browser_pool
+    client = _http_client
+    cache = _document_cache
+    with _stats_lock:
+        discovery = {k: dict(v) for k, v in _discovery_stats.items()}
+        outcomes = dict(_outcome_stats, static_outcomes=dict(_outcome_stats['static_outcomes']))
+        transfer = dict(_transfer_stats)
+        last_site = dict(_last_site_transfer) if _last_site_transfer else None
+    for stats in discovery.values():
+        stats['requests_per_site'] = round(stats['requests'] / stats['sites'], 2) if stats['sites'] else 0
+    return {
+        'browser_pool': pool.stats() if pool else {'size': BROWSER_POOL_SIZE, 'workers': 0},
+        'http_pool': client.stats() if client else {'requests': 0},
+        'discovery': discovery,
+        'tiers': outcomes,
+        'document_cache': cache.stats() if cache else {'enabled': DOC_CACHE_ENABLED},
+        'prefilter': dict(transfer, enabled=PREFILTER_ENABLED,
+                          parse_cpu_seconds=round(transfer['parse_cpu_seconds'], 3),
+                          cpu_seconds_saved=round(transfer['cpu_seconds_saved'], 3),
+                          last_site=last_site),
+    }
+
 
 # =========================================================
 # API FUNCTION (for app.py integration)
 # =========================================================
 
-def fetch_policy_for_url(site: str) -> dict:
+def probe_url(url: str, cancelled: threading.Event | None = None,
+              tally: _RequestTally | None = None, policy_type: str | None = None,
+              explicit: bool = False) -> str | None:
+    """
+    Fetch a candidate URL: static first, Playwright only when the static
+    outcome suggests JavaScript rendering is needed (see needs_browser).
+    With policy_type set, static pages that are clearly about something
+    else are rejected from their first chunk (see prefilter_head), unless
+    `explicit` marks the URL as the one the user supplied.
+    """
+    if tally:
+        tally.add()
+    result = fetch_static(url, policy_type, tally, explicit)
+    if result.outcome == OK:
+        _record_outcome(result.outcome)
+        return result.text
+
+    if (cancelled and cancelled.is_set()) or not needs_browser(result):
+        _record_outcome(result.outcome, escalated=False)
+        return None
+
+    _record_outcome(result.outcome, escalated=True)
+    if tally:
+        tally.add()
+    return fetch_playwright(url)
+
+
+def _is_explicit(url: str, explicit: frozenset) -> bool:
+    return url.rstrip("/") in explicit
+
+
+def _discover_sequential(candidates: dict, tally: _RequestTally,
+                         explicit: frozenset = frozenset()) -> dict:
+    found = {}
+    for policy_type, urls in candidates.items():
+        for url in urls:
+            text = probe_url(url, tally=tally, policy_type=policy_type,
+                             explicit=_is_explicit(url, explicit))
+            if text and contains_keywords(text, policy_type):
+                found[policy_type] = text
+                break
+    return found
+
+
+def _discover_concurrent(candidates: dict, deadline: float, tally: _RequestTally,
+                         explicit: frozenset = frozenset()) -> dict:
+    """
+    Probe all candidate URLs for every policy type in parallel.
+
+    A type is resolved as soon as its highest-priority valid URL is known
+    (i.e. every earlier candidate has failed), so the result is the same
+    as the sequential walk. Remaining probes for a resolved type are
+    cancelled, and everything is abandoned once the deadline passes.
+    """
+    if not candidates:
+        return {}
+
+    cancelled = {t: threading.Event() for t in candidates}
+    outcomes = {t: [None] * len(urls) for t, urls in candidates.items()}
+    futures = {t: [] for t in candidates}
+    found = {}
+
+    def probe(policy_type, url):
+        if cancelled[policy_type].is_set():
+            return None
+        text = probe_url(url, cancelled[policy_type], tally, policy_type, _is_explicit(url, explicit))
+        return text if text and contains_keywords(text, policy_type) else None
+
+    # Interleave submissions so every type gets its first candidates probed early
+    jobs = []
+    depth = max(len(urls) for urls in candidates.values())
+    for i in range(depth):
+        for policy_type, urls in candidates.items():
+            if i < len(urls):
+                jobs.append((policy_type, i, urls[i]))
+
+    executor = ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS)
+    pending = {}
+    try:
+        for policy_type, i, url in jobs:
+            future = executor.submit(probe, policy_type, url)
+            pending[future] = (policy_type, i)
+            futures[policy_type].append(future)
+
+        end = time.monotonic() + deadline
+        while pending and len(found) < len(candidates):
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                print(f"[deadline] gave up after {deadline}s")
+                break
+
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                policy_type, i = pending.pop(future)
+                if policy_type in found:
+                    continue
+                try:
+                    outcomes[policy_type][i] = future.result() or False
+                except Exception:
+                    outcomes[policy_type][i] = False
+
+                # Resolve in priority order: stop at the first unfinished probe
+                for text in outcomes[policy_type]:
+                    if text is None:
+                        break
+                    if text:
+                        found[policy_type] = text
+                        cancelled[policy_type].set()
+                        for f in futures[policy_type]:
+                            f.cancel()
+                        break
+    finally:
+        for event in cancelled.values():
+            event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return found
+
+
+def fetch_policy_for_url(site: str, concurrent: bool = True,
+                         deadline: float = SITE_DEADLINE) -> dict:
     """
     Fetch policies for a website and return text (for API use)
+
+    Policy links found on the homepage are probed first; COMMON_PATHS are
+    only brute-forced for types that no homepage link resolved. A candidate
+    equal to the URL given as `site` is never pre-filtered as off-topic.
     
     Args:
         site: Website URL (e.g., "github.com" or "https://github.com")
+        concurrent: Probe candidate URLs in parallel (default) instead of one by one
+        deadline: Overall time budget in seconds for concurrent discovery
     
     Returns:
         dict: {
@@ -253,18 +1306,44 @@ def fetch_policy_for_url(site: str) -> dict:
         'found_types': []
     }
 
-    for policy_type, paths in COMMON_PATHS.items():
-        for path in paths:
-            url = urljoin(origin, path)
-            
-            text = fetch_static(url)
-            if not text:
-                text = fetch_playwright(url)
+    started = time.monotonic()
+    explicit = frozenset([site.rstrip("/")])
 
-            if text and contains_keywords(text, policy_type):
-                result['policies'][policy_type] = text
-                result['found_types'].append(policy_type)
-                break
+    def discover(candidates, tally):
+        if concurrent:
+            remaining = max(deadline - (time.monotonic() - started), 0)
+            return _discover_concurrent(candidates, remaining, tally, explicit)
+        return _discover_sequential(candidates, tally, explicit)
+
+    # Stage 1: links from the homepage
+    link_tally = _RequestTally()
+    link_tally.add()
+    links = discover_policy_links(origin)
+    found = discover(links, link_tally)
+    found_by_links = len(found)
+    _record_strategy('link', link_tally.count, found_by_links)
+
+    # Stage 2: brute-force COMMON_PATHS for whatever is still missing
+    missing = [t for t in COMMON_PATHS if t not in found]
+    brute_tally = _RequestTally()
+    if missing:
+        found.update(discover(common_path_candidates(origin, missing), brute_tally))
+        _record_strategy('brute_force', brute_tally.count, len(found) - found_by_links)
+
+    link_transfer, brute_transfer = link_tally.transfer_summary(), brute_tally.transfer_summary()
+    transfer = {k: link_transfer[k] + brute_transfer[k] for k in link_transfer}
+    print(f"[discovery] {origin}: {link_tally.count} link-stage + "
+          f"{brute_tally.count} brute-force requests, found {len(found)} types")
+    print(f"[prefilter] {origin}: read {transfer['bytes_read'] // 1024} KB, "
+          f"{transfer['rejected_before_parse']} pages rejected before parsing, "
+          f"~{transfer['bytes_avoided'] // 1024} KB and ~{transfer['cpu_ms_saved']:.0f} ms CPU saved")
+    _record_site_transfer(parsed.netloc, transfer)
+
+    # Keep COMMON_PATHS ordering regardless of completion order
+    for policy_type in COMMON_PATHS:
+        if policy_type in found:
+            result['policies'][policy_type] = found[policy_type]
+            result['found_types'].append(policy_type)
 
     return result
 
@@ -280,29 +1359,45 @@ def main(site: str):
     parsed = urlparse(site)
     origin = f"{parsed.scheme}://{parsed.netloc}"
     domain = safe_domain(site)
+    explicit = frozenset([site.rstrip("/")])
 
     print(f"\nTarget: {origin}\n")
 
-    for policy_type, paths in COMMON_PATHS.items():
+    links = discover_policy_links(origin)
+    fallback = common_path_candidates(origin)
+    tally = _RequestTally()
+
+    for policy_type in COMMON_PATHS:
         print(f"\n[{policy_type.upper()}]")
         found = False
 
-        for path in paths:
-            url = urljoin(origin, path)
-            print(f"  → Trying {url}")
+        for stage in (links.get(policy_type, []), fallback[policy_type]):
+            for url in stage:
+                print(f"  → Trying {url}")
 
-            text = fetch_static(url)
-            if not text:
-                text = fetch_playwright(url)
+                text = probe_url(url, tally=tally, policy_type=policy_type,
+                                 explicit=_is_explicit(url, explicit))
 
-            if text and contains_keywords(text, policy_type):
-                save_file(domain, policy_type, text)
-                found = True
+                if text and contains_keywords(text, policy_type):
+                    save_file(domain, policy_type, text)
+                    found = True
+                    break
+            if found:
                 break
 
         if not found:
             print("  ✗ Not found or blocked")
 
+    cache = get_document_cache()
+    if cache:
+        stats = cache.stats()
+        print(f"\n[cache] {stats['revalidated']} pages unchanged (304), {stats['stores']} stored")
+
+    transfer = tally.transfer_summary()
+    print(f"[prefilter] read {transfer['bytes_read'] // 1024} KB, "
+          f"{transfer['rejected_before_parse']} pages rejected before parsing, "
+          f"~{transfer['bytes_avoided'] // 1024} KB and ~{transfer['cpu_ms_saved']:.0f} ms CPU saved")
+
     print("\nDone. Check ./policies directory.")
 
 
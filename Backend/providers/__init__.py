@@ -0,0 +1,43 @@
+"""
+LLM Provider Package
+Supports multiple summarization backends: Perplexity, Gemini and a local fake
+"""
+
+from .provider_interface import LLMProvider, OpenAICompatibleProvider
+
+__all__ = [
+    'LLMProvider',
+    'OpenAICompatibleProvider',
+    'get_provider'
+]
+
+
+def get_provider(provider_type='perplexity', **kwargs):
+    """
+    Factory function to get an LLM provider instance
+    
+    Args:
+        provider_type: Type of provider ('perplexity', 'gemini' or 'fake')
+        **kwargs: Additional arguments passed to provider constructor
+    
+    Returns:
+        LLMProvider instance
+    
+    Examples:
+        # Use Perplexity (default)
+        llm = get_provider('perplexity', api_key='pplx-...')
+        
+        # Use the local deterministic stand-in
+        llm = get_provider('fake', latency=0.2, error_rate=0.05)
+    """
+    if provider_type.lower() == 'perplexity':
+        from .perplexity_provider import PerplexityProvider
+        return PerplexityProvider(**kwargs)
+    elif provider_type.lower() == 'gemini':
+        from .gemini_provider import GeminiProvider
+        return GeminiProvider(**kwargs)
+    elif provider_type.lower() == 'fake':
+        from .fake_provider import FakeProvider
+        return FakeProvider(**kwargs)
+    else:
+        raise ValueError(f"Unknown LLM provider: {provider_type}")
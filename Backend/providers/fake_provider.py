@@ -0,0 +1,232 @@
+"""
+Fake Provider
+Deterministic local stand-in for load tests and offline development
+
+Usage (in-process):
+    LLM_PROVIDER=fake python app.py
+
+Usage (as an OpenAI-compatible HTTP server):
+    python -m providers.fake_provider --port 8001 --latency 0.5 --error-rate 0.05
+    LLM_PROVIDER=perplexity LLM_BASE_URL=http://localhost:8001 python app.py
+"""
+
+import re
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Dict, Iterator, List
+from .provider_interface import OpenAICompatibleProvider
+
+
+# Sentences containing these words are sorted into the matching summary section
+SECTION_KEYWORDS = [
+    ('🚫', 'CRITICAL ISSUES (Deal Breakers)', ('sell', 'sold', 'arbitration', 'waive', 'indefinitely', 'biometric')),
+    ('⚠️', 'CONCERNING PRACTICES (Think Twice)', ('third part', 'share', 'track', 'advertis', 'location', 'retain')),
+    ('✅', 'GOOD THINGS (Your Rights)', ('delete', 'opt out', 'opt-out', 'access', 'encrypt', 'request')),
+    ('ℹ️', 'STANDARD STUFF (Normal for Most Services)', ('cookie', 'age', 'law', 'update', 'contact')),
+]
+POINTS_PER_SECTION = 3
+
+
+class FakeAPIError(Exception):
+    """Injected API error carrying a status code and Retry-After header like real SDK errors"""
+    
+    def __init__(self, status_code: int, retry_after: float = None):
+        super().__init__(f"Fake provider error {status_code}")
+        self.status_code = status_code
+        headers = {'retry-after': str(retry_after)} if retry_after is not None else {}
+        self.response = SimpleNamespace(status_code=status_code, headers=headers)
+
+
+class FakeChatClient:
+    """
+    In-process client with the OpenAI `chat.completions.create` interface
+    
+    Output is derived deterministically from the input text. Each call waits
+    `latency` seconds plus the time to emit its tokens at `tokens_per_second`,
+    and fails with `error_status` at `error_rate` probability.
+    """
+    
+    def __init__(self, latency: float = 0.5, tokens_per_second: float = 200,
+                 error_rate: float = 0.0, error_status: int = 429, seed: int = 0):
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+    
+    def _should_fail(self) -> bool:
+        with self._lock:
+            self.calls += 1
+            fail = self._random.random() < self.error_rate
+            if fail:
+                self.errors += 1
+            return fail
+    
+    def create(self, model: str = 'fake', messages: List[Dict] = None, temperature: float = 0.0,
+               max_tokens: int = 1024, stream: bool = False, **kwargs):
+        if self._should_fail():
+            time.sleep(self.latency)
+            raise FakeAPIError(self.error_status, retry_after=1 if self.error_status == 429 else None)
+        
+        text = generate_fake_completion(messages or [], max_tokens)
+        words = re.findall(r'\S+\s*', text)
+        if stream:
+            return self._stream(model, words)
+        
+        time.sleep(self.latency + len(words) / self.tokens_per_second)
+        prompt_tokens = sum(len(m.get('content') or '') for m in messages or []) // 4
+        return SimpleNamespace(
+            model=model,
+            choices=[SimpleNamespace(index=0, finish_reason='stop',
+                                     message=SimpleNamespace(role='assistant', content=text))],
+            usage=SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=len(words),
+                                  total_tokens=prompt_tokens + len(words)),
+        )
+    
+    def _stream(self, model: str, words: List[str]) -> Iterator:
+        time.sleep(self.latency)
+        for word in words:
+            time.sleep(1 / self.tokens_per_second)
+            yield SimpleNamespace(
+                model=model,
+                choices=[SimpleNamespace(index=0, finish_reason=None,
+                                         delta=SimpleNamespace(role='assistant', content=word))],
+            )
+
+
+def generate_fake_completion(messages: List[Dict], max_tokens: int) -> str:
+    """Deterministic summary-shaped output for the given messages"""
+    text = ' '.join(m.get('content') or '' for m in messages if m.get('role') != 'system')
+    sentences = [s.strip() for s in re.split(r'(?<=[.!?])\s+', text) if 20 <= len(s.strip()) <= 200]
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()[:8]
+    
+    sections = []
+    for emoji, header, keywords in SECTION_KEYWORDS:
+        points = [s for s in sentences if any(k in s.lower() for k in keywords)][:POINTS_PER_SECTION]
+        if not points:
+            points = [f"No clear statement found about this (ref {digest})"]
+        sections.append((emoji, header, points))
+    
+    # Short-summary requests get a single emoji line of at most 50 words
+    if max_tokens <= 256:
+        words = ' '.join(f"{emoji} {points[0]}" for emoji, _, points in sections[:2]).split()
+        return ' '.join(words[:50])
+    
+    lines = ["# What You Need to Know", ""]
+    for emoji, header, points in sections:
+        lines.append(f"## {emoji} {header}")
+        lines.extend(f"{emoji} {p}" for p in points)
+        lines.append("")
+    return '\n'.join(lines)
+
+
+class FakeProvider(OpenAICompatibleProvider):
+    """Local deterministic stand-in with configurable latency, token rate and errors"""
+    
+    name = 'fake'
+    
+    def __init__(self, model: str = 'fake-summarizer', latency: float = 0.5,
+                 tokens_per_second: float = 200, error_rate: float = 0.0,
+                 error_status: int = 429, seed: int = 0, rate_limits: Dict = None):
+        """
+        Args:
+            model: Reported model name
+            latency: Seconds before the first token
+            tokens_per_second: Output token rate
+            error_rate: Probability (0-1) that a call fails
+            error_status: HTTP status of injected failures
+            seed: Random seed for error injection
+            rate_limits: Keyword arguments for RateLimitedClient
+        """
+        self.fake_client = FakeChatClient(latency, tokens_per_second, error_rate, error_status, seed)
+        super().__init__(self.fake_client, model, rate_limits)
+    
+    def stats(self) -> Dict:
+        stats = super().stats()
+        stats['fake_calls'] = self.fake_client.calls
+        stats['fake_errors'] = self.fake_client.errors
+        return stats
+
+
+def serve(host: str = '127.0.0.1', port: int = 8001, **client_kwargs):
+    """Serve FakeChatClient as an OpenAI-compatible /chat/completions endpoint"""
+    fake = FakeChatClient(**client_kwargs)
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if not self.path.rstrip('/').endswith('/chat/completions'):
+                self.send_error(404)
+                return
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+            try:
+                result = fake.create(**body)
+            except FakeAPIError as e:
+                self.send_response(e.status_code)
+                for name, value in e.response.headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.end_headers()
+                self.wfile.write(json.dumps({'error': {'message': str(e)}}).encode())
+                return
+            
+            if body.get('stream'):
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.end_headers()
+                for chunk in result:
+                    data = {'id': 'fake', 'object': 'chat.completion.chunk', 'model': chunk.model,
+                            'choices': [{'index': 0, 'finish_reason': None,
+                                         'delta': {'content': chunk.choices[0].delta.content}}]}
+                    self.wfile.write(f"data: {json.dumps(data)}\n\n".encode())
+                    self.wfile.flush()
+                self.wfile.write(b"data: [DONE]\n\n")
+                return
+            
+            data = {
+                'id': 'fake', 'object': 'chat.completion', 'created': int(time.time()), 'model': result.model,
+                'choices': [{'index': 0, 'finish_reason': 'stop',
+                             'message': {'role': 'assistant', 'content': result.choices[0].message.content}}],
+                'usage': vars(result.usage),
+            }
+            payload = json.dumps(data).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"🎭 Fake LLM server listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Fake OpenAI-compatible LLM server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8001)
+    parser.add_argument('--latency', type=float, default=0.5, help='Seconds before the first token')
+    parser.add_argument('--tokens-per-second', type=float, default=200)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Probability (0-1) of an injected error')
+    parser.add_argument('--error-status', type=int, default=429)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    serve(args.host, args.port, latency=args.latency, tokens_per_second=args.tokens_per_second,
+          error_rate=args.error_rate, error_status=args.error_status, seed=args.seed)
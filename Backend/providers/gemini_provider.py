@@ -0,0 +1,31 @@
+"""
+Gemini Provider
+Google Gemini through its OpenAI-compatible endpoint
+"""
+
+from openai import OpenAI
+from typing import Dict
+from .provider_interface import OpenAICompatibleProvider
+
+
+class GeminiProvider(OpenAICompatibleProvider):
+    """Summarization via Google Gemini"""
+    
+    name = 'gemini'
+    
+    def __init__(self, api_key: str, model: str = 'gemini-2.0-flash-exp',
+                 base_url: str = 'https://generativelanguage.googleapis.com/v1beta/openai/',
+                 rate_limits: Dict = None):
+        """
+        Args:
+            api_key: Gemini API key
+            model: Gemini model name
+            base_url: OpenAI-compatible Gemini endpoint
+            rate_limits: Keyword arguments for RateLimitedClient
+        """
+        client = OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=0  # Retries are handled by RateLimitedClient
+        )
+        super().__init__(client, model, rate_limits)
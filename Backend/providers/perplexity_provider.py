@@ -0,0 +1,30 @@
+"""
+Perplexity Provider
+Perplexity's OpenAI-compatible chat API
+"""
+
+from openai import OpenAI
+from typing import Dict
+from .provider_interface import OpenAICompatibleProvider
+
+
+class PerplexityProvider(OpenAICompatibleProvider):
+    """Summarization via Perplexity (sonar models)"""
+    
+    name = 'perplexity'
+    
+    def __init__(self, api_key: str, model: str = 'sonar',
+                 base_url: str = 'https://api.perplexity.ai', rate_limits: Dict = None):
+        """
+        Args:
+            api_key: Perplexity API key
+            model: Model name (default: sonar)
+            base_url: API base URL (override to point at a local fake server)
+            rate_limits: Keyword arguments for RateLimitedClient
+        """
+        client = OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=0  # Retries are handled by RateLimitedClient
+        )
+        super().__init__(client, model, rate_limits)
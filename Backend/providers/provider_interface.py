@@ -0,0 +1,80 @@
+"""
+LLM Provider Interface
+Provides abstraction for different summarization backends (Perplexity, Gemini, etc.)
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List
+
+from services.rate_limiter import RateLimitedClient
+
+
+class LLMProvider(ABC):
+    """Abstract base class for chat-completion providers"""
+    
+    name = 'base'
+    
+    @abstractmethod
+    def complete(self, messages: List[Dict], temperature: float, max_tokens: int) -> str:
+        """Return the completion text for a list of chat messages"""
+        pass
+    
+    @abstractmethod
+    def stream(self, messages: List[Dict], temperature: float, max_tokens: int) -> Iterator[str]:
+        """Yield completion text deltas as they are generated"""
+        pass
+    
+    def stats(self) -> Dict:
+        """Provider-specific statistics"""
+        return {'provider': self.name}
+
+
+class OpenAICompatibleProvider(LLMProvider):
+    """
+    Provider for any client exposing the OpenAI `chat.completions.create` API
+    
+    The client is wrapped in a RateLimitedClient when rate limits are given.
+    """
+    
+    def __init__(self, client, model: str, rate_limits: Dict = None):
+        """
+        Args:
+            client: OpenAI-compatible client
+            model: Model name sent with every request
+            rate_limits: Keyword arguments for RateLimitedClient (None = no limiting)
+        """
+        self.model = model
+        self.client = RateLimitedClient(client, **rate_limits) if rate_limits is not None else client
+    
+    def complete(self, messages: List[Dict], temperature: float, max_tokens: int) -> str:
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        return response.choices[0].message.content
+    
+    def stream(self, messages: List[Dict], temperature: float, max_tokens: int) -> Iterator[str]:
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            # Also runs when the consumer stops early (client disconnect)
+            close = getattr(stream, 'close', None)
+            if close is not None:
+                close()
+    
+    def stats(self) -> Dict:
+        stats = {'provider': self.name, 'model': self.model}
+        if isinstance(self.client, RateLimitedClient):
+            stats.update(self.client.stats())
+        return stats
@@ -0,0 +1,29 @@
+"""
+Services Package
+Supporting components for policy fetching and summarization
+"""
+
+from .document_cache import DocumentCache
+from .summary_cache import SummaryCache
+from .single_flight import SingleFlight
+from .job_queue import JobQueue
+from .metrics import LatencyStats, EndpointStats, StatsHistory
+from .chunked_summarizer import ChunkedSummarizer, chunk_text
+from .rate_limiter import RateLimitedClient, RateLimitTimeout, is_rate_limit_error
+from .text_condenser import TextCondenser
+
+__all__ = [
+    'DocumentCache',
+    'SummaryCache',
+    'SingleFlight',
+    'JobQueue',
+    'LatencyStats',
+    'EndpointStats',
+    'StatsHistory',
+    'ChunkedSummarizer',
+    'chunk_text',
+    'RateLimitedClient',
+    'RateLimitTimeout',
+    'is_rate_limit_error',
+    'TextCondenser',
+]
@@ -0,0 +1,120 @@
+"""
+Chunked Summarization
+Map-reduce over section-sized chunks so long policies are fully covered
+"""
+
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List
+
+
+# Blank lines and the "=== PRIVACY POLICY ===" headers added when policies are combined
+SECTION_BREAK = re.compile(r'\n\s*\n|\n(?==== [A-Z_ ]+ ===)')
+SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+(?=["“(\[]?[A-Z0-9])')
+
+
+def split_sections(text: str) -> List[str]:
+    """Split text on paragraph and policy boundaries"""
+    return [part.strip() for part in SECTION_BREAK.split(text or '') if part.strip()]
+
+
+def _split_long(section: str, max_chars: int) -> List[str]:
+    """Split an oversized section on sentence boundaries (hard cut as last resort)"""
+    pieces = []
+    current = ''
+    for sentence in SENTENCE_BREAK.split(section):
+        while len(sentence) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ''
+            pieces.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_text(text: str, max_chars: int) -> List[str]:
+    """
+    Pack sections into chunks of at most max_chars characters
+    
+    Sections are kept whole where possible; fetched pages that have lost
+    their line breaks fall back to sentence boundaries.
+    """
+    chunks = []
+    current = ''
+    for section in split_sections(text):
+        pieces = [section] if len(section) <= max_chars else _split_long(section, max_chars)
+        for piece in pieces:
+            if current and len(current) + 2 + len(piece) > max_chars:
+                chunks.append(current)
+                current = piece
+            else:
+                current = f"{current}\n\n{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class ChunkedSummarizer:
+    """
+    Condense arbitrarily long text with a parallel map step
+
+    `map_fn(chunk)` turns one chunk into short notes. Chunks are mapped
+    with bounded concurrency and the notes are joined; if the notes are
+    still too long they are condensed again. Notes are memoized by chunk
+    hash (with in-flight sharing), so the short and full summaries of the
+    same policy reuse one set of map calls.
+    """
+
+    def __init__(self, map_fn: Callable[[str], str], max_chars: int = 12000,
+                 max_workers: int = 4, memo_size: int = 512):
+        self.map_fn = map_fn
+        self.max_chars = max_chars
+        self.memo_size = memo_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='chunk-map')
+        self._lock = threading.Lock()
+        self._memo = OrderedDict()  # chunk hash -> Future of notes
+
+    def _map_chunk(self, chunk: str) -> Future:
+        key = hashlib.sha256(chunk.encode('utf-8')).hexdigest()
+        with self._lock:
+            future = self._memo.get(key)
+            if future is not None:
+                self._memo.move_to_end(key)
+                return future
+            future = self._executor.submit(self.map_fn, chunk)
+            self._memo[key] = future
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+        def forget_failure(f):
+            if f.exception() is not None:
+                with self._lock:
+                    if self._memo.get(key) is f:
+                        del self._memo[key]
+
+        future.add_done_callback(forget_failure)
+        return future
+
+    def notes(self, text: str) -> List[str]:
+        """Map every chunk of text to notes (in document order)"""
+        futures = [self._map_chunk(chunk) for chunk in chunk_text(text, self.max_chars)]
+        return [f.result() for f in futures]
+
+    def condense(self, text: str, target_chars: int) -> str:
+        """Reduce text to notes no longer than target_chars (best effort)"""
+        while len(text) > target_chars:
+            condensed = "\n\n".join(n.strip() for n in self.notes(text) if n and n.strip())
+            if len(condensed) >= len(text):
+                break  # No progress - stop rather than loop forever
+            text = condensed
+        return text
@@ -0,0 +1,152 @@
+"""
+Policy Document Cache
+On-disk store of fetched policy pages for conditional revalidation
+"""
+
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict
+
+
+class DocumentCache:
+    """
+    Size-bounded LRU store of cleaned policy text keyed by fetched URL
+
+    Each entry keeps the response validators (ETag / Last-Modified) so the
+    next fetch can send a conditional GET and skip downloading and
+    re-parsing the page when the server answers 304 Not Modified.
+
+    Entry format (one JSON file per URL):
+    - url: Fetched URL
+    - text: Cleaned policy text
+    - etag: ETag response header (if any)
+    - last_modified: Last-Modified response header (if any)
+    - fetched_at: When the body was last downloaded
+    - validated_at: When the entry was last confirmed by a 304
+    """
+
+    def __init__(self, directory='data/documents', max_bytes=100 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = OrderedDict()  # key -> file size, least recently used first
+        self._total_bytes = 0
+        self._stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        self._load_index()
+
+    def _load_index(self):
+        """Rebuild the LRU order from file modification times"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        files = sorted(self.directory.glob('*.json'), key=lambda p: p.stat().st_mtime)
+        for path in files:
+            size = path.stat().st_size
+            self._index[path.stem] = size
+            self._total_bytes += size
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()[:32]
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the cached entry for a URL (without revalidating it)"""
+        key = self._key(url)
+        with self._lock:
+            if key not in self._index:
+                self._stats['misses'] += 1
+                return None
+            try:
+                with open(self._path(key), 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                self._drop(key)
+                self._stats['misses'] += 1
+                return None
+            self._index.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry
+
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict:
+        """Request headers for revalidating a cached entry"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def mark_validated(self, url: str):
+        """Record a 304 response for a cached entry"""
+        key = self._key(url)
+        with self._lock:
+            if key not in self._index:
+                return
+            self._stats['revalidated'] += 1
+            self._index.move_to_end(key)
+            try:
+                os.utime(self._path(key))
+            except OSError:
+                pass
+
+    def put(self, url: str, text: str, etag: str = None, last_modified: str = None):
+        """Store a freshly downloaded page; pages without validators are not cached"""
+        if not (etag or last_modified):
+            return
+
+        key = self._key(url)
+        now = datetime.now().isoformat()
+        data = json.dumps({
+            'url': url,
+            'text': text,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': now,
+            'validated_at': now,
+        }, ensure_ascii=False).encode('utf-8')
+
+        with self._lock:
+            path = self._path(key)
+            tmp = path.with_suffix('.tmp')
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+
+            self._total_bytes += len(data) - self._index.pop(key, 0)
+            self._index[key] = len(data)
+            self._stats['stores'] += 1
+            self._evict()
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and len(self._index) > 1:
+            key = next(iter(self._index))
+            self._drop(key)
+            self._stats['evictions'] += 1
+
+    def _drop(self, key: str):
+        self._total_bytes -= self._index.pop(key, 0)
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def clear(self):
+        """Remove every cached document"""
+        with self._lock:
+            for key in list(self._index):
+                self._drop(key)
+
+    def stats(self) -> Dict:
+        """Hit/revalidation counters and current size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._index)
+            stats['size_kb'] = round(self._total_bytes / 1024, 1)
+            stats['max_size_kb'] = round(self.max_bytes / 1024, 1)
+        return stats
@@ -0,0 +1,319 @@
+"""
+Job Queue
+Durable background job execution with bounded concurrency
+"""
+
+import os
+import json
+import time
+import uuid
+import queue
+import socket
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional, Dict
+
+try:
+    import fcntl  # POSIX only; without it only threads of one process are coordinated
+except ImportError:
+    fcntl = None
+
+
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+
+
+class JobQueue:
+    """
+    Run jobs on a fixed pool of worker threads, persisting every job to disk
+
+    Each job is stored as one JSON file. Every unfinished job carries a
+    lease (lease_owner, lease_expires) held by the process that queued or
+    is running it, renewed in the background while the process is alive.
+    Leases are taken and renewed with a compare-and-set under a file lock,
+    so when several worker processes share the directory each job runs
+    once: a job is only taken over after its owner stopped renewing it,
+    i.e. after the process died with the job queued or running. Takeovers
+    and pruning of expired finished jobs run periodically, not only on
+    start.
+
+    Job format:
+    - id: Job UUID
+    - status: queued | running | completed | failed
+    - payload: Arguments passed to the handler
+    - result: Handler return value (once finished)
+    - error: Error message (if the handler raised)
+    - created_at / started_at / finished_at: ISO timestamps
+    - lease_owner / lease_expires: Process holding the unfinished job, and until when
+    """
+
+    def __init__(self, handler: Callable[[Dict], Dict], directory='data/jobs',
+                 workers: int = 2, retention_hours: int = 24, lease_seconds: float = 60,
+                 poll_interval: float = 0.5):
+        """
+        Args:
+            handler: Called with a job's payload; returns a JSON-serializable dict
+            directory: Where job files are stored
+            workers: Maximum number of jobs executed concurrently
+            retention_hours: Finished jobs older than this are removed
+            lease_seconds: How long an unfinished job stays with a process that stopped renewing it
+            poll_interval: Seconds between checks when waiting on a job held by another process
+        """
+        self.handler = handler
+        self.directory = Path(directory)
+        self.workers = workers
+        self.retention = timedelta(hours=retention_hours)
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._events = {}
+        self._finished_seen = {}  # file name -> mtime of finished jobs, so they are not re-read
+        self._stop = threading.Event()
+        self._stats = {'recovered': 0, 'pruned': 0, 'leases_lost': 0}
+        self._threads = []
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock_file = self.directory / '.lock'
+        self._maintain()
+        for i in range(workers):
+            t = threading.Thread(target=self._worker, name=f"job-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        t = threading.Thread(target=self._run_maintenance, name='job-leases', daemon=True)
+        t.start()
+        self._threads.append(t)
+
+    def _path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.json"
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive cross-process lock around every job file read-modify-write"""
+        if fcntl is None:
+            yield
+            return
+        with open(self._lock_file, 'a') as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _read(self, path: Path) -> Optional[Dict]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, job: Dict):
+        tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.directory,
+                                          prefix=f"{job['id']}.", suffix='.tmp', delete=False)
+        try:
+            with tmp:
+                json.dump(job, tmp, ensure_ascii=False)
+            os.replace(tmp.name, self._path(job['id']))
+        except BaseException:
+            try:
+                os.unlink(tmp.name)
+            except OSError:
+                pass
+            raise
+
+    def _lease_until(self) -> str:
+        return (datetime.now() + timedelta(seconds=self.lease_seconds)).isoformat()
+
+    def _lease_expired(self, job: Dict) -> bool:
+        expires = job.get('lease_expires')
+        return not expires or datetime.fromisoformat(expires) < datetime.now()
+
+    # ------------------------------------------------------------------
+    # Leases, recovery and pruning
+    # ------------------------------------------------------------------
+
+    def _run_maintenance(self):
+        while not self._stop.wait(self.lease_seconds / 3):
+            try:
+                self._maintain()
+            except Exception as e:
+                print(f"⚠️  Job lease maintenance failed: {e}")
+
+    def _maintain(self):
+        """Renew this process's leases, take over abandoned jobs and prune old finished ones"""
+        self._renew_leases()
+        self._recover()
+
+    def _renew_leases(self):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        if not jobs:
+            return
+        with self._file_lock():
+            for job in jobs:
+                stored = self._read(self._path(job['id']))
+                if stored is None or stored.get('lease_owner') != self.owner:
+                    continue  # finished meanwhile, or lost (reported when the job is written)
+                with self._lock:
+                    job['lease_expires'] = self._lease_until()
+                    self._write(job)
+
+    def _recover(self):
+        """Take over unfinished jobs whose lease expired and drop expired finished ones"""
+        now = time.time()
+        stale = now - self.lease_seconds  # a renewed lease rewrites the file, so fresh files are live
+        cutoff = datetime.now() - self.retention
+        recovered = []
+        for path in self.directory.glob('*.json'):
+            try:
+                mtime = path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if mtime > stale or self._finished_seen.get(path.name) == mtime:
+                if mtime < cutoff.timestamp():
+                    self._prune(path)
+                continue
+            with self._file_lock():
+                job = self._read(path)
+                if job is None:
+                    continue
+                if job['status'] in (QUEUED, RUNNING):
+                    if not self._lease_expired(job) or job['id'] in self._jobs:
+                        continue
+                    job.update(status=QUEUED, lease_owner=self.owner, lease_expires=self._lease_until())
+                    self._write(job)
+                elif datetime.fromisoformat(job.get('finished_at') or job['created_at']) < cutoff:
+                    self._prune(path)
+                    continue
+                else:
+                    self._finished_seen[path.name] = mtime
+                    continue
+            with self._lock:
+                self._jobs[job['id']] = job
+                self._events.setdefault(job['id'], threading.Event())
+            recovered.append(job)
+
+        for job in sorted(recovered, key=lambda j: j['created_at']):
+            self._queue.put(job['id'])
+        if recovered:
+            self._stats['recovered'] += len(recovered)
+            print(f"♻️  Re-queued {len(recovered)} abandoned job(s)")
+
+    def _prune(self, path: Path):
+        path.unlink(missing_ok=True)
+        self._finished_seen.pop(path.name, None)
+        self._stats['pruned'] += 1
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, payload: Dict) -> str:
+        """Persist and enqueue a job; returns its id"""
+        job = {
+            'id': str(uuid.uuid4()),
+            'status': QUEUED,
+            'payload': payload,
+            'result': None,
+            'error': None,
+            'created_at': datetime.now().isoformat(),
+            'started_at': None,
+            'finished_at': None,
+            'lease_owner': self.owner,
+            'lease_expires': self._lease_until(),
+        }
+        with self._lock:
+            self._write(job)
+            self._jobs[job['id']] = job
+            self._events[job['id']] = threading.Event()
+        self._queue.put(job['id'])
+        return job['id']
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Current state of a job (from memory, or disk for older jobs and other processes)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                return dict(job)
+        return self._read(self._path(job_id))
+
+    def wait(self, job_id: str, timeout: float) -> Optional[Dict]:
+        """Long-poll: block up to timeout seconds for a job to finish"""
+        with self._lock:
+            event = self._events.get(job_id)
+        if event is not None:
+            event.wait(timeout)
+            return self.get(job_id)
+
+        # Held by another worker process: poll its file
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            remaining = deadline - time.monotonic()
+            if job is None or job['status'] in (COMPLETED, FAILED) or remaining <= 0:
+                return job
+            time.sleep(min(self.poll_interval, remaining))
+
+    def _update(self, job: Dict, **changes) -> bool:
+        """Apply changes if this process still holds the job's lease"""
+        with self._file_lock():
+            stored = self._read(self._path(job['id']))
+            if stored is not None and stored.get('lease_owner') != self.owner:
+                self._stats['leases_lost'] += 1
+                print(f"⚠️  Job {job['id']} was taken over by {stored.get('lease_owner')}")
+                return False
+            with self._lock:
+                job.update(changes)
+                self._write(job)
+        return True
+
+    def _release(self, job_id: str):
+        with self._lock:
+            # Finished (or lost) jobs are served from disk from now on
+            self._jobs.pop(job_id, None)
+            event = self._events.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+    def _worker(self):
+        while True:
+            job_id = self._queue.get()
+            with self._lock:
+                job = self._jobs.get(job_id)
+            if job is None:
+                continue
+
+            if not self._update(job, status=RUNNING, started_at=datetime.now().isoformat(),
+                                lease_expires=self._lease_until()):
+                self._release(job_id)
+                continue
+            started = time.monotonic()
+            try:
+                result = self.handler(job['payload'])
+                self._update(job, status=COMPLETED, result=result, lease_owner=None,
+                             lease_expires=None, finished_at=datetime.now().isoformat())
+            except Exception as e:
+                print(f"❌ Job {job_id} failed: {e}")
+                self._update(job, status=FAILED, error=str(e), lease_owner=None,
+                             lease_expires=None, finished_at=datetime.now().isoformat())
+            print(f"📦 Job {job_id} {job['status']} in {time.monotonic() - started:.1f}s")
+            self._release(job_id)
+
+    def stats(self) -> Dict:
+        """Queue depth and worker counts"""
+        with self._lock:
+            running = sum(1 for j in self._jobs.values() if j['status'] == RUNNING)
+            unfinished = len(self._jobs)
+        return {
+            'workers': self.workers,
+            'running': running,
+            'queued': unfinished - running,
+            'queue_depth': self._queue.qsize(),
+            **self._stats,
+        }
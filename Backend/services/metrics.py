@@ -0,0 +1,187 @@
+"""
+Metrics
+Lightweight in-process counters for monitoring endpoints
+"""
+
+import os
+import json
+import threading
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+class LatencyStats:
+    """Running count / average / min / max of a latency in milliseconds"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = None
+        self.max_ms = None
+        self.last_ms = None
+
+    def record(self, ms: float):
+        with self._lock:
+            self.count += 1
+            self.total_ms += ms
+            self.last_ms = ms
+            self.min_ms = ms if self.min_ms is None else min(self.min_ms, ms)
+            self.max_ms = ms if self.max_ms is None else max(self.max_ms, ms)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                'count': self.count,
+                'avg_ms': round(self.total_ms / self.count, 1) if self.count else None,
+                'min_ms': round(self.min_ms, 1) if self.min_ms is not None else None,
+                'max_ms': round(self.max_ms, 1) if self.max_ms is not None else None,
+                'last_ms': round(self.last_ms, 1) if self.last_ms is not None else None,
+            }
+
+
+class EndpointStats:
+    """
+    Per-endpoint request, status, cache hit/miss and latency counters
+
+    Totals cover the life of the process; take_interval() returns what
+    happened since its previous call, for periodic history snapshots.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = {}    # endpoint -> counters
+        self._interval = {}  # endpoint -> counters since take_interval()
+
+    @staticmethod
+    def _empty() -> Dict:
+        return {'requests': 0, 'client_errors': 0, 'server_errors': 0,
+                'cache_hits': 0, 'cache_misses': 0, 'total_ms': 0.0, 'max_ms': 0.0}
+
+    def record(self, endpoint: str, status: int, ms: float, cache_hit: Optional[bool] = None):
+        """Count one request; cache_hit is None for endpoints that do not look up the cache"""
+        with self._lock:
+            for counters in (self._totals, self._interval):
+                c = counters.get(endpoint)
+                if c is None:
+                    c = counters[endpoint] = self._empty()
+                c['requests'] += 1
+                if 400 <= status < 500:
+                    c['client_errors'] += 1
+                elif status >= 500:
+                    c['server_errors'] += 1
+                if cache_hit is not None:
+                    c['cache_hits' if cache_hit else 'cache_misses'] += 1
+                c['total_ms'] += ms
+                c['max_ms'] = max(c['max_ms'], ms)
+
+    @staticmethod
+    def _report(counters: Dict) -> Dict:
+        report = {}
+        for endpoint, c in sorted(counters.items()):
+            c = dict(c)
+            lookups = c['cache_hits'] + c['cache_misses']
+            c['hit_ratio'] = round(c['cache_hits'] / lookups, 3) if lookups else None
+            c['avg_ms'] = round(c['total_ms'] / c['requests'], 1) if c['requests'] else None
+            c['max_ms'] = round(c['max_ms'], 1)
+            del c['total_ms']
+            report[endpoint] = c
+        return report
+
+    def snapshot(self) -> Dict:
+        """Totals per endpoint since the process started"""
+        with self._lock:
+            return self._report(self._totals)
+
+    def take_interval(self) -> Dict:
+        """Counters per endpoint since the previous call, then start a new interval"""
+        with self._lock:
+            interval, self._interval = self._interval, {}
+        return self._report(interval)
+
+
+class StatsHistory:
+    """
+    Appends a stats snapshot as one JSON line every interval_seconds
+
+    Each worker process writes its own lines (tagged with its pid) to the
+    shared file, so trend views can sum or compare workers. The file is cut
+    to its newest half once it grows past max_kb.
+    """
+
+    def __init__(self, storage_file: str, collect: Callable[[], Dict], interval_seconds: float = 300,
+                 max_kb: int = 1024):
+        """
+        Args:
+            storage_file: JSON-lines history file
+            collect: Returns the snapshot to store (called from the background thread)
+            interval_seconds: Time between snapshots
+            max_kb: Trim the file beyond this size
+        """
+        self.storage_file = Path(storage_file)
+        self.collect = collect
+        self.interval_seconds = interval_seconds
+        self.max_bytes = max_kb * 1024
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the background snapshot thread (once per process)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='stats-history', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background thread after its current wait"""
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.record()
+            except Exception as e:
+                print(f"⚠️  Could not record stats snapshot: {e}")
+
+    def record(self) -> Dict:
+        """Collect and append one snapshot now"""
+        entry = {'timestamp': datetime.now().isoformat(), 'pid': os.getpid(),
+                 'interval_seconds': self.interval_seconds}
+        entry.update(self.collect())
+        self.storage_file.parent.mkdir(parents=True, exist_ok=True)
+        if self.storage_file.exists() and self.storage_file.stat().st_size > self.max_bytes:
+            self._trim()
+        # One O_APPEND write per line, so lines from several workers never interleave
+        fd = os.open(self.storage_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+        try:
+            os.write(fd, (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8'))
+        finally:
+            os.close(fd)
+        return entry
+
+    def _trim(self):
+        """Keep the newest half of the file"""
+        with open(self.storage_file, 'rb') as f:
+            data = f.read()
+        keep = data[len(data) // 2:]
+        keep = keep[keep.find(b'\n') + 1:]
+        tmp = self.storage_file.with_name(f"{self.storage_file.name}.{os.getpid()}")
+        with open(tmp, 'wb') as f:
+            f.write(keep)
+        os.replace(tmp, self.storage_file)
+
+    def read(self, limit: int = 100, since: Optional[str] = None) -> List[Dict]:
+        """Newest `limit` snapshots (optionally only those after an ISO timestamp), oldest first"""
+        if not self.storage_file.exists():
+            return []
+        entries = deque(maxlen=limit)
+        with open(self.storage_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn line from a crash, or cut by _trim
+                if since is None or entry.get('timestamp', '') > since:
+                    entries.append(entry)
+        return list(entries)
@@ -0,0 +1,312 @@
+"""
+LLM Rate Limiting
+Client-side token buckets, adaptive concurrency and retries for LLM calls
+"""
+
+import time
+import random
+import threading
+from typing import Optional, Dict
+
+
+class RateLimitTimeout(Exception):
+    """Raised when a call waited longer than the queue timeout for capacity"""
+    pass
+
+
+def get_status_code(error: Exception) -> Optional[int]:
+    """HTTP status of an API error, if it carries one"""
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """True for HTTP 429 / rate limit errors"""
+    if get_status_code(error) == 429:
+        return True
+    return type(error).__name__ == 'RateLimitError' or isinstance(error, RateLimitTimeout)
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """Seconds requested by a Retry-After header, if present"""
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    value = headers.get('retry-after') or headers.get('Retry-After')
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `per_minute` units per minute"""
+
+    def __init__(self, per_minute: float, capacity: float = None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity or per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, amount: float = 1, timeout: float = None) -> float:
+        """Wait until `amount` units are available and take them; returns seconds waited"""
+        amount = min(amount, self.capacity)
+        started = time.monotonic()
+        with self._cond:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return time.monotonic() - started
+                wait = (amount - self.tokens) / self.rate
+                if timeout is not None:
+                    remaining = timeout - (time.monotonic() - started)
+                    if remaining <= 0:
+                        raise RateLimitTimeout("Timed out waiting for rate limit capacity")
+                    wait = min(wait, remaining)
+                self._cond.wait(wait)
+
+    def refund(self, amount: float):
+        """Return unused units (e.g. when actual usage was below the estimate)"""
+        if amount <= 0:
+            return
+        with self._cond:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + amount)
+            self._cond.notify_all()
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD concurrency limit
+
+    The limit grows by roughly one slot per limit's worth of fast successful
+    calls and is halved on a 429 or a call slower than the target latency.
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 16,
+                 target_latency: float = 30.0):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.in_flight = 0
+        self.waiting = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout: float = None):
+        started = time.monotonic()
+        with self._cond:
+            self.waiting += 1
+            try:
+                while self.in_flight >= int(self.limit):
+                    remaining = None if timeout is None else timeout - (time.monotonic() - started)
+                    if remaining is not None and remaining <= 0:
+                        raise RateLimitTimeout("Timed out waiting for a free LLM slot")
+                    self._cond.wait(remaining)
+                self.in_flight += 1
+            finally:
+                self.waiting -= 1
+
+    def release(self, latency: float = None, throttled: bool = False):
+        with self._cond:
+            self.in_flight -= 1
+            if throttled or (latency is not None and latency > self.target_latency):
+                self.limit = max(self.minimum, self.limit / 2)
+            elif latency is not None:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+
+class RateLimitedClient:
+    """
+    Drop-in wrapper around an OpenAI-compatible client
+
+    `client.chat.completions.create(...)` calls are queued until the request
+    and token buckets and the adaptive concurrency limit allow them, and are
+    retried with jittered exponential backoff (honoring Retry-After) on 429,
+    5xx and connection errors. Streaming calls hold their slot until the
+    stream is consumed.
+    """
+
+    def __init__(self, client, requests_per_minute: float = 50, tokens_per_minute: float = 0,
+                 max_concurrency: int = 8, min_concurrency: int = 1,
+                 target_latency: float = 30.0, max_retries: int = 4,
+                 base_backoff: float = 1.0, max_backoff: float = 60.0,
+                 queue_timeout: float = 120.0):
+        self._client = client
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.concurrency = AdaptiveConcurrency(
+            initial=max(min_concurrency, max_concurrency // 2),
+            minimum=min_concurrency,
+            maximum=max_concurrency,
+            target_latency=target_latency
+        )
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.queue_timeout = queue_timeout
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'succeeded': 0, 'failed': 0, 'retries': 0,
+                       'throttled': 0, 'queued_seconds': 0.0}
+        # Mirror the client's call path: client.chat.completions.create(...)
+        self.chat = _Namespace(completions=_Namespace(create=self.create))
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def _bump(self, key, amount=1):
+        with self._lock:
+            self._stats[key] += amount
+
+    @staticmethod
+    def estimate_tokens(kwargs) -> int:
+        """Rough token estimate: ~4 characters per prompt token plus the output budget"""
+        chars = sum(len(m.get('content') or '') for m in kwargs.get('messages', []))
+        return chars // 4 + int(kwargs.get('max_tokens') or 0)
+
+    def _is_retryable(self, error: Exception) -> bool:
+        status = get_status_code(error)
+        if status is not None:
+            return status == 429 or status >= 500
+        return type(error).__name__ in ('APIConnectionError', 'APITimeoutError')
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        retry_after = get_retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.base_backoff * 2 ** attempt))
+
+    def create(self, **kwargs):
+        """Rate-limited chat.completions.create"""
+        self._bump('calls')
+        estimate = self.estimate_tokens(kwargs)
+        attempt = 0
+        while True:
+            queued = 0.0
+            if self.requests:
+                queued += self.requests.acquire(1, timeout=self.queue_timeout)
+            if self.tokens:
+                queued += self.tokens.acquire(estimate, timeout=self.queue_timeout)
+            started = time.monotonic()
+            self.concurrency.acquire(timeout=self.queue_timeout)
+            queued += time.monotonic() - started
+            self._bump('queued_seconds', queued)
+
+            started = time.monotonic()
+            try:
+                response = self._client.chat.completions.create(**kwargs)
+            except Exception as e:
+                throttled = is_rate_limit_error(e)
+                self.concurrency.release(throttled=throttled)
+                if throttled:
+                    self._bump('throttled')
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    self._bump('failed')
+                    raise
+                delay = self._backoff(attempt, e)
+                print(f"⏳ LLM call failed ({e.__class__.__name__}), retrying in {delay:.1f}s")
+                self._bump('retries')
+                attempt += 1
+                time.sleep(delay)
+                continue
+
+            if kwargs.get('stream'):
+                return _SlotStream(self, response, started)
+
+            self.concurrency.release(latency=time.monotonic() - started)
+            self._bump('succeeded')
+            usage = getattr(response, 'usage', None)
+            if self.tokens and usage is not None and getattr(usage, 'total_tokens', None):
+                self.tokens.refund(estimate - usage.total_tokens)
+            return response
+
+    def stats(self) -> Dict:
+        """Call counters and current limits"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['queued_seconds'] = round(stats['queued_seconds'], 2)
+        stats['concurrency_limit'] = int(self.concurrency.limit)
+        stats['in_flight'] = self.concurrency.in_flight
+        stats['waiting'] = self.concurrency.waiting
+        return stats
+
+
+class _SlotStream:
+    """
+    Iterator over a streamed response that holds a concurrency slot
+
+    The slot is released exactly once: when the stream ends or fails, or
+    when it is closed (or garbage collected) before the end, e.g. after a
+    client disconnect. An early close counts as neither a success nor a
+    throttle, so it does not move the concurrency limit.
+    """
+
+    def __init__(self, owner: 'RateLimitedClient', stream, started: float):
+        self._owner = owner
+        self._stream = stream
+        self._iterator = iter(stream)
+        self._started = started
+        self._released = False
+        self._release_lock = threading.Lock()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._released:
+            raise StopIteration
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            if self._release(latency=time.monotonic() - self._started):
+                self._owner._bump('succeeded')
+            raise
+        except Exception as e:
+            if self._release(throttled=is_rate_limit_error(e)):
+                self._owner._bump('failed')
+            raise
+
+    def _release(self, **outcome) -> bool:
+        with self._release_lock:
+            if self._released:
+                return False
+            self._released = True
+        self._owner.concurrency.release(**outcome)
+        return True
+
+    def close(self):
+        """Stop reading the stream and give its slot back"""
+        try:
+            close = getattr(self._stream, 'close', None)
+            if close is not None:
+                close()
+        finally:
+            self._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        try:
+            self._release()
+        except Exception:
+            pass
+
+
+class _Namespace:
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
@@ -0,0 +1,110 @@
+"""
+Request Coalescing
+Single-flight execution so concurrent identical requests share one job
+"""
+
+import hashlib
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, Optional, Dict
+
+try:
+    import fcntl  # POSIX only; cross-process coalescing is disabled without it
+except ImportError:
+    fcntl = None
+
+
+class SingleFlight:
+    """
+    Run at most one job per key at a time
+
+    Within a process, callers that arrive while a job for the same key is
+    in flight wait for it and receive its result. With `lock_dir` set,
+    an exclusive lock file per key extends this across worker processes:
+    a process that had to wait for another one calls `recheck` first so it
+    can pick up the result that process stored instead of redoing the work.
+    """
+
+    def __init__(self, lock_dir: Optional[str] = None):
+        self.lock_dir = Path(lock_dir) if lock_dir and fcntl else None
+        if self.lock_dir:
+            self.lock_dir.mkdir(parents=True, exist_ok=True)
+        elif lock_dir:
+            print("⚠️  File locking unavailable - coalescing within this process only")
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stats = {'leaders': 0, 'followers': 0, 'cross_process_waits': 0, 'rechecked': 0}
+
+    def do(self, key: str, fn: Callable, recheck: Optional[Callable] = None):
+        """
+        Run fn() for key, or wait for the call already in flight
+        
+        Args:
+            key: Coalescing key (e.g. a normalized URL)
+            fn: Job to run; its result (or exception) is shared by all waiters
+            recheck: Called after waiting on another process; a non-None
+                     result is returned instead of running fn
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = Future()
+                self._calls[key] = call
+                self._stats['leaders'] += 1
+            else:
+                self._stats['followers'] += 1
+
+        if not leader:
+            return call.result()
+
+        try:
+            result = self._run(key, fn, recheck)
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def _run(self, key: str, fn: Callable, recheck: Optional[Callable]):
+        if self.lock_dir is None:
+            return fn()
+
+        path = self.lock_dir / f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.lock"
+        with open(path, 'a+') as f:
+            waited = False
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                waited = True
+                with self._lock:
+                    self._stats['cross_process_waits'] += 1
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                if waited and recheck is not None:
+                    result = recheck()
+                    if result is not None:
+                        with self._lock:
+                            self._stats['rechecked'] += 1
+                        return result
+                return fn()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def in_flight(self) -> int:
+        """Number of keys currently being processed"""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict:
+        """Leader/follower counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_flight'] = len(self._calls)
+        stats['cross_process'] = self.lock_dir is not None
+        return stats
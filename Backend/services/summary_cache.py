@@ -0,0 +1,235 @@
+"""
+Summary Cache
+Content-addressed store of LLM outputs keyed by input text and prompt settings
+"""
+
+import os
+import re
+import json
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict
+
+try:
+    import fcntl  # POSIX only; without it only threads of one process are coordinated
+except ImportError:
+    fcntl = None
+
+
+class SummaryCache:
+    """
+    LRU cache of LLM results keyed by a hash of the normalized input text
+    plus everything that affects the output (prompt, model, parameters)
+
+    Unchanged policies - and different domains sharing identical policy
+    text - reuse a prior summary instead of calling the LLM again.
+
+    Each put appends one JSON line to `<storage_file>.journal` under a
+    file lock, so worker processes add to the same cache instead of
+    overwriting each other. Entries written by other workers are read from
+    the journal on a miss. Once the journal holds more lines than
+    max_entries it is folded into the snapshot, written to a unique temp
+    file and renamed into place. A failed write is logged and counted but
+    never fails the caller.
+    """
+
+    def __init__(self, storage_file='data/summary_cache.json', max_entries=1000):
+        self.storage_file = Path(storage_file)
+        self.journal_file = self.storage_file.with_name(self.storage_file.name + '.journal')
+        self.lock_file = self.storage_file.with_name(self.storage_file.name + '.lock')
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'write_errors': 0}
+        self.entries = OrderedDict()
+        self._snapshot_id = None
+        self._journal_ino = None
+        self._journal_offset = 0
+        self._journal_lines = 0
+        try:
+            self._reload()
+        except OSError as e:
+            print(f"⚠️  Could not load summary cache: {e}")
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive cross-process lock around journal appends and compaction (caller holds self._lock)"""
+        self.storage_file.parent.mkdir(parents=True, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_file, 'a') as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _file_id(path: Path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _ino(path: Path) -> Optional[int]:
+        try:
+            return os.stat(path).st_ino
+        except FileNotFoundError:
+            return None
+
+    def _set(self, key: str, entry: Dict, replayed: bool = False):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            if not replayed:
+                self._stats['evictions'] += 1
+
+    def _reload(self):
+        """Load the snapshot (least recently used first) and replay the journal"""
+        self.entries = OrderedDict()
+        self._snapshot_id = self._file_id(self.storage_file)
+        if self._snapshot_id is not None:
+            try:
+                with open(self.storage_file, 'r', encoding='utf-8') as f:
+                    self.entries = OrderedDict(json.load(f))
+            except ValueError:
+                pass
+        self._journal_ino = self._ino(self.journal_file)
+        self._journal_offset = 0
+        self._journal_lines = 0
+        if self._journal_ino is not None:
+            self._replay()
+
+    def _replay(self):
+        """Apply complete journal lines past the last offset; a torn last line is left for later"""
+        with open(self.journal_file, 'rb') as f:
+            f.seek(self._journal_offset)
+            data = f.read()
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+                self._set(record.pop('key'), record, replayed=True)
+            except (ValueError, KeyError, AttributeError):
+                continue
+            self._journal_lines += 1
+        self._journal_offset += end
+
+    def _catch_up(self):
+        """Pick up entries other processes stored since the last read (caller holds self._lock)"""
+        if self._file_id(self.storage_file) != self._snapshot_id \
+                or self._ino(self.journal_file) != self._journal_ino:
+            self._reload()
+        elif self._journal_ino is not None:
+            self._replay()
+
+    def _append(self, key: str, entry: Dict):
+        """Append one entry to the journal (caller holds both locks, caught up)"""
+        line = json.dumps({'key': key, **entry}, ensure_ascii=False).encode('utf-8') + b'\n'
+        with open(self.journal_file, 'ab') as f:
+            f.write(line)
+            self._journal_ino = os.fstat(f.fileno()).st_ino
+            self._journal_offset = f.tell()
+        self._journal_lines += 1
+        if self._journal_lines > self.max_entries:
+            self._compact()
+
+    def _compact(self):
+        """Fold the journal into the snapshot (caller holds both locks, caught up)"""
+        tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.storage_file.parent,
+                                          prefix=self.storage_file.name + '.', suffix='.tmp', delete=False)
+        try:
+            with tmp:
+                json.dump(self.entries, tmp, ensure_ascii=False)
+            os.replace(tmp.name, self.storage_file)
+        except BaseException:
+            try:
+                os.unlink(tmp.name)
+            except OSError:
+                pass
+            raise
+        try:
+            os.unlink(self.journal_file)
+        except FileNotFoundError:
+            pass
+        self._snapshot_id = self._file_id(self.storage_file)
+        self._journal_ino = None
+        self._journal_offset = 0
+        self._journal_lines = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Collapse whitespace so formatting-only changes still hit"""
+        return re.sub(r'\s+', ' ', text or '').strip()
+
+    def make_key(self, text: str, **params) -> str:
+        """
+        Build a cache key from input text and generation settings
+
+        Args:
+            text: Input text sent to the LLM
+            **params: Prompt, model and sampling parameters
+        """
+        h = hashlib.sha256()
+        h.update(self.normalize_text(text).encode('utf-8'))
+        h.update(json.dumps(params, sort_keys=True, default=str).encode('utf-8'))
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached output for a key, or None"""
+        with self._lock:
+            if key not in self.entries:
+                try:
+                    self._catch_up()
+                except OSError:
+                    pass
+            entry = self.entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self.entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry['output']
+
+    def put(self, key: str, output: str):
+        """Store an LLM output; a failed write is logged, never raised"""
+        entry = {
+            'output': output,
+            'created_at': datetime.now().isoformat()
+        }
+        with self._lock:
+            self._stats['stores'] += 1
+            try:
+                with self._file_lock():
+                    self._catch_up()
+                    self._set(key, entry)
+                    self._append(key, entry)
+            except (OSError, ValueError) as e:
+                self._set(key, entry)  # still served from memory by this process
+                self._stats['write_errors'] += 1
+                print(f"⚠️  Summary cache write failed: {e}")
+
+    def stats(self) -> Dict:
+        """Hit/miss counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self.entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        return stats
@@ -0,0 +1,216 @@
+"""
+Text Condensing
+Strip page chrome and repeated paragraphs from policies before they reach the LLM
+"""
+
+import re
+import threading
+from typing import Dict, List, NamedTuple, Sequence, Set, Tuple
+
+from .chunked_summarizer import SENTENCE_BREAK
+
+
+# Whole-block UI labels: buttons, skip links, language pickers
+UI_LABEL = re.compile(
+    r'(skip to (main )?content|back to top|print( this page)?|share( this page)?|'
+    r'sign in|log ?in|sign up|subscribe|'
+    r'(accept|reject|allow|decline)( all)?( cookies)?|cookie (settings|preferences)|'
+    r'(manage|customi[sz]e|save) (your )?(cookie )?(preferences|settings|choices)|'
+    r'was this (page|article) helpful\??|select (a )?language)[.!:]?',
+    re.IGNORECASE
+)
+# Words that are UI labels only next to other chrome: on their own they are
+# content, e.g. the Yes/No column of a "categories sold" table
+AMBIGUOUS_LABEL = re.compile(r'(yes|no|english|menu|search|close)[.!:]?', re.IGNORECASE)
+# Footer lines and consent banners (only checked on short blocks)
+FOOTER_LINE = re.compile(r'^(©|\(c\)|copyright\b)|all rights reserved', re.IGNORECASE)
+CONSENT_BANNER = re.compile(
+    r'\bcookies?\b.*\b(by (clicking|continuing|using|browsing)|click(ing)? "?(accept|ok|agree))',
+    re.IGNORECASE
+)
+
+FOOTER_MAX_WORDS = 25
+BANNER_MAX_WORDS = 80
+# Split oversized blocks (pages that lost their line breaks) for dedupe
+MAX_BLOCK_CHARS = 1500
+
+WORD = re.compile(r'\w+')
+
+
+class CondenseReport(NamedTuple):
+    """Input size before and after condensing one request (~4 characters per token)"""
+    original_chars: int
+    condensed_chars: int
+    boilerplate_blocks: int
+    duplicate_blocks: int
+
+    @property
+    def original_tokens(self) -> int:
+        return self.original_chars // 4
+
+    @property
+    def condensed_tokens(self) -> int:
+        return self.condensed_chars // 4
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.original_tokens - self.condensed_tokens
+
+    def to_dict(self) -> Dict:
+        saved = self.saved_tokens
+        return {
+            'original_tokens': self.original_tokens,
+            'condensed_tokens': self.condensed_tokens,
+            'saved_tokens': saved,
+            'saved_percent': round(100.0 * saved / self.original_tokens, 1) if self.original_tokens else 0.0,
+            'boilerplate_blocks': self.boilerplate_blocks,
+            'duplicate_blocks': self.duplicate_blocks,
+        }
+
+
+def split_blocks(text: str) -> List[str]:
+    """Split text into line blocks, breaking oversized ones on sentence groups"""
+    blocks = []
+    for line in (text or '').splitlines():
+        line = line.strip()
+        if len(line) <= MAX_BLOCK_CHARS:
+            if line:
+                blocks.append(line)
+            continue
+        current = ''
+        for sentence in SENTENCE_BREAK.split(line):
+            if current and len(current) + 1 + len(sentence) > MAX_BLOCK_CHARS:
+                blocks.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        if current:
+            blocks.append(current)
+    return blocks
+
+
+def is_boilerplate(block: str) -> bool:
+    """True for UI labels, copyright footers and cookie consent banners"""
+    words = len(block.split())
+    if UI_LABEL.fullmatch(block.strip()):
+        return True
+    if words <= FOOTER_MAX_WORDS and FOOTER_LINE.search(block):
+        return True
+    return words <= BANNER_MAX_WORDS and bool(CONSENT_BANNER.search(block))
+
+
+def boilerplate_flags(blocks: Sequence[str]) -> List[bool]:
+    """
+    is_boilerplate for each block, plus ambiguous labels (Yes, No, Menu...)
+    that sit in a run of consecutive labels containing a definite one,
+    like "Was this page helpful? / Yes / No"
+    """
+    flags = [is_boilerplate(block) for block in blocks]
+    i = 0
+    while i < len(blocks):
+        j = i
+        while j < len(blocks) and (flags[j] or AMBIGUOUS_LABEL.fullmatch(blocks[j].strip())):
+            j += 1
+        if j > i + 1 and any(flags[i:j]):
+            flags[i:j] = [True] * (j - i)
+        i = max(j, i + 1)
+    return flags
+
+
+class TextCondenser:
+    """
+    Remove boilerplate and repeated text from fetched policies
+
+    Privacy, terms and cookie pages from one site share the same navbar,
+    footer and often whole paragraphs. Blocks are dropped when they are
+    UI chrome (labels, copyright lines, consent banners) or when most of
+    their word shingles already appeared earlier in the combined input
+    (repeated paragraphs across policies). First occurrences and blocks
+    shorter than one shingle (headings, list items) are always kept.
+    Navigation and footer elements are removed earlier, at the HTML level,
+    by clean_text in policy_fetcher_safe.
+    """
+
+    def __init__(self, shingle_words: int = 5, similarity: float = 0.7):
+        self.shingle_words = shingle_words
+        self.similarity = similarity
+        self._lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'original_tokens': 0,
+            'condensed_tokens': 0,
+            'boilerplate_blocks': 0,
+            'duplicate_blocks': 0,
+        }
+
+    def _shingles(self, words: List[str]) -> Set[int]:
+        """Hashed word n-grams (only compared within one process)"""
+        n = self.shingle_words
+        return {hash(tuple(words[i:i + n])) for i in range(len(words) - n + 1)}
+
+    def condense(self, documents: Sequence[Tuple[str, str]]) -> Tuple[str, CondenseReport]:
+        """
+        Condense documents into one text
+
+        Args:
+            documents: (header, text) pairs in priority order; the header
+                (e.g. "=== PRIVACY POLICY ===") is emitted as-is and may be empty
+
+        Returns:
+            (condensed text, CondenseReport)
+        """
+        seen_exact = set()
+        seen_shingles: Set[int] = set()
+        boilerplate = duplicates = 0
+        original_chars = 0
+        parts = []
+
+        for header, text in documents:
+            original_chars += len(header) + len(text or '')
+            kept = []
+            blocks = split_blocks(text)
+            for block, chrome in zip(blocks, boilerplate_flags(blocks)):
+                if chrome:
+                    boilerplate += 1
+                    continue
+                words = WORD.findall(block.lower())
+                if len(words) < self.shingle_words:
+                    # Headings and list items stay; they are cheap and give structure
+                    kept.append(block)
+                    continue
+                key = ' '.join(words)
+                if key in seen_exact:
+                    duplicates += 1
+                    continue
+                shingles = self._shingles(words)
+                if len(shingles & seen_shingles) >= self.similarity * len(shingles):
+                    duplicates += 1
+                    continue
+                seen_exact.add(key)
+                seen_shingles |= shingles
+                kept.append(block)
+
+            if kept:
+                parts.append('\n\n'.join(([header] if header else []) + kept))
+
+        condensed = '\n\n'.join(parts)
+        report = CondenseReport(original_chars, len(condensed), boilerplate, duplicates)
+        with self._lock:
+            self._stats['requests'] += 1
+            self._stats['original_tokens'] += report.original_tokens
+            self._stats['condensed_tokens'] += report.condensed_tokens
+            self._stats['boilerplate_blocks'] += boilerplate
+            self._stats['duplicate_blocks'] += duplicates
+        return condensed, report
+
+    def condense_text(self, text: str) -> Tuple[str, CondenseReport]:
+        """Condense a single document"""
+        return self.condense([('', text)])
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        saved = stats['original_tokens'] - stats['condensed_tokens']
+        stats['saved_tokens'] = saved
+        stats['saved_percent'] = round(100.0 * saved / stats['original_tokens'], 1) if stats['original_tokens'] else 0.0
+        return stats
@@ -4,6 +4,10 @@ Creates the necessary DynamoDB table for NakedPolicy caching system
 
 Usage:
     python setup_dynamodb.py
+    python setup_dynamodb.py --add-recent-index   # upgrade an existing table
+    python setup_dynamodb.py --migrate-url-keys   # move old items to URL-derived keys
+    python setup_dynamodb.py --recount-stats      # (re)build the summary counter
+    python setup_dynamodb.py --enable-ttl         # expire old items with DynamoDB TTL
 
 Requirements:
     - AWS credentials configured in .env file or AWS CLI
@@ -12,6 +16,8 @@ Requirements:
 
 import boto3
 import os
+import sys
+from datetime import datetime
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -23,8 +29,9 @@ def create_dynamodb_table():
     Create DynamoDB table with proper schema for NakedPolicy
     
     Table Schema:
-    - Primary Key: summary_id (String)
-    - GSI: url_hash-index for URL lookups
+    - Primary Key: summary_id (String), derived from the URL hash
+    - GSI: url_hash-index for URL lookups of pre-URL-key items
+    - GSI: recent-index (recent_bucket + timestamp) for newest-first listing
     """
     
     # Get configuration from environment
@@ -86,6 +93,14 @@ def create_dynamodb_table():
                 {
                     'AttributeName': 'url_hash',
                     'AttributeType': 'S'  # String
+                },
+                {
+                    'AttributeName': 'recent_bucket',
+                    'AttributeType': 'S'  # String ('YYYY-MM')
+                },
+                {
+                    'AttributeName': 'timestamp',
+                    'AttributeType': 'S'  # String (ISO)
                 }
             ],
             GlobalSecondaryIndexes=[
@@ -104,6 +119,26 @@ def create_dynamodb_table():
                         'ReadCapacityUnits': 5,
                         'WriteCapacityUnits': 5
                     }
+                },
+                {
+                    'IndexName': 'recent-index',
+                    'KeySchema': [
+                        {
+                            'AttributeName': 'recent_bucket',
+                            'KeyType': 'HASH'
+                        },
+                        {
+                            'AttributeName': 'timestamp',
+                            'KeyType': 'RANGE'
+                        }
+                    ],
+                    'Projection': {
+                        'ProjectionType': 'ALL'
+                    },
+                    'ProvisionedThroughput': {
+                        'ReadCapacityUnits': 5,
+                        'WriteCapacityUnits': 5
+                    }
                 }
             ],
             ProvisionedThroughput={
@@ -114,13 +149,21 @@ def create_dynamodb_table():
         
         print(f"\n⏳ Waiting for table to be created...")
         table.wait_until_exists()
+        # Summary counter, and the oldest month /recent has to look back to
+        table.put_item(Item={'summary_id': 'stats#summaries', 'total_summaries': 0,
+                             'oldest_bucket': datetime.now().strftime('%Y-%m')})
+        dynamodb.meta.client.update_time_to_live(
+            TableName=table_name,
+            TimeToLiveSpecification={'Enabled': True, 'AttributeName': 'expires_at'}
+        )
         
         print(f"\n✅ SUCCESS! DynamoDB table created successfully!")
         print(f"\n📋 Table Details:")
         print(f"   Name: {table_name}")
         print(f"   Region: {region_name}")
         print(f"   Primary Key: summary_id")
-        print(f"   GSI: url_hash-index")
+        print(f"   GSI: url_hash-index, recent-index")
+        print(f"   TTL: expires_at")
         print(f"   Status: {table.table_status}")
         
         print(f"\n🎉 You can now use DynamoDB caching!")
@@ -188,6 +231,76 @@ if __name__ == '__main__':
             print("❌ Setup cancelled.")
             exit(1)
     
+    if '--add-recent-index' in sys.argv:
+        from database.dynamodb_adapter import add_recent_index
+        session_params = {}
+        if os.environ.get("AWS_ACCESS_KEY_ID") and os.environ.get("AWS_SECRET_ACCESS_KEY"):
+            session_params['aws_access_key_id'] = os.environ["AWS_ACCESS_KEY_ID"]
+            session_params['aws_secret_access_key'] = os.environ["AWS_SECRET_ACCESS_KEY"]
+        try:
+            add_recent_index(
+                table_name=os.environ.get("DYNAMODB_TABLE_NAME", "naked-policy-summaries"),
+                region_name=os.environ.get("DYNAMODB_REGION", "us-east-1"),
+                **session_params
+            )
+        except Exception as e:
+            print(f"\n❌ Upgrade failed: {e}")
+            exit(1)
+        exit(0)
+    
+    if '--enable-ttl' in sys.argv:
+        from database.dynamodb_adapter import enable_ttl
+        session_params = {}
+        if os.environ.get("AWS_ACCESS_KEY_ID") and os.environ.get("AWS_SECRET_ACCESS_KEY"):
+            session_params['aws_access_key_id'] = os.environ["AWS_ACCESS_KEY_ID"]
+            session_params['aws_secret_access_key'] = os.environ["AWS_SECRET_ACCESS_KEY"]
+        try:
+            enable_ttl(
+                table_name=os.environ.get("DYNAMODB_TABLE_NAME", "naked-policy-summaries"),
+                region_name=os.environ.get("DYNAMODB_REGION", "us-east-1"),
+                ttl_days=int(os.environ.get("CACHE_EXPIRY_DAYS", 30)),
+                **session_params
+            )
+        except Exception as e:
+            print(f"\n❌ Enabling TTL failed: {e}")
+            exit(1)
+        exit(0)
+    
+    if '--recount-stats' in sys.argv:
+        from database.dynamodb_adapter import DynamoDBAdapter
+        try:
+            adapter = DynamoDBAdapter(
+                table_name=os.environ.get("DYNAMODB_TABLE_NAME", "naked-policy-summaries"),
+                region_name=os.environ.get("DYNAMODB_REGION", "us-east-1"),
+                aws_access_key_id=os.environ.get("AWS_ACCESS_KEY_ID"),
+                aws_secret_access_key=os.environ.get("AWS_SECRET_ACCESS_KEY")
+            )
+            print(f"\n🔢 Counting summaries (full table scan)...")
+            print(f"✅ Summary counter set to {adapter.recount_summaries()}")
+        except Exception as e:
+            print(f"\n❌ Recount failed: {e}")
+            exit(1)
+        exit(0)
+    
+    if '--migrate-url-keys' in sys.argv:
+        from database.dynamodb_adapter import DynamoDBAdapter
+        try:
+            adapter = DynamoDBAdapter(
+                table_name=os.environ.get("DYNAMODB_TABLE_NAME", "naked-policy-summaries"),
+                region_name=os.environ.get("DYNAMODB_REGION", "us-east-1"),
+                aws_access_key_id=os.environ.get("AWS_ACCESS_KEY_ID"),
+                aws_secret_access_key=os.environ.get("AWS_SECRET_ACCESS_KEY")
+            )
+            print(f"\n🔧 Moving summaries to URL-derived keys...")
+            counts = adapter.migrate_to_url_keys()
+            print(f"✅ Migrated {counts['migrated']} summaries "
+                  f"({counts['superseded']} already re-saved, {counts['skipped']} already on URL keys)")
+            print(f"\n📝 Old summary ids keep working. You can now set DYNAMODB_LEGACY_URL_LOOKUP=false")
+        except Exception as e:
+            print(f"\n❌ Migration failed: {e}")
+            exit(1)
+        exit(0)
+    
     try:
         create_dynamodb_table()
         print("\n" + "=" * 60)